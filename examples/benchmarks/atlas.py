@@ -0,0 +1,39 @@
+from __future__ import print_function
+
+import random
+import time
+
+from sfml import sf
+
+
+N = 10000
+
+# textures need an OpenGL context
+window = sf.RenderWindow(sf.VideoMode(64, 64), "Atlas benchmark")
+
+random.seed(1)
+icons = [("icon{0}".format(i), sf.Image.create(random.randint(8, 40), random.randint(8, 40), sf.Color.WHITE))
+         for i in range(N)]
+
+atlas = sf.TextureAtlas()
+
+start = time.time()
+atlas.add_many(icons)
+elapsed = time.time() - start
+print("packed {0} icons in {1:.1f} ms on {2} page(s), occupancy {3}".format(
+    N, elapsed * 1000, atlas.page_count, ["{0:.2f}".format(o) for o in atlas.occupancy]))
+
+start = time.time()
+atlas.update()
+print("uploaded in {0:.1f} ms".format((time.time() - start) * 1000))
+
+# incremental insertion
+start = time.time()
+for i in range(100):
+    atlas.add("late{0}".format(i), sf.Image.create(24, 24, sf.Color.RED))
+print("100 incremental insertions in {0:.1f} ms".format((time.time() - start) * 1000))
+
+texture, rectangle = atlas.get("icon42")
+sprite = sf.Sprite(texture, rectangle)
+
+window.close()
@@ -0,0 +1,59 @@
+from __future__ import print_function
+
+import threading
+import time
+
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+
+from sfml import sf
+
+
+N = 400
+BODY = b"x" * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        # simulate a bit of server-side latency
+        time.sleep(0.005)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+server = Server(("127.0.0.1", 0), Handler)
+port = server.server_address[1]
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+# one Http object, one request at a time
+http = sf.Http(b"127.0.0.1", port)
+start = time.time()
+for i in range(N):
+    http.send_request(sf.HttpRequest(b"/"))
+elapsed = time.time() - start
+print("{0:<24} {1:8.1f} requests/s".format("Http (sequential)", N / elapsed))
+
+# concurrent requests through the pool
+for workers in (4, 16):
+    with sf.HttpPool(workers) as pool:
+        start = time.time()
+        futures = [pool.get(b"127.0.0.1", b"/", port) for i in range(N)]
+        for future in futures:
+            assert future.result().status == sf.HttpResponse.OK
+        elapsed = time.time() - start
+    print("{0:<24} {1:8.1f} requests/s".format("HttpPool ({0} workers)".format(workers), N / elapsed))
+
+server.shutdown()
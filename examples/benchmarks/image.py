@@ -0,0 +1,49 @@
+from __future__ import print_function
+
+import time
+
+from sfml import sf
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+SIZE = 2048
+
+
+def measure(name, function, *args):
+    start = time.time()
+    function(*args)
+    print("{0:<32} {1:8.1f} ms".format(name, (time.time() - start) * 1000))
+
+
+def per_pixel(image):
+    # only a quarter of the image, the full one takes far too long
+    color = sf.Color(255, 128, 0)
+    for y in range(SIZE // 2):
+        for x in range(SIZE // 2):
+            image[x, y] = color
+
+
+def with_numpy(image):
+    pixels = numpy.asarray(image)
+    x = numpy.arange(SIZE, dtype=numpy.uint32)
+    pixels[:, :, 0] = x[None, :] & 0xff
+    pixels[:, :, 1] = x[:, None] & 0xff
+    pixels[:, :, 2] = (x[None, :] ^ x[:, None]) & 0xff
+    pixels[:, :, 3] = 255
+
+
+image = sf.Image.create(SIZE, SIZE)
+
+measure("__setitem__ (1024x1024)", per_pixel, image)
+if numpy:
+    measure("numpy view", with_numpy, image)
+measure("fill_rect", image.fill_rect, (0, 0, SIZE, SIZE), sf.Color(10, 20, 30, 128))
+measure("premultiply_alpha", image.premultiply_alpha)
+measure("unpremultiply_alpha", image.unpremultiply_alpha)
+measure("mask_colors (64 colors)", image.mask_colors, [sf.Color(i, i, i) for i in range(64)])
+measure("swizzle", image.swizzle, "bgra")
+measure("apply_gamma", image.apply_gamma, 2.2)
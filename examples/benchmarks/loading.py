@@ -0,0 +1,47 @@
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import time
+
+from sfml import sf
+
+
+N = 200
+SIZE = 512
+
+# write a level's worth of PNGs to load back
+directory = tempfile.mkdtemp()
+image = sf.Image.create(SIZE, SIZE)
+for y in range(0, SIZE, 16):
+    image.fill_rect((0, y, SIZE, 8), sf.Color(y % 256, 255 - y % 256, 128))
+
+filenames = []
+for i in range(N):
+    filename = os.path.join(directory, "{0}.png".format(i))
+    image.to_file(filename)
+    filenames.append(filename)
+
+# textures need an OpenGL context
+window = sf.RenderWindow(sf.VideoMode(64, 64), "Loading benchmark")
+
+start = time.time()
+textures = [sf.Texture.from_file(filename) for filename in filenames]
+serial = time.time() - start
+print("{0:<28} {1:8.1f} ms".format("serial Texture.from_file", serial * 1000))
+
+start = time.time()
+images = sf.load_images(filenames, workers=8)
+textures = [sf.Texture.from_image(image) for image in images]
+print("{0:<28} {1:8.1f} ms".format("load_images (8 workers)", (time.time() - start) * 1000))
+
+start = time.time()
+with sf.AssetLoader(8) as loader:
+    futures = [loader.load_texture(filename) for filename in filenames]
+    loader.wait()
+    textures = [future.result() for future in futures]
+print("{0:<28} {1:8.1f} ms".format("AssetLoader (8 workers)", (time.time() - start) * 1000))
+
+window.close()
+shutil.rmtree(directory)
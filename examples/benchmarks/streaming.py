@@ -0,0 +1,42 @@
+from __future__ import print_function
+
+import time
+
+from sfml import sf
+
+
+SIZE = 1024
+FRAMES = 200
+
+# an offscreen target is enough, this also runs under Mesa's software
+# renderer without a display
+target = sf.RenderTexture(SIZE, SIZE)
+
+pixels = bytearray(SIZE * SIZE * 4)
+texture = sf.Texture.create(SIZE, SIZE)
+
+start = time.time()
+for frame in range(FRAMES):
+    texture.update_from_pixels(pixels)
+    target.draw(sf.Sprite(texture))
+    target.display()
+print("{0:<36} {1:8.2f} ms/frame".format("update_from_pixels (whole texture)", (time.time() - start) * 1000 / FRAMES))
+
+for double_buffered in (False, True):
+    streaming = sf.StreamingTexture(SIZE, SIZE, double_buffered)
+    streaming.flush()
+    marker = sf.Image.create(64, 64, sf.Color.RED)
+    sprite = sf.Sprite(streaming.texture)
+
+    start = time.time()
+    for frame in range(FRAMES):
+        # a moving 64x64 marker, as on a minimap
+        x = (frame * 5) % (SIZE - 64)
+        streaming.blit(marker, (x, 100))
+        streaming.flush()
+        sprite.texture = streaming.texture
+        target.draw(sprite)
+        target.display()
+
+    name = "StreamingTexture ({0})".format("double buffered" if double_buffered else "single")
+    print("{0:<36} {1:8.2f} ms/frame, {2} bytes uploaded".format(name, (time.time() - start) * 1000 / FRAMES, streaming.uploaded_bytes))
@@ -0,0 +1,43 @@
+from __future__ import print_function
+
+import os
+import time
+
+from sfml import sf
+
+
+N = 500
+FRAMES = 100
+
+font = sf.Font.from_file(os.path.join(os.path.dirname(__file__), "..", "pong", "data", "sansation.ttf"))
+target = sf.RenderTexture(1024, 1024)
+
+# one Text per label, one draw call each
+texts = []
+for i in range(N):
+    text = sf.Text("label {0}".format(i % 50), font, 14)
+    text.position = ((i % 10) * 100, (i // 10) * 20)
+    texts.append(text)
+
+start = time.time()
+for frame in range(FRAMES):
+    for i, text in enumerate(texts):
+        # a tenth of the labels change every frame
+        if i % 10 == frame % 10:
+            text.string = "label {0}".format((i + frame) % 50)
+        target.draw(text)
+    target.display()
+print("{0:<12} {1:8.2f} ms/frame".format("Text", (time.time() - start) * 1000 / FRAMES))
+
+batch = sf.TextBatch(font, 14)
+for i in range(N):
+    batch.add("label {0}".format(i % 50), ((i % 10) * 100, (i // 10) * 20))
+
+start = time.time()
+for frame in range(FRAMES):
+    for i in range(frame % 10, N, 10):
+        batch.set_string(i, "label {0}".format((i + frame) % 50))
+    target.draw(batch)
+    target.display()
+print("{0:<12} {1:8.2f} ms/frame (cache hits {2}, misses {3})".format(
+    "TextBatch", (time.time() - start) * 1000 / FRAMES, batch.cache_hits, batch.cache_misses))
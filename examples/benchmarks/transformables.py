@@ -0,0 +1,56 @@
+from __future__ import print_function
+
+import time
+
+import numpy
+
+from sfml import sf
+
+
+COUNT = 50000
+FRAMES = 20
+
+positions = numpy.random.rand(COUNT, 2).astype(numpy.float32) * 800
+velocities = numpy.random.rand(COUNT, 2).astype(numpy.float32) - 0.5
+
+# one Transformable per entity
+transformables = [sf.Transformable() for i in range(COUNT)]
+
+start = time.time()
+for frame in range(FRAMES):
+    positions += velocities
+
+    for i, transformable in enumerate(transformables):
+        transformable.position = positions[i]
+        transformable.rotation = frame
+        transformable.transform
+print("{0:<36} {1:8.2f} ms/frame".format("Transformable properties", (time.time() - start) * 1000 / FRAMES))
+
+# the same entities in one TransformableArray, updated in place
+array = sf.TransformableArray(COUNT)
+array_positions = numpy.asarray(array.positions)
+array_rotations = numpy.asarray(array.rotations)
+array_positions[:] = positions
+array.origins[:, :] = 16
+
+start = time.time()
+for frame in range(FRAMES):
+    array_positions += velocities
+    array_rotations[:] = frame
+    array.update()
+print("{0:<36} {1:8.2f} ms/frame".format("TransformableArray (all dirty)", (time.time() - start) * 1000 / FRAMES))
+
+start = time.time()
+for frame in range(FRAMES):
+    # only one entity in a hundred moves
+    array_positions[::100] += velocities[::100]
+    array.update()
+print("{0:<36} {1:8.2f} ms/frame".format("TransformableArray (1% dirty)", (time.time() - start) * 1000 / FRAMES))
+
+# the matrices feed a sprite batch, and the bounds its culling
+texture = sf.Texture.create(32, 32)
+batch = sf.SpriteBatch(texture, COUNT)
+batch.set_matrices(array.matrices)
+bounds = numpy.asarray(array.get_bounds(numpy.array([[0, 0, 32, 32]], numpy.float32)))
+visible = (bounds[:, 0] < 800) & (bounds[:, 1] < 600) & (bounds[:, 0] + bounds[:, 2] > 0) & (bounds[:, 1] + bounds[:, 3] > 0)
+print("{0} of {1} entities visible".format(visible.sum(), COUNT))
@@ -0,0 +1,38 @@
+from __future__ import print_function
+
+import time
+
+import numpy
+
+from sfml import sf
+
+
+N = 100000
+
+transform = sf.Transform().translate((10, 20)).rotate(30).scale((2, 2))
+points = numpy.random.rand(N, 2).astype(numpy.float32) * 1000
+out = numpy.empty_like(points)
+
+start = time.time()
+for x, y in points[:N // 10]:
+    transform.transform_point((x, y))
+print("{0:<36} {1:8.1f} ms".format("transform_point (x{0})".format(N // 10), (time.time() - start) * 1000))
+
+start = time.time()
+transform.transform_points(points, out)
+print("{0:<36} {1:8.1f} ms".format("transform_points (x{0})".format(N), (time.time() - start) * 1000))
+
+rectangles = numpy.random.rand(N, 4).astype(numpy.float32) * 100
+start = time.time()
+transform.transform_rectangles(rectangles)
+print("{0:<36} {1:8.1f} ms".format("transform_rectangles (x{0})".format(N), (time.time() - start) * 1000))
+
+# mapping goes through a render target's view and viewport
+target = sf.RenderTexture(800, 600)
+target.view = sf.View(sf.Rect((100, 100), (400, 300)))
+
+start = time.time()
+coords = target.map_pixels_to_coords(points, out=out)
+pixels = target.map_coords_to_pixels(out)
+print("{0:<36} {1:8.1f} ms".format("map pixels to coords and back", (time.time() - start) * 1000))
+assert numpy.allclose(numpy.asarray(pixels), points, atol=0.1)
@@ -0,0 +1,34 @@
+from __future__ import print_function
+
+from timeit import timeit
+
+from sfml import sf
+
+
+N = 200000
+
+# compare the generic, object-backed vectors with the float-backed ones
+cases = [
+    ("Vector2 addition", "a + b",
+     "a = sf.Vector2(1.5, 2.5); b = sf.Vector2(3.0, 4.0)"),
+    ("Vector2f addition", "a + b",
+     "a = sf.Vector2f(1.5, 2.5); b = sf.Vector2f(3.0, 4.0)"),
+    ("Vector2 in-place scaling", "a *= 1.0001",
+     "a = sf.Vector2(1.5, 2.5)"),
+    ("Vector2f in-place scaling", "a *= 1.0001",
+     "a = sf.Vector2f(1.5, 2.5)"),
+    ("Vector3 subtraction", "a - b",
+     "a = sf.Vector3(1.5, 2.5, 3.5); b = sf.Vector3(3.0, 4.0, 5.0)"),
+    ("Vector3f subtraction", "a - b",
+     "a = sf.Vector3f(1.5, 2.5, 3.5); b = sf.Vector3f(3.0, 4.0, 5.0)"),
+    ("Transformable.position (tuple)", "t.position = p",
+     "t = sf.Transformable(); p = (1.5, 2.5)"),
+    ("Transformable.position (Vector2)", "t.position = p",
+     "t = sf.Transformable(); p = sf.Vector2(1.5, 2.5)"),
+    ("Transformable.position (Vector2f)", "t.position = p",
+     "t = sf.Transformable(); p = sf.Vector2f(1.5, 2.5)"),
+]
+
+for name, statement, setup in cases:
+    elapsed = timeit(statement, "from sfml import sf; " + setup, number=N)
+    print("{0:<36} {1:8.1f} ns/op".format(name, elapsed / N * 1e9))
@@ -0,0 +1,37 @@
+import sys
+import time
+
+from sfml.ftpbatch import FtpBatch
+
+# python 2.* compatability
+try: input = raw_input
+except NameError: pass
+
+# choose the server, the remote directory and where to put it
+address = input("Enter the FTP server address: ")
+user = input("User name: ")
+password = input("Password: ")
+remote = input("Remote directory: ")
+local = input("Local directory: ")
+
+last = [0]
+
+def progress(path, done, total):
+    # called from the worker threads, keep it cheap
+    now = time.time()
+    if now - last[0] > 0.5:
+        last[0] = now
+        sys.stdout.write("\r{0}: {1}/{2} bytes   ".format(path, done, total))
+        sys.stdout.flush()
+
+# download the whole tree over 8 connections, resuming partial files
+batch = FtpBatch(address, user=user, password=password, connections=8, progress=progress)
+batch.add_directory(remote, local)
+
+start = time.time()
+failures = batch.run()
+elapsed = time.time() - start
+
+print("\n{0} files, {1} bytes in {2:.1f}s".format(batch.completed, batch.transferred, elapsed))
+for paths, error in failures:
+    print("failed: {0} ({1})".format(paths[0], error))
@@ -47,6 +47,7 @@ class Pixelate(Effect):
             # load the shader
             self.shader = sf.Shader.from_file(fragment="data/pixelate.frag")
             self.shader.set_parameter("texture")
+            self.pixel_threshold = self.shader.uniform("pixel_threshold")
 
         except IOError as error:
             print("An error occured: {0}".format(error))
@@ -55,7 +56,7 @@ class Pixelate(Effect):
         return True
 
     def on_update(self, time, x, y):
-        self.shader.set_parameter("pixel_threshold", (x + y) / 30)
+        self.pixel_threshold.set_float((x + y) / 30)
 
     def on_draw(self, target, states):
         states.shader = self.shader
@@ -76,6 +77,9 @@ class WaveBlur(Effect):
         try:
             # load the shader
             self.shader = sf.Shader.from_file("data/wave.vert", "data/blur.frag")
+            self.wave_phase = self.shader.uniform("wave_phase")
+            self.wave_amplitude = self.shader.uniform("wave_amplitude")
+            self.blur_radius = self.shader.uniform("blur_radius")
 
         except IOError as error:
             print("An error occured: {0}".format(error))
@@ -84,9 +88,9 @@ class WaveBlur(Effect):
         return True
 
     def on_update(self, time, x, y):
-        self.shader.set_parameter("wave_phase", time)
-        self.shader.set_parameter("wave_amplitude", x * 40, y * 40)
-        self.shader.set_parameter("blur_radius", (x + y) * 0.008)
+        self.wave_phase.set_float(time)
+        self.wave_amplitude.set_vec2(x * 40, y * 40)
+        self.blur_radius.set_float((x + y) * 0.008)
 
     def on_draw(self, target, states):
         states.shader = self.shader
@@ -115,6 +119,14 @@ class StormBlink(Effect):
             # load the shader
             self.shader = sf.Shader.from_file("data/storm.vert", "data/blink.frag")
 
+            # all the parameters are written to one array and applied at once
+            self.uniforms = sf.UniformBlock(self.shader)
+            self.storm_position = self.uniforms.add("storm_position", 2)
+            self.storm_inner_radius = self.uniforms.add("storm_inner_radius")
+            self.storm_total_radius = self.uniforms.add("storm_total_radius")
+            self.blink_alpha = self.uniforms.add("blink_alpha")
+            self.values = self.uniforms.values
+
         except IOError as error:
             print("An error occured: {0}".format(error))
             exit(1)
@@ -123,10 +135,13 @@ class StormBlink(Effect):
 
     def on_update(self, time, x, y):
         radius = 200 + cos(time) * 150
-        self.shader.set_parameter("storm_position", x * 800, y * 600)
-        self.shader.set_parameter("storm_inner_radius", radius / 3)
-        self.shader.set_parameter("storm_total_radius", radius)
-        self.shader.set_parameter("blink_alpha", 0.5 + cos(time*3) * 0.25)
+        values = self.values
+        values[self.storm_position] = x * 800
+        values[self.storm_position + 1] = y * 600
+        values[self.storm_inner_radius] = radius / 3
+        values[self.storm_total_radius] = radius
+        values[self.blink_alpha] = 0.5 + cos(time*3) * 0.25
+        self.uniforms.apply()
 
     def on_draw(self, target, states):
         states.shader = self.shader
@@ -162,11 +177,12 @@ class Edge(Effect):
         # load the shader
         self.shader = sf.Shader.from_file(fragment="data/edge.frag")
         self.shader.set_parameter("texture")
+        self.edge_threshold = self.shader.uniform("edge_threshold")
 
         return True
 
     def on_update(self, time, x, y):
-        self.shader.set_parameter("edge_threshold", 1 - (x + y) / 2)
+        self.edge_threshold.set_float(1 - (x + y) / 2)
 
         # update the position of the moving entities
         for i, entity in enumerate(self.entities):
@@ -1,8 +1,9 @@
+import threading
+
 from sfml import sf
 
-# python 2.* compatability
-try: input = raw_input
-except NameError: pass
+# memoryview.cast() and the buffer protocol used by SoundBuffer.from_buffer
+# need Python 3
 
 def main():
     # check that the device can capture audio
@@ -16,16 +17,38 @@ def main():
     # wait for user input...
     input("Press enter to start recording audio")
 
-    # here we'll use an integrated custom recorder, which saves the captured data into a sf.SoundBuffer
-    recorder = sf.SoundBufferRecorder()
+    # here we'll use a recorder that stores the captured samples in a native
+    # ring buffer, without ever calling back into Python
+    recorder = sf.RingBufferRecorder(sample_rate * 4)
+    chunks = []
+    recording = threading.Event()
+
+    # pull the samples out of the ring buffer at our own pace
+    def drain():
+        while recording.is_set():
+            chunks.append(recorder.read().data)
+            sf.sleep(sf.milliseconds(50))
 
     # audio capture is done in a separate thread, so we can block the main thread while it is capturing
+    recording.set()
     recorder.start(sample_rate)
+    thread = threading.Thread(target=drain)
+    thread.start()
+
     input("Recording... press enter to stop")
+
     recorder.stop()
+    recording.clear()
+    thread.join()
+    chunks.append(recorder.read().data)
+
+    # display capture statistics
+    print("{0} samples captured, {1} dropped in {2} overruns".format(
+        recorder.captured_samples, recorder.dropped_samples, recorder.overrun_count))
 
-    # get the buffer containing the captured data
-    buffer = recorder.buffer
+    # build a buffer from the captured data, viewed as 16 bit samples
+    samples = memoryview(b"".join(chunks)).cast('h')
+    buffer = sf.SoundBuffer.from_buffer(samples, 1, sample_rate)
 
     # display captured sound informations
     print("Sound information:")
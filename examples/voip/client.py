@@ -1,3 +1,5 @@
+import threading
+
 from sfml import sf
 from struct import pack
 from random import randint
@@ -8,21 +10,33 @@ except NameError: pass
 
 AUDIO_DATA, END_OF_STREAM = list(range(1, 3))
 
-class NetworkRecorder(sf.SoundRecorder):
+class NetworkRecorder(sf.RingBufferRecorder):
     def __init__(self, host, port):
-        sf.SoundRecorder.__init__(self)
+        sf.RingBufferRecorder.__init__(self, 44100 * 4)
 
         self.host = host # address of the remote host
         self.port = port # remote port
         self.socket = sf.TcpSocket() # socket used to communicate with the server
+        self.running = threading.Event()
+        self.thread = None
 
-    def on_start(self):
+    def start(self, sample_rate):
         try: self.socket.connect(self.host, self.port)
         except sf.SocketException as error: return False
 
-        return True
+        # samples are captured natively; a separate thread sends them
+        self.running.set()
+        self.thread = threading.Thread(target=self.send_loop)
+        self.thread.start()
+
+        return sf.RingBufferRecorder.start(self, sample_rate)
+
+    def send_samples(self):
+        chunk = self.read()
+
+        if not len(chunk):
+            return True
 
-    def on_process_samples(self, chunk):
         # pack the audio samples
         data = pack("B", AUDIO_DATA)
         data += pack("I", len(chunk.data))
@@ -34,9 +48,30 @@ class NetworkRecorder(sf.SoundRecorder):
 
         return True
 
-    def on_stop(self):
+    def send_loop(self):
+        while self.running.is_set():
+            if not self.send_samples():
+                break
+
+            sf.sleep(sf.milliseconds(20))
+
+    def stop(self):
+        sf.RingBufferRecorder.stop(self)
+
+        # nothing was started if the connection failed
+        if self.thread is None:
+            return
+
+        self.running.clear()
+        self.thread.join()
+        self.thread = None
+        self.send_samples()
+
+        print("{0} samples captured, {1} dropped in {2} overruns".format(
+            self.captured_samples, self.dropped_samples, self.overrun_count))
+
         # send a "end-of-stream" signal
-        self.socket.send(bytes(END_OF_STREAM))
+        self.socket.send(pack("B", END_OF_STREAM))
 
         # close the socket
         self.socket.disconnect()
@@ -8,8 +8,6 @@ cimport sfml as sf
 from pysfml.system cimport Int16
 
 cdef extern from "pysfml/audio/audio.h":
-
-cdef class Chunk[type PyChunkType, object PyChunkObject]:
     cdef class sfml.audio.Chunk [object PyChunkObject]:
         cdef Int16* m_samples
         cdef size_t m_sampleCount
@@ -19,6 +17,9 @@ cdef extern from "pysfml/audio/audio_api.h":
     cdef void import_sfml__audio()
 
     cdef object create_chunk()
+    cdef object create_chunk_block(size_t, unsigned int)
+    cdef object reset_chunk(object)
     cdef Int16* terminate_chunk(object)
+    cdef Int16* chunk_samples(object)
     cdef object wrap_chunk(Int16*, unsigned int, bint)
 
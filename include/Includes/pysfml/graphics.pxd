@@ -20,6 +20,8 @@ cdef extern from "pysfml/graphics/graphics.h":
 
     cdef class sfml.graphics.Image [object PyImageObject]:
         cdef sf.Image *p_this
+        cdef Py_ssize_t m_shape[3]
+        cdef Py_ssize_t m_strides[3]
 
     cdef class sfml.graphics.Texture [object PyTextureObject]:
         cdef sf.Texture *p_this
@@ -21,6 +21,15 @@ cdef extern from "pysfml/system/system.h":
     cdef class sfml.system.Vector3 [object PyVector3Object]:
         cdef sf.Vector3[NumericObject] *p_this
 
+    cdef class sfml.system.Vector2f [object PyVector2fObject]:
+        cdef sf.Vector2f m_this
+
+    cdef class sfml.system.Vector2i [object PyVector2iObject]:
+        cdef sf.Vector2i m_this
+
+    cdef class sfml.system.Vector3f [object PyVector3fObject]:
+        cdef sf.Vector3f m_this
+
     cdef class sfml.system.Time [object PyTimeObject]:
         cdef sf.Time *p_this
 
@@ -41,6 +50,9 @@ cdef extern from "pysfml/system/system_api.h":
     cdef sf.Vector2u to_vector2u(object)
     cdef sf.Vector2f to_vector2f(object)
 
+    cdef Vector2f make_vector2f(sf.Vector2f)
+    cdef Vector2i make_vector2i(sf.Vector2i)
+
     cdef object wrap_vector3(sf.Vector3[NumericObject]*)
     cdef object wrap_vector3i(sf.Vector3i)
     cdef object wrap_vector3f(sf.Vector3f)
@@ -48,4 +60,6 @@ cdef extern from "pysfml/system/system_api.h":
     cdef sf.Vector3i to_vector3i(object)
     cdef sf.Vector3f to_vector3f(object)
 
+    cdef Vector3f make_vector3f(sf.Vector3f)
+
     cdef object wrap_time(sf.Time*)
@@ -17,6 +17,7 @@ cdef extern from "pysfml/window/window.h":
 
     cdef class sfml.window.Event [object PyEventObject]:
         cdef sf.Event *p_this
+        cdef bint delete_this
 
     cdef class sfml.window.Window [object PyWindowObject]:
         cdef sf.Window       *p_window
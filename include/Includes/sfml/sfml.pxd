@@ -370,8 +370,8 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
         void create(unsigned int, unsigned int)
         void create(unsigned int, unsigned int, const Uint8*)
         void create(unsigned int, unsigned int, const Color)
-        bint loadFromFile(const string&)
-        bint loadFromMemory(const void*, size_t)
+        bint loadFromFile(const string&) nogil
+        bint loadFromMemory(const void*, size_t) nogil
         bint loadFromStream(InputStream&)
         bint saveToFile(const string&) const
         Vector2u getSize() const
@@ -390,8 +390,8 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
         Texture()
         Texture(const Texture&)
         bint create(unsigned int, unsigned int)
-        bint loadFromFile(const string&)
-        bint loadFromFile(const string&, const IntRect&)
+        bint loadFromFile(const string&) nogil
+        bint loadFromFile(const string&, const IntRect&) nogil
         bint loadFromMemory(const void*, size_t)
         bint loadFromMemory(const void*, size_t, const IntRect&)
         bint loadFromStream(InputStream&)
@@ -401,7 +401,7 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
         Vector2u getSize() const
         Image copyToImage() const
         void update(const Uint8*)
-        void update(const Uint8*, unsigned int, unsigned int, unsigned int, unsigned int)
+        void update(const Uint8*, unsigned int, unsigned int, unsigned int, unsigned int) nogil
         void update(const Image&)
         void update(const Image&, unsigned int, unsigned int)
         void update(const Window&)
@@ -421,8 +421,8 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
     cdef cppclass Font:
         Font()
         Font(const Font&)
-        bint loadFromFile(const string&)
-        bint loadFromMemory(const void*, size_t)
+        bint loadFromFile(const string&) nogil
+        bint loadFromMemory(const void*, size_t) nogil
         bint loadFromStream(InputStream&)
         Glyph& getGlyph(Uint32, unsigned int, bint) const
         int getKerning(Uint32, Uint32, unsigned int) const
@@ -801,6 +801,7 @@ cdef extern from "SFML/Network.hpp" namespace "sf":
         socket.Status connect(const IpAddress&, unsigned short, Time) nogil
         void disconnect()
         socket.Status send(const void*, size_t) nogil
+        socket.Status send(const void*, size_t, size_t&) nogil
         socket.Status send(Packet&) nogil
         socket.Status receive(const void*, size_t, size_t&) nogil
         socket.Status receive(Packet&) nogil
@@ -810,10 +811,10 @@ cdef extern from "SFML/Network.hpp" namespace "sf":
         unsigned short getLocalPort() const
         socket.Status bind(unsigned short)
         void unbind()
-        socket.Status send(const void*, size_t, const IpAddress&, unsigned short)
-        socket.Status send(Packet&, const IpAddress&, unsigned short)
-        socket.Status receive(void*, size_t, size_t&, IpAddress&, unsigned short&)
-        socket.Status receive(Packet&, size_t&, IpAddress&, unsigned short&)
+        socket.Status send(const void*, size_t, const IpAddress&, unsigned short) nogil
+        socket.Status send(Packet&, const IpAddress&, unsigned short) nogil
+        socket.Status receive(void*, size_t, size_t&, IpAddress&, unsigned short&) nogil
+        socket.Status receive(Packet&, IpAddress&, unsigned short&) nogil
 
     cdef cppclass SocketSelector:
         SocketSelector()
@@ -823,7 +824,7 @@ cdef extern from "SFML/Network.hpp" namespace "sf":
         void clear()
         bint wait() nogil
         bint wait(Time) nogil
-        bint isReady(Socket&) const
+        bint isReady(Socket&) nogil const
 
     cdef cppclass Ftp:
         Ftp()
@@ -164,12 +164,12 @@ window = extension(
 
 graphics = extension(
     'graphics',
-    ['graphics.pyx', 'DerivableRenderWindow.cpp', 'DerivableDrawable.cpp', 'NumericObject.cpp'],
+    ['graphics.pyx', 'DerivableRenderWindow.cpp', 'DerivableDrawable.cpp', 'NumericObject.cpp', 'SpriteBatchDrawable.cpp', 'RectanglePacker.cpp', 'TextBatchDrawable.cpp'],
     graphics_libs)
 
 audio = extension(
     'audio',
-    ['audio.pyx', 'DerivableSoundRecorder.cpp', 'DerivableSoundStream.cpp'],
+    ['audio.pyx', 'DerivableSoundRecorder.cpp', 'DerivableSoundStream.cpp', 'MixerStream.cpp', 'RingBufferRecorder.cpp'],
     audio_libs
 )
 
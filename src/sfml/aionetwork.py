@@ -0,0 +1,314 @@
+""" asyncio support for the sockets of sfml.network.
+
+    Sockets are switched to non-blocking mode and their native handles are
+    watched by the event loop, so thousands of connections can be served
+    from a single thread.
+
+    Example::
+
+        from sfml import aionetwork
+
+        async def echo(stream):
+            while not stream.at_eof():
+                stream.write(await stream.read(4096))
+                await stream.drain()
+
+        server = await aionetwork.start_server(echo, 5000)
+"""
+
+import asyncio
+
+# get_running_loop() only exists from Python 3.7 on; inside a coroutine
+# get_event_loop() returns the same loop on older versions
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+from sfml.network import IpAddress, TcpListener, TcpSocket, UdpSocket, to_ipaddress
+from sfml.network import SocketNotReady, SocketDisconnected, SocketError
+
+
+def _watch(loop, add, remove, handle):
+    future = loop.create_future()
+
+    def ready():
+        if not future.done():
+            future.set_result(None)
+
+    add(handle, ready)
+    future.add_done_callback(lambda _: remove(handle))
+    return future
+
+
+class AsyncSocket(object):
+    def __init__(self, socket, loop=None):
+        self.socket = socket
+        self.socket.blocking = False
+        self._loop = loop
+        self._readable = None
+        self._writable = None
+
+    @property
+    def loop(self):
+        # the running loop, looked up by the first coroutine using it
+        if self._loop is None:
+            self._loop = _get_running_loop()
+
+        return self._loop
+
+    def fileno(self):
+        return self.socket.native_handle
+
+    # the loop keeps a single callback per handle and direction, so
+    # concurrent waits share one future; each waiter is shielded so that
+    # cancelling it leaves the others waiting
+    def wait_readable(self):
+        if self._readable is None or self._readable.done():
+            self._readable = _watch(self.loop, self.loop.add_reader, self.loop.remove_reader, self.fileno())
+
+        return asyncio.shield(self._readable)
+
+    def wait_writable(self):
+        if self._writable is None or self._writable.done():
+            self._writable = _watch(self.loop, self.loop.add_writer, self.loop.remove_writer, self.fileno())
+
+        return asyncio.shield(self._writable)
+
+    async def _retry(self, wait, function, *args):
+        while True:
+            try:
+                return function(*args)
+            except SocketNotReady:
+                await wait()
+
+
+class AsyncTcpListener(AsyncSocket):
+    def __init__(self, listener=None, loop=None):
+        AsyncSocket.__init__(self, listener or TcpListener(), loop)
+
+    def listen(self, port):
+        self.socket.listen(port)
+
+    def close(self):
+        self.socket.close()
+
+    async def accept(self):
+        socket = await self._retry(self.wait_readable, self.socket.accept)
+        return AsyncTcpSocket(socket, self.loop)
+
+    @property
+    def local_port(self):
+        return self.socket.local_port
+
+
+class AsyncTcpSocket(AsyncSocket):
+    def __init__(self, socket=None, loop=None):
+        AsyncSocket.__init__(self, socket or TcpSocket(), loop)
+
+    async def connect(self, remote_address, remote_port):
+        try:
+            self.socket.connect(to_ipaddress(remote_address), remote_port)
+        except SocketNotReady:
+            # the connection is established once the socket becomes writable
+            await self.wait_writable()
+
+            if self.socket.remote_address == IpAddress.NONE:
+                raise SocketError()
+
+    def disconnect(self):
+        self.socket.disconnect()
+
+    async def send(self, data):
+        data = memoryview(data).cast('B')
+
+        while data:
+            sent = self.socket.send_partial(data)
+            data = data[sent:]
+
+            if data:
+                await self.wait_writable()
+
+    async def receive(self, size):
+        return await self._retry(self.wait_readable, self.socket.receive, size)
+
+    async def receive_into(self, buffer):
+        return await self._retry(self.wait_readable, self.socket.receive_into, buffer)
+
+    async def send_packet(self, packet):
+        # a partially sent packet remembers its progress, so sending it
+        # again resumes where it stopped
+        await self._retry(self.wait_writable, self.socket.send_packet, packet)
+
+    async def receive_packet(self, packet=None):
+        return await self._retry(self.wait_readable, self.socket.receive_packet, packet)
+
+    @property
+    def remote_address(self):
+        return self.socket.remote_address
+
+    @property
+    def remote_port(self):
+        return self.socket.remote_port
+
+
+class AsyncUdpSocket(AsyncSocket):
+    def __init__(self, socket=None, loop=None):
+        AsyncSocket.__init__(self, socket or UdpSocket(), loop)
+
+    def bind(self, port):
+        self.socket.bind(port)
+
+    def unbind(self):
+        self.socket.unbind()
+
+    async def send(self, data, remote_address, remote_port):
+        await self._retry(self.wait_writable, self.socket.send, data, to_ipaddress(remote_address), remote_port)
+
+    async def receive(self, size=UdpSocket.MAX_DATAGRAM_SIZE):
+        return await self._retry(self.wait_readable, self.socket.receive, size)
+
+    async def receive_into(self, buffer):
+        return await self._retry(self.wait_readable, self.socket.receive_into, buffer)
+
+    async def send_packet(self, packet, remote_address, remote_port):
+        await self._retry(self.wait_writable, self.socket.send_packet, packet, to_ipaddress(remote_address), remote_port)
+
+    async def receive_packet(self, packet=None):
+        return await self._retry(self.wait_readable, self.socket.receive_packet, packet)
+
+    @property
+    def local_port(self):
+        return self.socket.local_port
+
+
+class SocketStream(object):
+    """ Buffered reader and writer over an AsyncTcpSocket, modelled on
+        asyncio's StreamReader and StreamWriter.
+    """
+    def __init__(self, socket, limit=65536):
+        self.socket = socket
+        self._buffer = bytearray()
+        self._chunk = bytearray(limit)
+        self._pending = bytearray()
+        self._eof = False
+
+    async def _fill(self):
+        try:
+            received = await self.socket.receive_into(self._chunk)
+        except SocketDisconnected:
+            self._eof = True
+        else:
+            self._buffer += memoryview(self._chunk)[:received]
+
+    def _take(self, size):
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def at_eof(self):
+        return self._eof and not self._buffer
+
+    async def read(self, n=-1):
+        if n < 0:
+            while not self._eof:
+                await self._fill()
+
+            return self._take(len(self._buffer))
+
+        if not self._buffer and not self._eof:
+            await self._fill()
+
+        return self._take(n)
+
+    async def readexactly(self, n):
+        while len(self._buffer) < n:
+            if self._eof:
+                raise asyncio.IncompleteReadError(self._take(len(self._buffer)), n)
+
+            await self._fill()
+
+        return self._take(n)
+
+    async def readuntil(self, separator=b'\n'):
+        start = 0
+
+        while True:
+            index = self._buffer.find(separator, start)
+
+            if index >= 0:
+                return self._take(index + len(separator))
+
+            if self._eof:
+                raise asyncio.IncompleteReadError(self._take(len(self._buffer)), None)
+
+            start = max(0, len(self._buffer) - len(separator) + 1)
+            await self._fill()
+
+    async def readline(self):
+        try:
+            return await self.readuntil(b'\n')
+        except asyncio.IncompleteReadError as error:
+            return error.partial
+
+    def write(self, data):
+        self._pending += data
+
+    def writelines(self, lines):
+        for line in lines:
+            self._pending += line
+
+    async def drain(self):
+        data, self._pending = self._pending, bytearray()
+
+        if data:
+            await self.socket.send(data)
+
+    def close(self):
+        self.socket.disconnect()
+
+    async def wait_closed(self):
+        pass
+
+    def get_extra_info(self, name, default=None):
+        if name == 'peername':
+            return (str(self.socket.remote_address), self.socket.remote_port)
+
+        return default
+
+
+class Server(object):
+    def __init__(self, listener, client_connected, limit):
+        self.listener = listener
+        self._client_connected = client_connected
+        self._limit = limit
+        self._task = listener.loop.create_task(self._serve())
+
+    async def _serve(self):
+        while True:
+            socket = await self.listener.accept()
+            stream = SocketStream(socket, self._limit)
+            self.listener.loop.create_task(self._client_connected(stream))
+
+    @property
+    def local_port(self):
+        return self.listener.local_port
+
+    def close(self):
+        self._task.cancel()
+        self.listener.close()
+
+    async def wait_closed(self):
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+async def open_connection(remote_address, remote_port, loop=None, limit=65536):
+    socket = AsyncTcpSocket(loop=loop)
+    await socket.connect(remote_address, remote_port)
+    return SocketStream(socket, limit)
+
+
+async def start_server(client_connected, port, loop=None, limit=65536):
+    listener = AsyncTcpListener(loop=loop)
+    listener.listen(port)
+    return Server(listener, client_connected, limit)
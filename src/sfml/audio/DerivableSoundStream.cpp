@@ -10,16 +10,38 @@
 
 DerivableSoundStream::DerivableSoundStream(void* pyobj):
 sf::SoundStream (),
-m_pyobj         (static_cast<PyObject*>(pyobj))
+m_pyobj         (static_cast<PyObject*>(pyobj)),
+m_chunk         (NULL)
 {
     PyEval_InitThreads();
     import_sfml__system();
     import_sfml__audio();
 };
 
-void DerivableSoundStream::initialize(unsigned int channelCount, unsigned int sampleRate)
+DerivableSoundStream::~DerivableSoundStream()
+{
+    // the streaming thread may still be in onGetData() using m_chunk;
+    // it needs the GIL to return, so release it while waiting for it
+    Py_BEGIN_ALLOW_THREADS
+    stop();
+    Py_END_ALLOW_THREADS
+
+    Py_XDECREF(m_chunk);
+}
+
+void DerivableSoundStream::initialize(unsigned int channelCount, unsigned int sampleRate, std::size_t chunkSize)
 {
     sf::SoundStream::initialize(channelCount, sampleRate);
+
+    // the samples handed to on_get_data live in a single block reused
+    // by every callback; SFML copies them to OpenAL before asking for more
+    PyObject* chunk = create_chunk_block(chunkSize * channelCount, channelCount);
+
+    if(!chunk)
+        throw std::bad_alloc();
+
+    Py_XDECREF(m_chunk);
+    m_chunk = chunk;
 }
 
 bool DerivableSoundStream::onGetData(sf::SoundStream::Chunk &data)
@@ -30,20 +52,36 @@ bool DerivableSoundStream::onGetData(sf::SoundStream::Chunk &data)
     static char method[] = "on_get_data";
     static char format[] = "O";
 
-    PyObject* pyChunk = (PyObject*)(create_chunk());
+    bool result = false;
+
+    PyObject* pyChunk = m_chunk ? reset_chunk(m_chunk) : create_chunk();
+
+    if(!pyChunk)
+    {
+        PyErr_Print();
+        PyGILState_Release(gstate);
+        return false;
+    }
+
+    Py_XDECREF(m_chunk);
+    m_chunk = pyChunk;
+
     PyObject* r = PyObject_CallMethod(m_pyobj, method, format, pyChunk);
 
     if(!r)
         PyErr_Print();
+    else
+    {
+        result = PyObject_IsTrue(r);
+        Py_DECREF(r);
+    }
 
-    data.samples = static_cast<const sf::Int16*>(terminate_chunk(pyChunk));
+    data.samples = static_cast<const sf::Int16*>(chunk_samples(pyChunk));
     data.sampleCount = PyObject_Length(pyChunk);
 
-    Py_DECREF(pyChunk);
-
     PyGILState_Release(gstate);
 
-    return PyObject_IsTrue(r);
+    return result;
 }
 
 void DerivableSoundStream::onSeek(sf::Time timeOffset)
@@ -19,14 +19,16 @@ class DerivableSoundStream : public sf::SoundStream
 {
 public :
     DerivableSoundStream(void* pyThis);
+    ~DerivableSoundStream();
 
-    void initialize(unsigned int channelCount, unsigned int sampleRate);
+    void initialize(unsigned int channelCount, unsigned int sampleRate, std::size_t chunkSize);
 
 protected:
     virtual bool onGetData(sf::SoundStream::Chunk &data);
     virtual void onSeek(sf::Time timeOffset);
 
     PyObject* m_pyobj;
+    PyObject* m_chunk;
 };
 
 #endif // PYSFML_SYSTEM_DERIVABLESOUNDSTREAM_HPP
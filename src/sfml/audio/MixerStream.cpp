@@ -0,0 +1,333 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <pysfml/audio/MixerStream.hpp>
+#include <algorithm>
+#include <cmath>
+
+MixerStream::MixerStream(unsigned int channelCount, unsigned int sampleRate, std::size_t chunkSize):
+sf::SoundStream (),
+m_chunkSize     (chunkSize ? chunkSize : 1),
+m_maxVoices     (256),
+m_nextId        (1)
+{
+    initialize(channelCount, sampleRate);
+
+    m_mix.resize(m_chunkSize * channelCount);
+    m_output.resize(m_chunkSize * channelCount);
+}
+
+MixerStream::~MixerStream()
+{
+    // the audio thread must not call onGetData on a half destroyed object
+    stop();
+}
+
+sf::Uint64 MixerStream::addVoice(const sf::SoundBuffer& buffer, float gain, float pan, float pitch, bool loop)
+{
+    sf::Lock lock(m_mutex);
+
+    if (m_maxVoices == 0)
+        return 0;
+
+    // steal the oldest voice rather than dropping the new one
+    if (m_voices.size() >= m_maxVoices)
+        releaseVoice(0);
+
+    Voice voice;
+    voice.id = m_nextId++;
+    voice.buffer = &buffer;
+    voice.samples = buffer.getSamples();
+    voice.channelCount = buffer.getChannelCount() ? buffer.getChannelCount() : 1;
+    voice.frameCount = buffer.getSampleCount() / voice.channelCount;
+    voice.position = 0;
+    voice.rate = static_cast<double>(buffer.getSampleRate()) / getSampleRate();
+    voice.gain = gain;
+    voice.pan = std::max(-1.f, std::min(1.f, pan));
+    voice.pitch = std::max(0.f, pitch);
+    voice.loop = loop;
+
+    m_voices.push_back(voice);
+
+    return voice.id;
+}
+
+bool MixerStream::removeVoice(sf::Uint64 id)
+{
+    sf::Lock lock(m_mutex);
+
+    for (std::size_t i = 0; i < m_voices.size(); ++i)
+    {
+        if (m_voices[i].id == id)
+        {
+            releaseVoice(i);
+            return true;
+        }
+    }
+
+    return false;
+}
+
+void MixerStream::clearVoices()
+{
+    sf::Lock lock(m_mutex);
+
+    for (std::size_t i = 0; i < m_voices.size(); ++i)
+        m_released.push_back(m_voices[i].buffer);
+
+    m_voices.clear();
+}
+
+bool MixerStream::hasVoice(sf::Uint64 id) const
+{
+    sf::Lock lock(m_mutex);
+    return findVoice(id) != NULL;
+}
+
+std::size_t MixerStream::getVoiceCount() const
+{
+    sf::Lock lock(m_mutex);
+    return m_voices.size();
+}
+
+bool MixerStream::setGain(sf::Uint64 id, float gain)
+{
+    sf::Lock lock(m_mutex);
+    Voice* voice = findVoice(id);
+
+    if (voice)
+        voice->gain = gain;
+
+    return voice != NULL;
+}
+
+bool MixerStream::setPan(sf::Uint64 id, float pan)
+{
+    sf::Lock lock(m_mutex);
+    Voice* voice = findVoice(id);
+
+    if (voice)
+        voice->pan = std::max(-1.f, std::min(1.f, pan));
+
+    return voice != NULL;
+}
+
+bool MixerStream::setPitch(sf::Uint64 id, float pitch)
+{
+    sf::Lock lock(m_mutex);
+    Voice* voice = findVoice(id);
+
+    if (voice)
+        voice->pitch = std::max(0.f, pitch);
+
+    return voice != NULL;
+}
+
+bool MixerStream::setLoop(sf::Uint64 id, bool loop)
+{
+    sf::Lock lock(m_mutex);
+    Voice* voice = findVoice(id);
+
+    if (voice)
+        voice->loop = loop;
+
+    return voice != NULL;
+}
+
+bool MixerStream::getGain(sf::Uint64 id, float& gain) const
+{
+    sf::Lock lock(m_mutex);
+    const Voice* voice = findVoice(id);
+
+    if (voice)
+        gain = voice->gain;
+
+    return voice != NULL;
+}
+
+bool MixerStream::getPan(sf::Uint64 id, float& pan) const
+{
+    sf::Lock lock(m_mutex);
+    const Voice* voice = findVoice(id);
+
+    if (voice)
+        pan = voice->pan;
+
+    return voice != NULL;
+}
+
+bool MixerStream::getPitch(sf::Uint64 id, float& pitch) const
+{
+    sf::Lock lock(m_mutex);
+    const Voice* voice = findVoice(id);
+
+    if (voice)
+        pitch = voice->pitch;
+
+    return voice != NULL;
+}
+
+bool MixerStream::getLoop(sf::Uint64 id, bool& loop) const
+{
+    sf::Lock lock(m_mutex);
+    const Voice* voice = findVoice(id);
+
+    if (voice)
+        loop = voice->loop;
+
+    return voice != NULL;
+}
+
+void MixerStream::setMaxVoices(std::size_t count)
+{
+    sf::Lock lock(m_mutex);
+
+    m_maxVoices = count;
+
+    while (m_voices.size() > m_maxVoices)
+        releaseVoice(0);
+}
+
+std::size_t MixerStream::getMaxVoices() const
+{
+    sf::Lock lock(m_mutex);
+    return m_maxVoices;
+}
+
+void MixerStream::popReleasedBuffers(std::vector<const sf::SoundBuffer*>& buffers)
+{
+    sf::Lock lock(m_mutex);
+
+    buffers.swap(m_released);
+    m_released.clear();
+}
+
+bool MixerStream::onGetData(sf::SoundStream::Chunk& data)
+{
+    sf::Lock lock(m_mutex);
+
+    std::fill(m_mix.begin(), m_mix.end(), 0.f);
+
+    std::size_t i = 0;
+    while (i < m_voices.size())
+    {
+        if (mixVoice(m_voices[i], m_chunkSize))
+            ++i;
+        else
+            releaseVoice(i);
+    }
+
+    for (std::size_t j = 0; j < m_mix.size(); ++j)
+    {
+        float sample = std::max(-32768.f, std::min(32767.f, m_mix[j]));
+        m_output[j] = static_cast<sf::Int16>(sample);
+    }
+
+    data.samples = &m_output[0];
+    data.sampleCount = m_output.size();
+
+    return true;
+}
+
+void MixerStream::onSeek(sf::Time)
+{
+}
+
+MixerStream::Voice* MixerStream::findVoice(sf::Uint64 id)
+{
+    for (std::size_t i = 0; i < m_voices.size(); ++i)
+    {
+        if (m_voices[i].id == id)
+            return &m_voices[i];
+    }
+
+    return NULL;
+}
+
+const MixerStream::Voice* MixerStream::findVoice(sf::Uint64 id) const
+{
+    for (std::size_t i = 0; i < m_voices.size(); ++i)
+    {
+        if (m_voices[i].id == id)
+            return &m_voices[i];
+    }
+
+    return NULL;
+}
+
+void MixerStream::releaseVoice(std::size_t index)
+{
+    m_released.push_back(m_voices[index].buffer);
+    m_voices.erase(m_voices.begin() + index);
+}
+
+bool MixerStream::mixVoice(Voice& voice, std::size_t frameCount)
+{
+    if (voice.frameCount == 0)
+        return false;
+
+    unsigned int outputChannels = getChannelCount();
+    double step = voice.rate * voice.pitch;
+
+    // constant power panning for mono sources, balance for stereo ones
+    float left, right;
+    if (voice.channelCount == 1)
+    {
+        float angle = (voice.pan + 1.f) * 0.785398163f;
+        left = std::cos(angle) * 1.414213562f;
+        right = std::sin(angle) * 1.414213562f;
+    }
+    else
+    {
+        left = std::min(1.f, 1.f - voice.pan);
+        right = std::min(1.f, 1.f + voice.pan);
+    }
+
+    left *= voice.gain;
+    right *= voice.gain;
+
+    float* out = &m_mix[0];
+
+    for (std::size_t frame = 0; frame < frameCount; ++frame)
+    {
+        if (voice.position >= voice.frameCount)
+        {
+            if (!voice.loop)
+                return false;
+
+            voice.position = std::fmod(voice.position, static_cast<double>(voice.frameCount));
+        }
+
+        std::size_t index = static_cast<std::size_t>(voice.position);
+        std::size_t next = index + 1;
+        float t = static_cast<float>(voice.position - index);
+
+        if (next >= voice.frameCount)
+            next = voice.loop ? 0 : index;
+
+        const sf::Int16* a = voice.samples + index * voice.channelCount;
+        const sf::Int16* b = voice.samples + next * voice.channelCount;
+
+        float first = a[0] + (b[0] - a[0]) * t;
+        float second = voice.channelCount > 1 ? a[1] + (b[1] - a[1]) * t : first;
+
+        if (outputChannels == 1)
+        {
+            out[frame] += (first + second) * 0.5f * voice.gain;
+        }
+        else
+        {
+            out[frame * outputChannels] += first * left;
+            out[frame * outputChannels + 1] += second * right;
+        }
+
+        voice.position += step;
+    }
+
+    return true;
+}
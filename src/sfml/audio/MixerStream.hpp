@@ -0,0 +1,84 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_AUDIO_MIXERSTREAM_HPP
+#define PYSFML_AUDIO_MIXERSTREAM_HPP
+
+#include <SFML/Audio.hpp>
+#include <SFML/System.hpp>
+#include <vector>
+
+// Mixes any number of sound buffers into a single stream. Mixing happens
+// in the audio thread and never touches Python; voices are identified by
+// ids that are never reused so stale handles are harmless.
+class MixerStream : public sf::SoundStream
+{
+public:
+    MixerStream(unsigned int channelCount, unsigned int sampleRate, std::size_t chunkSize);
+    ~MixerStream();
+
+    sf::Uint64 addVoice(const sf::SoundBuffer& buffer, float gain, float pan, float pitch, bool loop);
+    bool removeVoice(sf::Uint64 id);
+    void clearVoices();
+
+    bool hasVoice(sf::Uint64 id) const;
+    std::size_t getVoiceCount() const;
+
+    bool setGain(sf::Uint64 id, float gain);
+    bool setPan(sf::Uint64 id, float pan);
+    bool setPitch(sf::Uint64 id, float pitch);
+    bool setLoop(sf::Uint64 id, bool loop);
+
+    bool getGain(sf::Uint64 id, float& gain) const;
+    bool getPan(sf::Uint64 id, float& pan) const;
+    bool getPitch(sf::Uint64 id, float& pitch) const;
+    bool getLoop(sf::Uint64 id, bool& loop) const;
+
+    void setMaxVoices(std::size_t count);
+    std::size_t getMaxVoices() const;
+
+    // buffers of voices that ended since the last call, so the owner of
+    // the buffers knows when they can be released
+    void popReleasedBuffers(std::vector<const sf::SoundBuffer*>& buffers);
+
+protected:
+    virtual bool onGetData(sf::SoundStream::Chunk& data);
+    virtual void onSeek(sf::Time timeOffset);
+
+private:
+    struct Voice
+    {
+        sf::Uint64 id;
+        const sf::SoundBuffer* buffer;
+        const sf::Int16* samples;
+        std::size_t frameCount;
+        unsigned int channelCount;
+        double position;
+        double rate;
+        float gain;
+        float pan;
+        float pitch;
+        bool loop;
+    };
+
+    Voice* findVoice(sf::Uint64 id);
+    const Voice* findVoice(sf::Uint64 id) const;
+    void releaseVoice(std::size_t index);
+    bool mixVoice(Voice& voice, std::size_t frameCount);
+
+    mutable sf::Mutex m_mutex;
+    std::vector<Voice> m_voices;
+    std::vector<const sf::SoundBuffer*> m_released;
+    std::vector<float> m_mix;
+    std::vector<sf::Int16> m_output;
+    std::size_t m_chunkSize;
+    std::size_t m_maxVoices;
+    sf::Uint64 m_nextId;
+};
+
+#endif // PYSFML_AUDIO_MIXERSTREAM_HPP
@@ -0,0 +1,124 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <pysfml/audio/RingBufferRecorder.hpp>
+#include <algorithm>
+#include <cstring>
+
+namespace
+{
+    std::size_t roundUpToPowerOfTwo(std::size_t value)
+    {
+        std::size_t result = 1;
+
+        while (result < value)
+            result <<= 1;
+
+        return result;
+    }
+}
+
+// read and write indices grow without bound and are masked on access, so
+// a full buffer and an empty one can be told apart without a spare slot
+RingBufferRecorder::RingBufferRecorder(std::size_t capacity):
+sf::SoundRecorder (),
+m_buffer          (roundUpToPowerOfTwo(capacity)),
+m_mask            (m_buffer.size() - 1),
+m_readIndex       (0),
+m_writeIndex      (0),
+m_captured        (0),
+m_dropped         (0),
+m_overruns        (0)
+{
+}
+
+RingBufferRecorder::~RingBufferRecorder()
+{
+    stop();
+}
+
+std::size_t RingBufferRecorder::read(sf::Int16* samples, std::size_t count)
+{
+    std::size_t readIndex = m_readIndex.load(std::memory_order_relaxed);
+    std::size_t writeIndex = m_writeIndex.load(std::memory_order_acquire);
+
+    count = std::min(count, writeIndex - readIndex);
+
+    std::size_t offset = readIndex & m_mask;
+    std::size_t first = std::min(count, m_buffer.size() - offset);
+
+    std::memcpy(samples, &m_buffer[offset], first * sizeof(sf::Int16));
+    std::memcpy(samples + first, &m_buffer[0], (count - first) * sizeof(sf::Int16));
+
+    m_readIndex.store(readIndex + count, std::memory_order_release);
+
+    return count;
+}
+
+void RingBufferRecorder::clear()
+{
+    m_readIndex.store(m_writeIndex.load(std::memory_order_acquire), std::memory_order_release);
+}
+
+std::size_t RingBufferRecorder::getAvailable() const
+{
+    return m_writeIndex.load(std::memory_order_acquire) - m_readIndex.load(std::memory_order_acquire);
+}
+
+std::size_t RingBufferRecorder::getCapacity() const
+{
+    return m_buffer.size();
+}
+
+sf::Uint64 RingBufferRecorder::getCapturedSamples() const
+{
+    return m_captured.load(std::memory_order_relaxed);
+}
+
+sf::Uint64 RingBufferRecorder::getDroppedSamples() const
+{
+    return m_dropped.load(std::memory_order_relaxed);
+}
+
+sf::Uint64 RingBufferRecorder::getOverrunCount() const
+{
+    return m_overruns.load(std::memory_order_relaxed);
+}
+
+void RingBufferRecorder::resetCounters()
+{
+    m_captured.store(0, std::memory_order_relaxed);
+    m_dropped.store(0, std::memory_order_relaxed);
+    m_overruns.store(0, std::memory_order_relaxed);
+}
+
+bool RingBufferRecorder::onProcessSamples(const sf::Int16* samples, std::size_t sampleCount)
+{
+    std::size_t writeIndex = m_writeIndex.load(std::memory_order_relaxed);
+    std::size_t readIndex = m_readIndex.load(std::memory_order_acquire);
+
+    std::size_t count = std::min(sampleCount, m_buffer.size() - (writeIndex - readIndex));
+
+    std::size_t offset = writeIndex & m_mask;
+    std::size_t first = std::min(count, m_buffer.size() - offset);
+
+    std::memcpy(&m_buffer[offset], samples, first * sizeof(sf::Int16));
+    std::memcpy(&m_buffer[0], samples + first, (count - first) * sizeof(sf::Int16));
+
+    m_writeIndex.store(writeIndex + count, std::memory_order_release);
+
+    m_captured.fetch_add(sampleCount, std::memory_order_relaxed);
+
+    if (count < sampleCount)
+    {
+        m_dropped.fetch_add(sampleCount - count, std::memory_order_relaxed);
+        m_overruns.fetch_add(1, std::memory_order_relaxed);
+    }
+
+    return true;
+}
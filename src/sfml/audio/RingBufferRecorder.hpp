@@ -0,0 +1,49 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_AUDIO_RINGBUFFERRECORDER_HPP
+#define PYSFML_AUDIO_RINGBUFFERRECORDER_HPP
+
+#include <SFML/Audio.hpp>
+#include <atomic>
+#include <vector>
+
+// Sound recorder that stores captured samples in a single-producer,
+// single-consumer ring buffer. The capture thread never touches Python;
+// samples that don't fit are dropped and counted as overruns.
+class RingBufferRecorder : public sf::SoundRecorder
+{
+public:
+    RingBufferRecorder(std::size_t capacity);
+    ~RingBufferRecorder();
+
+    std::size_t read(sf::Int16* samples, std::size_t count);
+    void clear();
+
+    std::size_t getAvailable() const;
+    std::size_t getCapacity() const;
+
+    sf::Uint64 getCapturedSamples() const;
+    sf::Uint64 getDroppedSamples() const;
+    sf::Uint64 getOverrunCount() const;
+    void resetCounters();
+
+protected:
+    virtual bool onProcessSamples(const sf::Int16* samples, std::size_t sampleCount);
+
+private:
+    std::vector<sf::Int16> m_buffer;
+    std::size_t m_mask;
+    std::atomic<std::size_t> m_readIndex;
+    std::atomic<std::size_t> m_writeIndex;
+    std::atomic<sf::Uint64> m_captured;
+    std::atomic<sf::Uint64> m_dropped;
+    std::atomic<sf::Uint64> m_overruns;
+};
+
+#endif // PYSFML_AUDIO_RINGBUFFERRECORDER_HPP
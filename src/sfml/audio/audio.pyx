@@ -8,10 +8,13 @@
 #from cython.operator cimport preincrement as preinc, dereference as deref
 
 cimport cython
-from libc.stdlib cimport malloc, free
-from libc.string cimport memcpy
+from libc.stdlib cimport malloc, calloc, free
+from libc.string cimport memcpy, memset
 from libcpp.string cimport string
 from libcpp.vector cimport vector
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release
+from cpython.buffer cimport PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_FORMAT
+from cpython.buffer cimport PyBUF_ND, PyBUF_STRIDES, PyBUF_C_CONTIGUOUS
 
 cimport sfml as sf
 from sfml cimport Int8, Int16, Int32, Int64
@@ -21,14 +24,50 @@ from pysfml.system cimport wrap_vector3f, to_vector3f
 from pysfml.system cimport wrap_time, to_vector3f
 from pysfml.system cimport popLastErrorMessage, import_sfml__system
 
+import sys
 from enum import IntEnum
 
 import_sfml__system()
 
+# buffer formats of native byte order 16 bit integers, as SFML expects them
+INT16_FORMATS = (b'h', b'=h', b'@h', b'<h' if sys.byteorder == 'little' else b'>h')
+
 cdef extern from "pysfml/audio/DerivableSoundStream.hpp":
     cdef cppclass DerivableSoundStream:
         DerivableSoundStream(void*)
-        void initialize(unsigned int, unsigned int)
+        void initialize(unsigned int, unsigned int, size_t) except +
+
+cdef extern from "pysfml/audio/MixerStream.hpp":
+    cdef cppclass MixerStream:
+        MixerStream(unsigned int, unsigned int, size_t)
+        Uint64 addVoice(const sf.SoundBuffer&, float, float, float, bint)
+        bint removeVoice(Uint64)
+        void clearVoices()
+        bint hasVoice(Uint64) const
+        size_t getVoiceCount() const
+        bint setGain(Uint64, float)
+        bint setPan(Uint64, float)
+        bint setPitch(Uint64, float)
+        bint setLoop(Uint64, bint)
+        bint getGain(Uint64, float&) const
+        bint getPan(Uint64, float&) const
+        bint getPitch(Uint64, float&) const
+        bint getLoop(Uint64, bint&) const
+        void setMaxVoices(size_t)
+        size_t getMaxVoices() const
+        void popReleasedBuffers(vector[const sf.SoundBuffer*]&)
+
+cdef extern from "pysfml/audio/RingBufferRecorder.hpp":
+    cdef cppclass RingBufferRecorderImpl "RingBufferRecorder":
+        RingBufferRecorderImpl(size_t)
+        size_t read(Int16*, size_t) nogil
+        void clear()
+        size_t getAvailable() const
+        size_t getCapacity() const
+        Uint64 getCapturedSamples() const
+        Uint64 getDroppedSamples() const
+        Uint64 getOverrunCount() const
+        void resetCounters()
 
 cdef extern from "pysfml/audio/DerivableSoundRecorder.hpp":
     cdef cppclass DerivableSoundRecorder:
@@ -74,19 +113,39 @@ cdef class Listener:
     def set_up_vector(up_vector):
         sf.listener.setUpVector(to_vector3f(up_vector))
 
+cdef char* SAMPLE_FORMAT = "h"
+
 cdef public class Chunk[type PyChunkType, object PyChunkObject]:
-    cdef Int16* m_samples
-    cdef size_t m_sampleCount
-    cdef bint   delete_this
+    cdef Int16*     m_samples
+    cdef size_t     m_sampleCount
+    cdef bint       delete_this
+    cdef Int16*     m_block
+    cdef size_t     m_capacity
+    cdef size_t     m_limit
+    cdef Py_buffer  m_view
+    cdef bint       m_has_view
+    cdef bint       m_readonly
+    cdef int        m_exports
+    cdef unsigned int m_channelCount
+    cdef object     m_owner
+    cdef Py_ssize_t m_shape[2]
+    cdef Py_ssize_t m_strides[2]
 
     def __cinit__(self):
         self.m_samples = NULL
         self.m_sampleCount = 0
         self.delete_this = False
+        self.m_block = NULL
+        self.m_capacity = 0
+        self.m_limit = 0
+        self.m_has_view = False
+        self.m_readonly = False
+        self.m_exports = 0
+        self.m_channelCount = 1
 
     def __dealloc__(self):
-        if self.delete_this:
-            free(self.m_samples)
+        self._release()
+        free(self.m_block)
 
     def __repr__(self):
         return "Chunk(size={0}, data={1})".format(len(self), self.data[:10])
@@ -95,30 +154,123 @@ cdef public class Chunk[type PyChunkType, object PyChunkObject]:
         return self.m_sampleCount
 
     def __getitem__(self, size_t key):
+        if key >= self.m_sampleCount:
+            raise IndexError("chunk index out of range")
+
         return self.m_samples[key]
 
     def __setitem__(self, size_t key, Int16 other):
+        if key >= self.m_sampleCount:
+            raise IndexError("chunk index out of range")
+
+        if self.m_readonly:
+            raise TypeError("Chunk is read-only")
+
         self.m_samples[key] = other
 
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE and self.m_readonly:
+            raise BufferError("Chunk is read-only")
+
+        self.m_shape[0] = self.m_sampleCount // self.m_channelCount
+        self.m_shape[1] = self.m_channelCount
+        self.m_strides[0] = self.m_channelCount * sizeof(Int16)
+        self.m_strides[1] = sizeof(Int16)
+
+        buffer.buf = <char*>self.m_samples
+        buffer.format = SAMPLE_FORMAT if flags & PyBUF_FORMAT else NULL
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(Int16)
+        buffer.len = self.m_shape[0] * self.m_channelCount * sizeof(Int16)
+        buffer.ndim = 2 if flags & PyBUF_ND else 1
+        buffer.obj = self
+        buffer.readonly = self.m_readonly
+        buffer.shape = self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = self.m_strides if flags & PyBUF_STRIDES == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+        self.m_exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.m_exports -= 1
+
+    cdef void _release(self):
+        if self.m_has_view:
+            PyBuffer_Release(&self.m_view)
+            self.m_has_view = False
+        elif self.delete_this:
+            free(self.m_samples)
+
+        self.delete_this = False
+        self.m_readonly = False
+        self.m_owner = None
+        self.m_samples = self.m_block
+        self.m_sampleCount = 0
+        self.m_limit = self.m_capacity
+
     property data:
         def __get__(self):
             return (<char*>self.m_samples)[:len(self)*2]
 
-        def __set__(self, bdata):
-            cdef char* data = <bytes>bdata
+        def __set__(self, data):
+            cdef Py_buffer view
+
+            PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
 
-            if len(bdata) % 2:
+            if view.len % 2:
+                PyBuffer_Release(&view)
                 raise ValueError("Chunk data length must be even as it represents a 16bit array")
 
-            if self.delete_this:
-                free(self.m_samples)
-                self.m_sampleCount = 0
+            if self.m_exports:
+                PyBuffer_Release(&view)
+                raise BufferError("Chunk data can't be replaced while it is exported")
+
+            self._release()
+
+            self.m_view = view
+            self.m_has_view = True
+            self.m_readonly = view.readonly
+            self.m_samples = <Int16*>view.buf
+            self.m_sampleCount = view.len // 2
+            self.m_limit = self.m_sampleCount
 
-            self.m_samples = <Int16*>malloc(len(bdata))
-            memcpy(self.m_samples, data, len(bdata))
-            self.m_sampleCount = len(bdata) // 2
+    property sample_count:
+        def __get__(self):
+            return self.m_sampleCount
+
+        def __set__(self, size_t sample_count):
+            if sample_count > self.m_limit:
+                raise ValueError("Chunk can hold at most {0} samples".format(self.m_limit))
+
+            if self.m_exports:
+                raise BufferError("Chunk can't be resized while it is exported")
 
-            self.delete_this = True
+            self.m_sampleCount = sample_count
+
+    property capacity:
+        def __get__(self):
+            return self.m_limit
+
+    property channel_count:
+        def __get__(self):
+            return self.m_channelCount
+
+        def __set__(self, unsigned int channel_count):
+            if not channel_count:
+                raise ValueError("Chunk needs at least one channel")
+
+            if self.m_exports:
+                raise BufferError("Chunk can't be reshaped while it is exported")
+
+            self.m_channelCount = channel_count
+
+    property frame_count:
+        def __get__(self):
+            return self.m_sampleCount // self.m_channelCount
+
+    property readonly:
+        def __get__(self):
+            return self.m_readonly
 
 cdef api object create_chunk():
     cdef Chunk r = Chunk.__new__(Chunk)
@@ -127,15 +279,46 @@ cdef api object create_chunk():
     r.delete_this = False
     return r
 
+cdef api object create_chunk_block(size_t capacity, unsigned int channel_count):
+    cdef Chunk r = Chunk.__new__(Chunk)
+
+    r.m_block = <Int16*>calloc(capacity, sizeof(Int16))
+
+    if capacity and not r.m_block:
+        raise MemoryError
+
+    r.m_capacity = capacity
+    r.m_channelCount = channel_count or 1
+    r._release()
+    return r
+
+cdef api object reset_chunk(chunk):
+    cdef Chunk p = <Chunk>chunk
+
+    if p.m_exports:
+        p = create_chunk_block(p.m_capacity, p.m_channelCount)
+    else:
+        p._release()
+
+        # a callback writing fewer samples must not play the previous ones
+        memset(p.m_block, 0, p.m_capacity * sizeof(Int16))
+
+    p.m_sampleCount = p.m_capacity
+    return p
+
 cdef api Int16* terminate_chunk(chunk):
     cdef Chunk p = <Chunk>chunk
     p.delete_this = False
     return p.m_samples
 
+cdef api Int16* chunk_samples(chunk):
+    return (<Chunk>chunk).m_samples
+
 cdef api object wrap_chunk(Int16* samples, unsigned int sample_count, bint delete):
     cdef Chunk r = Chunk.__new__(Chunk)
     r.m_samples = samples
     r.m_sampleCount = sample_count
+    r.m_limit = sample_count
     r.delete_this = delete
     return r
 
@@ -174,10 +357,38 @@ cdef class SoundBuffer:
         raise IOError(popLastErrorMessage())
 
     @classmethod
-    def from_samples(cls, Chunk samples, unsigned int channel_count, unsigned int sample_rate):
-        cdef sf.SoundBuffer *p = new sf.SoundBuffer()
+    def from_samples(cls, samples, unsigned int channel_count, unsigned int sample_rate):
+        cdef sf.SoundBuffer *p
+
+        if not isinstance(samples, Chunk):
+            return SoundBuffer.from_buffer(samples, channel_count, sample_rate)
 
-        if p.loadFromSamples(samples.m_samples, samples.m_sampleCount, channel_count, sample_rate):
+        p = new sf.SoundBuffer()
+
+        if p.loadFromSamples((<Chunk>samples).m_samples, (<Chunk>samples).m_sampleCount, channel_count, sample_rate):
+            return wrap_soundbuffer(p)
+
+        del p
+        raise IOError(popLastErrorMessage())
+
+    @classmethod
+    def from_buffer(cls, buffer, unsigned int channel_count, unsigned int sample_rate):
+        cdef Py_buffer view
+        cdef sf.SoundBuffer *p
+        cdef bint loaded
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT)
+
+        try:
+            if view.itemsize != sizeof(Int16) or view.format == NULL or view.format not in INT16_FORMATS:
+                raise ValueError("Samples must be a contiguous buffer of 16 bit integers")
+
+            p = new sf.SoundBuffer()
+            loaded = p.loadFromSamples(<Int16*>view.buf, view.len // sizeof(Int16), channel_count, sample_rate)
+        finally:
+            PyBuffer_Release(&view)
+
+        if loaded:
             return wrap_soundbuffer(p)
 
         del p
@@ -193,8 +404,16 @@ cdef class SoundBuffer:
             cdef Chunk r = Chunk.__new__(Chunk)
             r.m_samples = <Int16*>self.p_this.getSamples()
             r.m_sampleCount = self.p_this.getSampleCount()
+            r.m_limit = r.m_sampleCount
+            r.m_channelCount = self.p_this.getChannelCount() or 1
+            r.m_readonly = True
+            r.m_owner = self
             return r
 
+    property sample_count:
+        def __get__(self):
+            return self.p_this.getSampleCount()
+
     property sample_rate:
         def __get__(self):
             return self.p_this.getSampleRate()
@@ -383,9 +602,12 @@ cdef class SoundStream(SoundSource):
         def __set__(self, bint loop):
             self.p_soundstream.setLoop(loop)
 
-    def initialize(self, unsigned int channel_count, unsigned int sample_rate):
-        if self.__class__ not in [Music]:
-            (<DerivableSoundStream*>self.p_soundstream).initialize(channel_count, sample_rate)
+    def initialize(self, unsigned int channel_count, unsigned int sample_rate, chunk_size=None):
+        if chunk_size is None:
+            chunk_size = sample_rate
+
+        if not isinstance(self, (Music, Mixer)):
+            (<DerivableSoundStream*>self.p_soundstream).initialize(channel_count, sample_rate, chunk_size)
 
     def on_get_data(self, data):
         pass
@@ -442,6 +664,151 @@ cdef Music wrap_music(sf.Music *p):
     r.p_soundsource = <sf.SoundSource*>p
     return r
 
+cdef class Mixer(SoundStream):
+    cdef MixerStream *p_this
+    cdef dict         m_buffers
+
+    def __init__(self, unsigned int channel_count=2, unsigned int sample_rate=44100, chunk_size=None):
+        # playing voices point to the buffers kept in m_buffers
+        if self.p_this is not NULL:
+            raise UserWarning("Mixer is already initialized")
+
+        if channel_count not in (1, 2):
+            raise ValueError("Mixer only supports mono and stereo output")
+
+        if chunk_size is None:
+            chunk_size = sample_rate // 50
+
+        self.m_buffers = {}
+
+        self.p_this = new MixerStream(channel_count, sample_rate, chunk_size)
+        self.p_soundstream = <sf.SoundStream*>self.p_this
+        self.p_soundsource = <sf.SoundSource*>self.p_this
+
+    def __dealloc__(self):
+        self.p_soundstream = NULL
+
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "Mixer(channel_count={0}, sample_rate={1}, voice_count={2})".format(self.channel_count, self.sample_rate, self.voice_count)
+
+    cdef void _collect(self):
+        cdef vector[const sf.SoundBuffer*] released
+        cdef size_t i
+
+        self.p_this.popReleasedBuffers(released)
+
+        for i in range(released.size()):
+            key = <size_t>released[i]
+            entry = self.m_buffers[key]
+            entry[1] -= 1
+
+            if not entry[1]:
+                del self.m_buffers[key]
+
+    def add_voice(self, SoundBuffer buffer not None, float gain=1, float pan=0, float pitch=1, bint loop=False):
+        cdef Voice voice = Voice.__new__(Voice)
+
+        self._collect()
+
+        voice.m_mixer = self
+        voice.m_id = self.p_this.addVoice(buffer.p_this[0], gain, pan, pitch, loop)
+
+        if voice.m_id:
+            key = <size_t>buffer.p_this
+            self.m_buffers.setdefault(key, [buffer, 0])[1] += 1
+
+        # the voice may have stolen another one
+        self._collect()
+
+        return voice
+
+    def stop_voices(self):
+        self.p_this.clearVoices()
+        self._collect()
+
+    property voice_count:
+        def __get__(self):
+            return self.p_this.getVoiceCount()
+
+    property max_voices:
+        def __get__(self):
+            return self.p_this.getMaxVoices()
+
+        def __set__(self, size_t max_voices):
+            self.p_this.setMaxVoices(max_voices)
+            self._collect()
+
+    def initialize(self, unsigned int channel_count, unsigned int sample_rate, chunk_size=None):
+        raise UserWarning("Mixer is initialized by its constructor")
+
+    def on_get_data(self, data):
+        raise UserWarning("Mixer mixes its voices natively, this method is not meant to be called")
+
+cdef class Voice:
+    cdef Mixer  m_mixer
+    cdef Uint64 m_id
+
+    def __init__(self):
+        raise UserWarning("Use Mixer.add_voice()")
+
+    def __repr__(self):
+        return "Voice(id={0}, playing={1})".format(self.m_id, self.playing)
+
+    def stop(self):
+        if self.m_mixer.p_this.removeVoice(self.m_id):
+            self.m_mixer._collect()
+
+    property id:
+        def __get__(self):
+            return self.m_id
+
+    property mixer:
+        def __get__(self):
+            return self.m_mixer
+
+    property playing:
+        def __get__(self):
+            return self.m_mixer.p_this.hasVoice(self.m_id)
+
+    property gain:
+        def __get__(self):
+            cdef float gain = 0
+            self.m_mixer.p_this.getGain(self.m_id, gain)
+            return gain
+
+        def __set__(self, float gain):
+            self.m_mixer.p_this.setGain(self.m_id, gain)
+
+    property pan:
+        def __get__(self):
+            cdef float pan = 0
+            self.m_mixer.p_this.getPan(self.m_id, pan)
+            return pan
+
+        def __set__(self, float pan):
+            self.m_mixer.p_this.setPan(self.m_id, pan)
+
+    property pitch:
+        def __get__(self):
+            cdef float pitch = 0
+            self.m_mixer.p_this.getPitch(self.m_id, pitch)
+            return pitch
+
+        def __set__(self, float pitch):
+            self.m_mixer.p_this.setPitch(self.m_id, pitch)
+
+    property loop:
+        def __get__(self):
+            cdef bint loop = False
+            self.m_mixer.p_this.getLoop(self.m_id, loop)
+            return loop
+
+        def __set__(self, bint loop):
+            self.m_mixer.p_this.setLoop(self.m_id, loop)
+
 
 cdef class SoundRecorder:
     cdef sf.SoundRecorder *p_soundrecorder
@@ -520,3 +887,75 @@ cdef class SoundBufferRecorder(SoundRecorder):
     property buffer:
         def __get__(self):
             return self.m_buffer
+
+cdef class RingBufferRecorder(SoundRecorder):
+    cdef RingBufferRecorderImpl *p_this
+
+    def __init__(self, size_t capacity=262144):
+        if self.p_this is NULL:
+            self.p_this = new RingBufferRecorderImpl(capacity)
+            self.p_soundrecorder = <sf.SoundRecorder*>self.p_this
+
+    def __dealloc__(self):
+        self.p_soundrecorder = NULL
+
+        if self.p_this is not NULL:
+            with nogil: del self.p_this
+
+    def __repr__(self):
+        return "RingBufferRecorder(available={0}, capacity={1}, sample_rate={2})".format(self.available, self.capacity, self.sample_rate)
+
+    def read(self, n=None):
+        cdef size_t count = self.p_this.getAvailable()
+        cdef Int16* samples
+
+        if n is not None and n < count:
+            count = n
+
+        samples = <Int16*>malloc(count * sizeof(Int16))
+
+        if count and not samples:
+            raise MemoryError
+
+        with nogil: count = self.p_this.read(samples, count)
+
+        return wrap_chunk(samples, count, True)
+
+    def readinto(self, buffer):
+        cdef Py_buffer view
+        cdef size_t count
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS)
+
+        try:
+            with nogil: count = self.p_this.read(<Int16*>view.buf, view.len // sizeof(Int16))
+        finally:
+            PyBuffer_Release(&view)
+
+        return count
+
+    def clear(self):
+        self.p_this.clear()
+
+    def reset_counters(self):
+        self.p_this.resetCounters()
+
+    property available:
+        def __get__(self):
+            return self.p_this.getAvailable()
+
+    property capacity:
+        def __get__(self):
+            return self.p_this.getCapacity()
+
+    property captured_samples:
+        def __get__(self):
+            return self.p_this.getCapturedSamples()
+
+    property dropped_samples:
+        def __get__(self):
+            return self.p_this.getDroppedSamples()
+
+    property overrun_count:
+        def __get__(self):
+            return self.p_this.getOverrunCount()
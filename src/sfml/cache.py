@@ -0,0 +1,147 @@
+""" A resource cache with least-recently-used eviction.
+
+    Textures, images, fonts and sound buffers are loaded once per path
+    and parameters, and kept while the total of their native sizes stays
+    within a memory budget. When a load goes over the budget, the least
+    recently used resources are dropped from the cache.
+
+    Example::
+
+        from sfml.cache import ResourceCache
+
+        cache = ResourceCache(budget=256 * 1024 * 1024)
+
+        texture = cache.texture("data/tiles.png", area=(0, 0, 64, 64))
+        font = cache.font("data/sansation.ttf")
+        print(cache.hits, cache.misses, cache.evictions, cache.size)
+
+    The cache only drops its own reference. A resource still used
+    elsewhere (e.g. a texture set on a sprite) stays alive until it is
+    released there too.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from sfml.graphics import Image, Texture, Font
+
+
+def texture_size(texture):
+    return texture.size.x * texture.size.y * 4
+
+
+def image_size(image):
+    return image.size.x * image.size.y * 4
+
+
+def sound_buffer_size(buffer):
+    return buffer.sample_count * 2
+
+
+class ResourceCache(object):
+    def __init__(self, budget=256 * 1024 * 1024):
+        self._budget = budget
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return "ResourceCache(size={0}, budget={1}, entries={2})".format(self.size, self._budget, len(self))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def budget(self):
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget):
+        with self._lock:
+            self._budget = budget
+            self._shrink()
+
+    def load(self, key, loader, sizeof):
+        """ Return the resource cached under key, or load it with loader()
+            and account for it with sizeof(resource) bytes.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None:
+                # re-inserting moves the entry to the most recently used end
+                self._entries[key] = entry
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+
+        resource = loader()
+        size = sizeof(resource)
+
+        with self._lock:
+            if key in self._entries:
+                # another thread loaded it in the meantime
+                self.size -= self._entries.pop(key)[1]
+
+            self._entries[key] = (resource, size)
+            self.size += size
+            self._shrink()
+
+        return resource
+
+    def texture(self, filename, area=None, smooth=False, repeated=False):
+        def load():
+            texture = Texture.from_file(filename, area)
+            texture.smooth = smooth
+            texture.repeated = repeated
+            return texture
+
+        key = ('texture', filename, tuple(area) if area else None, smooth, repeated)
+        return self.load(key, load, texture_size)
+
+    def image(self, filename):
+        return self.load(('image', filename), lambda: Image.from_file(filename), image_size)
+
+    def font(self, filename):
+        # FreeType keeps glyph data in memory, the file size is a good
+        # estimate of what a font costs
+        return self.load(('font', filename), lambda: Font.from_file(filename), lambda font: os.path.getsize(filename))
+
+    def sound_buffer(self, filename):
+        from sfml.audio import SoundBuffer
+
+        return self.load(('sound_buffer', filename), lambda: SoundBuffer.from_file(filename), sound_buffer_size)
+
+    def evict(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None:
+                self.size -= entry[1]
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _shrink(self):
+        # a single resource larger than the budget is returned but not kept
+        while self.size > self._budget and self._entries:
+            key, (resource, size) = self._entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
@@ -0,0 +1,419 @@
+""" Batch FTP transfers over several connections.
+
+    sf::Ftp transfers one file per call and keeps its data channel
+    private, so it can neither resume a transfer nor report progress.
+    FtpBatch speaks the protocol itself over TcpSocket, running one
+    control connection per worker thread. The sockets release the GIL
+    while they wait, so the workers transfer in parallel.
+
+    Example::
+
+        from sfml.ftpbatch import FtpBatch
+
+        def progress(path, done, total):
+            print(path, done, total)
+
+        batch = FtpBatch("127.0.0.1", user="john", password="doe",
+                         connections=8, progress=progress)
+        batch.add_directory("assets", "local/assets")
+        batch.add_upload("build.log", "logs/build.log")
+        failures = batch.run()
+"""
+
+import os
+import re
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from sfml.network import IpAddress, TcpSocket, SocketDisconnected, SocketException, to_ipaddress
+
+
+class FtpError(IOError):
+    def __init__(self, status, message):
+        IOError.__init__(self, "{0} {1}".format(status, message))
+        self.status = status
+        self.message = message
+
+
+def _is_transient(error):
+    # 4xx replies are transient negative completions (RFC 959); local
+    # file errors would fail the same way on every attempt
+    if isinstance(error, FtpError):
+        return error.status // 100 == 4
+
+    return isinstance(error, SocketException)
+
+
+class _Connection(object):
+    def __init__(self, address, port, user, password, timeout):
+        self.address = address
+        self.timeout = timeout
+        self.socket = TcpSocket()
+        self.socket.connect(address, port, timeout)
+        self._buffer = bytearray()
+        self._chunk = bytearray(4096)
+
+        self.response(2)
+
+        if user:
+            status, message = self.command("USER", user)
+
+            if status == 331:
+                self.command("PASS", password, 2)
+            else:
+                self._check((status, message), 2)
+        else:
+            self.command("USER", "anonymous", 2, 3)
+            self.command("PASS", "user@sfml-dev.org", 2)
+
+        self.command("TYPE", "I", 2)
+
+    def _check(self, response, *expected):
+        if response[0] // 100 not in expected:
+            raise FtpError(*response)
+
+        return response
+
+    def _readline(self):
+        while True:
+            index = self._buffer.find(b"\n")
+
+            if index >= 0:
+                line = bytes(self._buffer[:index]).rstrip(b"\r")
+                del self._buffer[:index + 1]
+                return line.decode('utf-8', 'replace')
+
+            received = self.socket.receive_into(self._chunk)
+            self._buffer += memoryview(self._chunk)[:received]
+
+    def response(self, *expected):
+        line = self._readline()
+        lines = [line[4:]]
+
+        # multi-line replies end with the same code followed by a space
+        if line[3:4] == "-":
+            code = line[:3]
+
+            while True:
+                line = self._readline()
+
+                if line[:3] == code and line[3:4] == " ":
+                    lines.append(line[4:])
+                    break
+
+                lines.append(line)
+
+        try:
+            response = int(line[:3]), "\n".join(lines)
+        except ValueError:
+            raise FtpError(1000, line)
+
+        if expected:
+            self._check(response, *expected)
+
+        return response
+
+    def command(self, command, argument=None, *expected):
+        line = command if argument is None else command + " " + argument
+        self.socket.send((line + "\r\n").encode('utf-8'))
+        return self.response(*expected)
+
+    def passive(self):
+        status, message = self.command("PASV", None, 2)
+        numbers = re.search(r"(\d+),(\d+),(\d+),(\d+),(\d+),(\d+)", message)
+
+        if not numbers:
+            raise FtpError(status, message)
+
+        numbers = [int(n) for n in numbers.groups()]
+        address = IpAddress.from_bytes(*numbers[:4])
+
+        # some servers behind NAT answer with an unusable address
+        if address.integer == 0:
+            address = self.address
+
+        data = TcpSocket()
+        data.connect(address, numbers[4] * 256 + numbers[5], self.timeout)
+        return data
+
+    def size(self, path):
+        status, message = self.command("SIZE", path)
+
+        if status != 213:
+            return None
+
+        return int(message.split()[0])
+
+    def restart(self, offset):
+        # servers without REST support start over from the beginning
+        if offset and self.command("REST", str(offset))[0] == 350:
+            return offset
+
+        return 0
+
+    def listing(self, directory):
+        data = self.passive()
+        status, message = self.command("MLSD", directory)
+
+        if status // 100 == 5:
+            data.disconnect()
+            return None
+
+        self._check((status, message), 1)
+        raw = bytearray()
+
+        while True:
+            try:
+                raw += data.receive(65536)
+            except SocketDisconnected:
+                break
+
+        data.disconnect()
+        self.response(2)
+
+        entries = []
+
+        for line in raw.decode('utf-8', 'replace').splitlines():
+            facts, _, name = line.partition(" ")
+            # fact names are case-insensitive (RFC 3659)
+            facts = dict(fact.split("=", 1) for fact in facts.split(";") if "=" in fact)
+            facts = dict((key.lower(), value) for key, value in facts.items())
+            kind = facts.get("type", "file").lower()
+
+            if kind in ("file", "dir"):
+                entries.append((name, kind == "dir", int(facts.get("size", -1))))
+
+        return entries
+
+    def close(self):
+        try:
+            self.command("QUIT")
+        except (SocketException, FtpError):
+            pass
+
+        self.socket.disconnect()
+
+
+class FtpBatch(object):
+    def __init__(self, address, port=21, user=None, password="", connections=4,
+                 timeout=None, chunk_size=65536, retries=2, progress=None):
+        self.address = to_ipaddress(address)
+        self.port = port
+        self.user = user
+        self.password = password
+        self.connections = connections
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.progress = progress
+
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = []
+        self.failures = []
+
+    def __repr__(self):
+        return "FtpBatch(pending={0}, transferred={1})".format(self._jobs.qsize(), self.transferred)
+
+    def add_download(self, remote, local, resume=True):
+        self._jobs.put((self._download, (remote, local, resume), 0))
+
+    def add_upload(self, local, remote, resume=True):
+        self._jobs.put((self._upload, (local, remote, resume), 0))
+
+    def add_directory(self, remote, local, resume=True):
+        self._jobs.put((self._directory, (remote, local, resume), 0))
+
+    @property
+    def transferred(self):
+        return sum(worker.transferred for worker in self._workers)
+
+    @property
+    def completed(self):
+        return sum(worker.completed for worker in self._workers)
+
+    def run(self):
+        self.failures = []
+        self._workers = [_Worker(self) for i in range(self.connections)]
+
+        for worker in self._workers:
+            worker.start()
+
+        self._jobs.join()
+
+        for worker in self._workers:
+            self._jobs.put(None)
+
+        for worker in self._workers:
+            worker.join()
+
+        return self.failures
+
+    def _fail(self, job, error):
+        function, args, attempt = job
+
+        if attempt < self.retries and _is_transient(error):
+            # a dropped connection is retried, resuming where it stopped
+            self._jobs.put((function, args, attempt + 1))
+        else:
+            with self._lock:
+                self.failures.append((args[:2], error))
+
+    def _report(self, path, done, total):
+        if self.progress:
+            self.progress(path, done, total)
+
+    def _download(self, worker, connection, remote, local, resume):
+        offset = os.path.getsize(local) if resume and os.path.exists(local) else 0
+        total = connection.size(remote)
+
+        # an empty remote file still has to be created locally
+        if total is not None and offset == total and os.path.exists(local):
+            self._report(remote, offset, total)
+            return
+
+        if total is not None and offset > total:
+            offset = 0
+
+        data = connection.passive()
+
+        try:
+            offset = connection.restart(offset)
+            connection.command("RETR", remote, 1)
+
+            done = offset
+            chunk = bytearray(self.chunk_size)
+
+            with open(local, 'r+b' if offset else 'wb') as f:
+                f.seek(offset)
+                f.truncate()
+
+                while True:
+                    try:
+                        received = data.receive_into(chunk)
+                    except SocketDisconnected:
+                        break
+
+                    f.write(memoryview(chunk)[:received])
+                    done += received
+                    worker.transferred += received
+                    self._report(remote, done, total)
+        finally:
+            data.disconnect()
+
+        connection.response(2)
+
+    def _upload(self, worker, connection, local, remote, resume):
+        total = os.path.getsize(local)
+        existing = connection.size(remote) if resume else None
+        offset = existing or 0
+
+        # an empty local file still has to be created remotely
+        if existing is not None and offset == total:
+            self._report(local, offset, total)
+            return
+
+        if offset > total:
+            offset = 0
+
+        data = connection.passive()
+
+        try:
+            offset = connection.restart(offset)
+            connection.command("STOR", remote, 1)
+
+            done = offset
+            chunk = bytearray(self.chunk_size)
+
+            with open(local, 'rb') as f:
+                f.seek(offset)
+
+                while True:
+                    read = f.readinto(chunk)
+
+                    if not read:
+                        break
+
+                    view = memoryview(chunk)[:read]
+
+                    while view:
+                        view = view[data.send_partial(view):]
+
+                    done += read
+                    worker.transferred += read
+                    self._report(local, done, total)
+        finally:
+            data.disconnect()
+
+        connection.response(2)
+
+    def _directory(self, worker, connection, remote, local, resume):
+        entries = connection.listing(remote)
+
+        if entries is None:
+            raise FtpError(502, "MLSD is not supported by the server")
+
+        if not os.path.isdir(local):
+            os.makedirs(local)
+
+        # listings are jobs too, so the other workers start on the
+        # files while this one walks the subdirectories
+        for name, directory, size in entries:
+            if name in (".", ".."):
+                continue
+
+            path = remote.rstrip("/") + "/" + name
+
+            if directory:
+                self.add_directory(path, os.path.join(local, name), resume)
+            else:
+                self.add_download(path, os.path.join(local, name), resume)
+
+
+class _Worker(threading.Thread):
+    def __init__(self, batch):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.batch = batch
+        self.connection = None
+        self.transferred = 0
+        self.completed = 0
+
+    def connect(self):
+        batch = self.batch
+        self.connection = _Connection(batch.address, batch.port, batch.user, batch.password, batch.timeout)
+
+    def run(self):
+        batch = self.batch
+
+        while True:
+            job = batch._jobs.get()
+
+            if job is None:
+                break
+
+            try:
+                if self.connection is None:
+                    self.connect()
+
+                function, args, attempt = job
+                function(self, self.connection, *args)
+                self.completed += 1
+            except Exception as error:
+                # any error fails the job, an uncaught one would leave it
+                # unfinished and run() waiting forever
+                if not isinstance(error, FtpError) and self.connection:
+                    # the control connection is in an unknown state
+                    self.connection.socket.disconnect()
+                    self.connection = None
+
+                batch._fail(job, error)
+            finally:
+                batch._jobs.task_done()
+
+        if self.connection:
+            self.connection.close()
@@ -0,0 +1,195 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <pysfml/graphics/RectanglePacker.hpp>
+#include <algorithm>
+
+namespace
+{
+    struct TallestFirst
+    {
+        const unsigned int* sizes;
+
+        bool operator()(std::size_t a, std::size_t b) const
+        {
+            if (sizes[a * 2 + 1] != sizes[b * 2 + 1])
+                return sizes[a * 2 + 1] > sizes[b * 2 + 1];
+
+            return sizes[a * 2] > sizes[b * 2];
+        }
+    };
+}
+
+RectanglePacker::RectanglePacker(unsigned int width, unsigned int height, unsigned int padding) :
+m_width   (static_cast<int>(width)),
+m_height  (static_cast<int>(height)),
+m_padding (static_cast<int>(padding)),
+m_usedArea(0)
+{
+    clear();
+}
+
+unsigned int RectanglePacker::getWidth() const
+{
+    return m_width;
+}
+
+unsigned int RectanglePacker::getHeight() const
+{
+    return m_height;
+}
+
+float RectanglePacker::getOccupancy() const
+{
+    return static_cast<float>(m_usedArea) / (static_cast<float>(m_width) * m_height);
+}
+
+bool RectanglePacker::insert(unsigned int width, unsigned int height, sf::IntRect& rectangle)
+{
+    int paddedWidth = static_cast<int>(width) + m_padding;
+    int paddedHeight = static_cast<int>(height) + m_padding;
+
+    int bestIndex = -1;
+    int bestBottom = m_height + 1;
+    int bestWidth = m_width + 1;
+    int bestY = 0;
+
+    for (std::size_t i = 0; i < m_skyline.size(); ++i)
+    {
+        int y = fit(i, paddedWidth, paddedHeight);
+
+        if (y < 0)
+            continue;
+
+        // lowest resulting top edge wins, ties go to the narrowest segment
+        int bottom = y + paddedHeight;
+
+        if (bottom < bestBottom || (bottom == bestBottom && m_skyline[i].width < bestWidth))
+        {
+            bestIndex = static_cast<int>(i);
+            bestBottom = bottom;
+            bestWidth = m_skyline[i].width;
+            bestY = y;
+        }
+    }
+
+    if (bestIndex < 0)
+        return false;
+
+    int x = m_skyline[bestIndex].x;
+    place(bestIndex, x, bestY, paddedWidth, paddedHeight);
+
+    rectangle = sf::IntRect(x, bestY, width, height);
+    m_usedArea += static_cast<long long>(paddedWidth) * paddedHeight;
+
+    return true;
+}
+
+std::size_t RectanglePacker::insertMany(std::size_t count, const unsigned int* sizes, int* rectangles)
+{
+    std::vector<std::size_t> order(count);
+
+    for (std::size_t i = 0; i < count; ++i)
+        order[i] = i;
+
+    TallestFirst compare = {sizes};
+    std::sort(order.begin(), order.end(), compare);
+
+    std::size_t placed = 0;
+
+    for (std::size_t i = 0; i < count; ++i)
+    {
+        std::size_t index = order[i];
+        sf::IntRect rectangle(0, 0, 0, 0);
+
+        if (insert(sizes[index * 2], sizes[index * 2 + 1], rectangle))
+            ++placed;
+
+        rectangles[index * 4 + 0] = rectangle.left;
+        rectangles[index * 4 + 1] = rectangle.top;
+        rectangles[index * 4 + 2] = rectangle.width;
+        rectangles[index * 4 + 3] = rectangle.height;
+    }
+
+    return placed;
+}
+
+void RectanglePacker::clear()
+{
+    Segment segment = {0, 0, m_width};
+
+    m_skyline.clear();
+    m_skyline.push_back(segment);
+    m_usedArea = 0;
+}
+
+int RectanglePacker::fit(std::size_t index, int width, int height) const
+{
+    int x = m_skyline[index].x;
+
+    if (x + width > m_width)
+        return -1;
+
+    // the rectangle rests on the highest segment it spans
+    int y = 0;
+    int remaining = width;
+
+    for (std::size_t i = index; remaining > 0; ++i)
+    {
+        if (i == m_skyline.size())
+            return -1;
+
+        y = std::max(y, m_skyline[i].y);
+
+        if (y + height > m_height)
+            return -1;
+
+        remaining -= m_skyline[i].width;
+    }
+
+    return y;
+}
+
+void RectanglePacker::place(std::size_t index, int x, int y, int width, int height)
+{
+    Segment segment = {x, y + height, width};
+    m_skyline.insert(m_skyline.begin() + index, segment);
+
+    // shrink or remove the segments now covered by the new one
+    for (std::size_t i = index + 1; i < m_skyline.size(); )
+    {
+        Segment& next = m_skyline[i];
+        int shrink = (x + width) - next.x;
+
+        if (shrink <= 0)
+            break;
+
+        if (next.width > shrink)
+        {
+            next.x += shrink;
+            next.width -= shrink;
+            break;
+        }
+
+        m_skyline.erase(m_skyline.begin() + i);
+    }
+
+    // merge neighbours sitting at the same height
+    for (std::size_t i = 0; i + 1 < m_skyline.size(); )
+    {
+        if (m_skyline[i].y == m_skyline[i + 1].y)
+        {
+            m_skyline[i].width += m_skyline[i + 1].width;
+            m_skyline.erase(m_skyline.begin() + i + 1);
+        }
+        else
+        {
+            ++i;
+        }
+    }
+}
@@ -0,0 +1,55 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_RECTANGLEPACKER_HPP
+#define PYSFML_GRAPHICS_RECTANGLEPACKER_HPP
+
+#include <SFML/Graphics.hpp>
+#include <vector>
+
+// Skyline bottom-left packer: the top edge of the packed area is kept
+// as a list of horizontal segments and each rectangle is placed where
+// it ends up lowest.
+class RectanglePacker
+{
+public:
+    RectanglePacker(unsigned int width, unsigned int height, unsigned int padding);
+
+    unsigned int getWidth() const;
+    unsigned int getHeight() const;
+    float getOccupancy() const;
+
+    bool insert(unsigned int width, unsigned int height, sf::IntRect& rectangle);
+
+    // Sizes are exchanged as 2 unsigned ints per rectangle and results as
+    // 4 ints (left, top, width, height). Rectangles are placed tallest
+    // first; those that don't fit get a zero width and height. Returns
+    // the number of rectangles placed.
+    std::size_t insertMany(std::size_t count, const unsigned int* sizes, int* rectangles);
+
+    void clear();
+
+private:
+    struct Segment
+    {
+        int x;
+        int y;
+        int width;
+    };
+
+    int fit(std::size_t index, int width, int height) const;
+    void place(std::size_t index, int x, int y, int width, int height);
+
+    int                  m_width;
+    int                  m_height;
+    int                  m_padding;
+    long long            m_usedArea;
+    std::vector<Segment> m_skyline;
+};
+
+#endif // PYSFML_GRAPHICS_RECTANGLEPACKER_HPP
@@ -0,0 +1,172 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <pysfml/graphics/SpriteBatchDrawable.hpp>
+#include <algorithm>
+#include <cstring>
+
+SpriteBatchDrawable::SpriteBatchDrawable() :
+m_texture   (NULL),
+m_needUpdate(false)
+{
+}
+
+void SpriteBatchDrawable::setTexture(const sf::Texture* texture)
+{
+    m_texture = texture;
+}
+
+const sf::Texture* SpriteBatchDrawable::getTexture() const
+{
+    return m_texture;
+}
+
+std::size_t SpriteBatchDrawable::getSpriteCount() const
+{
+    return m_instances.size();
+}
+
+void SpriteBatchDrawable::resize(std::size_t count)
+{
+    static const Instance identity = {{0, 0, 0, 0}, {1, 0, 0, 0, 1, 0}, sf::Color::White};
+
+    m_instances.resize(count, identity);
+    m_needUpdate = true;
+}
+
+void SpriteBatchDrawable::clear()
+{
+    m_instances.clear();
+    m_vertices.clear();
+    m_needUpdate = false;
+}
+
+void SpriteBatchDrawable::setSprite(std::size_t index, const sf::FloatRect& rectangle, const sf::Transform& transform, const sf::Color& color)
+{
+    const float* m = transform.getMatrix();
+    Instance& instance = m_instances[index];
+
+    instance.rectangle[0] = rectangle.left;
+    instance.rectangle[1] = rectangle.top;
+    instance.rectangle[2] = rectangle.width;
+    instance.rectangle[3] = rectangle.height;
+
+    instance.matrix[0] = m[0];
+    instance.matrix[1] = m[4];
+    instance.matrix[2] = m[12];
+    instance.matrix[3] = m[1];
+    instance.matrix[4] = m[5];
+    instance.matrix[5] = m[13];
+
+    instance.color = color;
+
+    m_needUpdate = true;
+}
+
+void SpriteBatchDrawable::setRectangles(std::size_t count, const float* rectangles)
+{
+    count = std::min(count, m_instances.size());
+
+    for (std::size_t i = 0; i < count; ++i)
+        std::memcpy(m_instances[i].rectangle, rectangles + i * 4, 4 * sizeof(float));
+
+    m_needUpdate = true;
+}
+
+void SpriteBatchDrawable::setMatrices(std::size_t count, const float* matrices)
+{
+    count = std::min(count, m_instances.size());
+
+    for (std::size_t i = 0; i < count; ++i)
+        std::memcpy(m_instances[i].matrix, matrices + i * 6, 6 * sizeof(float));
+
+    m_needUpdate = true;
+}
+
+void SpriteBatchDrawable::setColors(std::size_t count, const sf::Uint8* colors)
+{
+    count = std::min(count, m_instances.size());
+
+    for (std::size_t i = 0; i < count; ++i)
+    {
+        const sf::Uint8* c = colors + i * 4;
+        m_instances[i].color = sf::Color(c[0], c[1], c[2], c[3]);
+    }
+
+    m_needUpdate = true;
+}
+
+sf::FloatRect SpriteBatchDrawable::getBounds() const
+{
+    update();
+
+    if (m_vertices.empty())
+        return sf::FloatRect();
+
+    float left = m_vertices[0].position.x;
+    float top = m_vertices[0].position.y;
+    float right = left;
+    float bottom = top;
+
+    for (std::size_t i = 1; i < m_vertices.size(); ++i)
+    {
+        const sf::Vector2f& position = m_vertices[i].position;
+
+        left = std::min(left, position.x);
+        right = std::max(right, position.x);
+        top = std::min(top, position.y);
+        bottom = std::max(bottom, position.y);
+    }
+
+    return sf::FloatRect(left, top, right - left, bottom - top);
+}
+
+void SpriteBatchDrawable::update() const
+{
+    if (!m_needUpdate)
+        return;
+
+    m_vertices.resize(m_instances.size() * 4);
+
+    for (std::size_t i = 0; i < m_instances.size(); ++i)
+    {
+        const Instance& instance = m_instances[i];
+        const float* r = instance.rectangle;
+        const float* m = instance.matrix;
+        sf::Vertex* quad = &m_vertices[i * 4];
+
+        // local corners of the sprite, (0, 0) to (width, height)
+        const float corners[4][2] = {{0, 0}, {0, r[3]}, {r[2], r[3]}, {r[2], 0}};
+        const float texCoords[4][2] = {{r[0], r[1]}, {r[0], r[1] + r[3]}, {r[0] + r[2], r[1] + r[3]}, {r[0] + r[2], r[1]}};
+
+        for (int j = 0; j < 4; ++j)
+        {
+            float x = corners[j][0];
+            float y = corners[j][1];
+
+            quad[j].position.x = m[0] * x + m[1] * y + m[2];
+            quad[j].position.y = m[3] * x + m[4] * y + m[5];
+            quad[j].texCoords.x = texCoords[j][0];
+            quad[j].texCoords.y = texCoords[j][1];
+            quad[j].color = instance.color;
+        }
+    }
+
+    m_needUpdate = false;
+}
+
+void SpriteBatchDrawable::draw(sf::RenderTarget& target, sf::RenderStates states) const
+{
+    update();
+
+    if (m_vertices.empty())
+        return;
+
+    states.texture = m_texture;
+    target.draw(&m_vertices[0], m_vertices.size(), sf::Quads, states);
+}
@@ -0,0 +1,53 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_SPRITEBATCHDRAWABLE_HPP
+#define PYSFML_GRAPHICS_SPRITEBATCHDRAWABLE_HPP
+
+#include <SFML/Graphics.hpp>
+#include <vector>
+
+// Affine transforms are exchanged as 6 floats per sprite, row by row:
+// (a00, a01, a02, a10, a11, a12).
+class SpriteBatchDrawable : public sf::Drawable
+{
+public:
+    SpriteBatchDrawable();
+
+    void setTexture(const sf::Texture* texture);
+    const sf::Texture* getTexture() const;
+
+    std::size_t getSpriteCount() const;
+    void resize(std::size_t count);
+    void clear();
+
+    void setSprite(std::size_t index, const sf::FloatRect& rectangle, const sf::Transform& transform, const sf::Color& color);
+    void setRectangles(std::size_t count, const float* rectangles);
+    void setMatrices(std::size_t count, const float* matrices);
+    void setColors(std::size_t count, const sf::Uint8* colors);
+
+    sf::FloatRect getBounds() const;
+
+private:
+    struct Instance
+    {
+        float rectangle[4];
+        float matrix[6];
+        sf::Color color;
+    };
+
+    virtual void draw(sf::RenderTarget& target, sf::RenderStates states) const;
+    void update() const;
+
+    const sf::Texture*              m_texture;
+    std::vector<Instance>           m_instances;
+    mutable std::vector<sf::Vertex> m_vertices;
+    mutable bool                    m_needUpdate;
+};
+
+#endif // PYSFML_GRAPHICS_SPRITEBATCHDRAWABLE_HPP
@@ -0,0 +1,386 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <pysfml/graphics/TextBatchDrawable.hpp>
+#include <algorithm>
+#include <cmath>
+
+namespace
+{
+    // same as the underline and strike through lines of sf::Text
+    void addLine(std::vector<sf::Vertex>& vertices, float lineLength, float lineTop, float offset, float thickness)
+    {
+        float top = std::floor(lineTop + offset - (thickness / 2) + 0.5f);
+        float bottom = top + std::floor(thickness + 0.5f);
+
+        vertices.push_back(sf::Vertex(sf::Vector2f(0, top), sf::Color::White, sf::Vector2f(1, 1)));
+        vertices.push_back(sf::Vertex(sf::Vector2f(lineLength, top), sf::Color::White, sf::Vector2f(1, 1)));
+        vertices.push_back(sf::Vertex(sf::Vector2f(0, bottom), sf::Color::White, sf::Vector2f(1, 1)));
+        vertices.push_back(sf::Vertex(sf::Vector2f(0, bottom), sf::Color::White, sf::Vector2f(1, 1)));
+        vertices.push_back(sf::Vertex(sf::Vector2f(lineLength, top), sf::Color::White, sf::Vector2f(1, 1)));
+        vertices.push_back(sf::Vertex(sf::Vector2f(lineLength, bottom), sf::Color::White, sf::Vector2f(1, 1)));
+    }
+}
+
+sf::FloatRect layoutText(const sf::Font& font, const sf::Uint32* string, std::size_t length, unsigned int characterSize, sf::Uint32 style, std::vector<sf::Vertex>* vertices, float* advance, std::size_t* lines)
+{
+    // the same layout as sf::Text::ensureGeometryUpdate()
+    bool  bold               = (style & sf::Text::Bold) != 0;
+    bool  underlined         = (style & sf::Text::Underlined) != 0;
+    bool  strikeThrough      = (style & sf::Text::StrikeThrough) != 0;
+    float italic             = (style & sf::Text::Italic) ? 0.208f : 0.f;
+    float underlineOffset    = font.getUnderlinePosition(characterSize);
+    float underlineThickness = font.getUnderlineThickness(characterSize);
+
+    sf::FloatRect xBounds = font.getGlyph(L'x', characterSize, bold).bounds;
+    float strikeThroughOffset = xBounds.top + xBounds.height / 2.f;
+
+    float hspace = static_cast<float>(font.getGlyph(L' ', characterSize, bold).advance);
+    float vspace = static_cast<float>(font.getLineSpacing(characterSize));
+    float x      = 0.f;
+    float y      = static_cast<float>(characterSize);
+
+    float minX = static_cast<float>(characterSize);
+    float minY = static_cast<float>(characterSize);
+    float maxX = 0.f;
+    float maxY = 0.f;
+    sf::Uint32 prevChar = 0;
+
+    float maxAdvance = 0.f;
+    std::size_t lineCount = length > 0 ? 1 : 0;
+
+    if (vertices)
+        vertices->reserve(vertices->size() + length * 6);
+
+    for (std::size_t i = 0; i < length; ++i)
+    {
+        sf::Uint32 curChar = string[i];
+
+        x += static_cast<float>(font.getKerning(prevChar, curChar, characterSize));
+        prevChar = curChar;
+
+        if (vertices && underlined && (curChar == L'\n'))
+            addLine(*vertices, x, y, underlineOffset, underlineThickness);
+
+        if (vertices && strikeThrough && (curChar == L'\n'))
+            addLine(*vertices, x, y, strikeThroughOffset, underlineThickness);
+
+        if ((curChar == ' ') || (curChar == '\t') || (curChar == '\n'))
+        {
+            minX = std::min(minX, x);
+            minY = std::min(minY, y);
+
+            switch (curChar)
+            {
+                case ' ':  x += hspace;        break;
+                case '\t': x += hspace * 4;    break;
+                case '\n': maxAdvance = std::max(maxAdvance, x); y += vspace; x = 0; ++lineCount; break;
+            }
+
+            maxX = std::max(maxX, x);
+            maxY = std::max(maxY, y);
+
+            continue;
+        }
+
+        const sf::Glyph& glyph = font.getGlyph(curChar, characterSize, bold);
+
+        float left   = glyph.bounds.left;
+        float top    = glyph.bounds.top;
+        float right  = glyph.bounds.left + glyph.bounds.width;
+        float bottom = glyph.bounds.top  + glyph.bounds.height;
+
+        float u1 = static_cast<float>(glyph.textureRect.left);
+        float v1 = static_cast<float>(glyph.textureRect.top);
+        float u2 = static_cast<float>(glyph.textureRect.left + glyph.textureRect.width);
+        float v2 = static_cast<float>(glyph.textureRect.top  + glyph.textureRect.height);
+
+        if (vertices)
+        {
+            vertices->push_back(sf::Vertex(sf::Vector2f(x + left  - italic * top,    y + top),    sf::Color::White, sf::Vector2f(u1, v1)));
+            vertices->push_back(sf::Vertex(sf::Vector2f(x + right - italic * top,    y + top),    sf::Color::White, sf::Vector2f(u2, v1)));
+            vertices->push_back(sf::Vertex(sf::Vector2f(x + left  - italic * bottom, y + bottom), sf::Color::White, sf::Vector2f(u1, v2)));
+            vertices->push_back(sf::Vertex(sf::Vector2f(x + left  - italic * bottom, y + bottom), sf::Color::White, sf::Vector2f(u1, v2)));
+            vertices->push_back(sf::Vertex(sf::Vector2f(x + right - italic * top,    y + top),    sf::Color::White, sf::Vector2f(u2, v1)));
+            vertices->push_back(sf::Vertex(sf::Vector2f(x + right - italic * bottom, y + bottom), sf::Color::White, sf::Vector2f(u2, v2)));
+        }
+
+        minX = std::min(minX, x + left - italic * bottom);
+        maxX = std::max(maxX, x + right - italic * top);
+        minY = std::min(minY, y + top);
+        maxY = std::max(maxY, y + bottom);
+
+        x += glyph.advance;
+    }
+
+    if (vertices && underlined)
+        addLine(*vertices, x, y, underlineOffset, underlineThickness);
+
+    if (vertices && strikeThrough)
+        addLine(*vertices, x, y, strikeThroughOffset, underlineThickness);
+
+    if (advance)
+        *advance = std::max(maxAdvance, x);
+
+    if (lines)
+        *lines = lineCount;
+
+    if (length == 0)
+        return sf::FloatRect();
+
+    return sf::FloatRect(minX, minY, maxX - minX, maxY - minY);
+}
+
+bool TextBatchDrawable::Key::operator <(const Key& other) const
+{
+    if (characterSize != other.characterSize)
+        return characterSize < other.characterSize;
+
+    if (style != other.style)
+        return style < other.style;
+
+    return string < other.string;
+}
+
+TextBatchDrawable::TextBatchDrawable() :
+m_font         (NULL),
+m_characterSize(30),
+m_cacheCapacity(1024),
+m_cacheHits    (0),
+m_cacheMisses  (0),
+m_needUpdate   (false)
+{
+}
+
+void TextBatchDrawable::setFont(const sf::Font* font)
+{
+    // cached layouts refer to the glyphs of the previous font
+    m_cache.clear();
+    m_order.clear();
+
+    m_font = font;
+    relayout();
+}
+
+void TextBatchDrawable::setCharacterSize(unsigned int size)
+{
+    m_characterSize = size;
+    relayout();
+}
+
+unsigned int TextBatchDrawable::getCharacterSize() const
+{
+    return m_characterSize;
+}
+
+std::size_t TextBatchDrawable::getLabelCount() const
+{
+    return m_labels.size();
+}
+
+void TextBatchDrawable::resize(std::size_t count)
+{
+    Label label;
+    label.style = sf::Text::Regular;
+    label.color = sf::Color::White;
+
+    m_labels.resize(count, label);
+    m_needUpdate = true;
+}
+
+void TextBatchDrawable::clear()
+{
+    m_labels.clear();
+    m_vertices.clear();
+    m_needUpdate = false;
+}
+
+void TextBatchDrawable::setString(std::size_t index, const sf::Uint32* string, std::size_t length, sf::Uint32 style)
+{
+    Label& label = m_labels[index];
+
+    if (label.style == style && label.string.compare(0, label.string.size(), string, length) == 0)
+        return;
+
+    label.string.assign(string, length);
+    label.style = style;
+    label.layout = getLayout(label.string, style);
+
+    m_needUpdate = true;
+}
+
+void TextBatchDrawable::setPosition(std::size_t index, const sf::Vector2f& position)
+{
+    m_labels[index].position = position;
+    m_needUpdate = true;
+}
+
+void TextBatchDrawable::setColor(std::size_t index, const sf::Color& color)
+{
+    m_labels[index].color = color;
+    m_needUpdate = true;
+}
+
+sf::FloatRect TextBatchDrawable::getLabelBounds(std::size_t index) const
+{
+    const Label& label = m_labels[index];
+    sf::FloatRect bounds = label.layout.bounds;
+
+    bounds.left += label.position.x;
+    bounds.top += label.position.y;
+
+    return bounds;
+}
+
+sf::FloatRect TextBatchDrawable::getBounds() const
+{
+    update();
+
+    if (m_vertices.empty())
+        return sf::FloatRect();
+
+    float left = m_vertices[0].position.x;
+    float top = m_vertices[0].position.y;
+    float right = left;
+    float bottom = top;
+
+    for (std::size_t i = 1; i < m_vertices.size(); ++i)
+    {
+        const sf::Vector2f& position = m_vertices[i].position;
+
+        left = std::min(left, position.x);
+        top = std::min(top, position.y);
+        right = std::max(right, position.x);
+        bottom = std::max(bottom, position.y);
+    }
+
+    return sf::FloatRect(left, top, right - left, bottom - top);
+}
+
+void TextBatchDrawable::setCacheCapacity(std::size_t capacity)
+{
+    m_cacheCapacity = capacity;
+    evict();
+}
+
+std::size_t TextBatchDrawable::getCacheCapacity() const
+{
+    return m_cacheCapacity;
+}
+
+std::size_t TextBatchDrawable::getCacheSize() const
+{
+    return m_cache.size();
+}
+
+std::size_t TextBatchDrawable::getCacheHits() const
+{
+    return m_cacheHits;
+}
+
+std::size_t TextBatchDrawable::getCacheMisses() const
+{
+    return m_cacheMisses;
+}
+
+void TextBatchDrawable::draw(sf::RenderTarget& target, sf::RenderStates states) const
+{
+    if (!m_font)
+        return;
+
+    update();
+
+    if (m_vertices.empty())
+        return;
+
+    states.texture = &m_font->getTexture(m_characterSize);
+    target.draw(&m_vertices[0], m_vertices.size(), sf::Triangles, states);
+}
+
+void TextBatchDrawable::update() const
+{
+    if (!m_needUpdate)
+        return;
+
+    m_vertices.clear();
+
+    for (std::size_t i = 0; i < m_labels.size(); ++i)
+    {
+        const Label& label = m_labels[i];
+        const std::vector<sf::Vertex>& vertices = label.layout.vertices;
+
+        for (std::size_t j = 0; j < vertices.size(); ++j)
+        {
+            const sf::Vertex& vertex = vertices[j];
+            m_vertices.push_back(sf::Vertex(vertex.position + label.position, label.color, vertex.texCoords));
+        }
+    }
+
+    m_needUpdate = false;
+}
+
+void TextBatchDrawable::relayout()
+{
+    for (std::size_t i = 0; i < m_labels.size(); ++i)
+    {
+        Label& label = m_labels[i];
+        label.layout = getLayout(label.string, label.style);
+    }
+
+    m_needUpdate = true;
+}
+
+const TextBatchDrawable::Layout& TextBatchDrawable::getLayout(const String& string, sf::Uint32 style)
+{
+    Key key;
+    key.string = string;
+    key.characterSize = m_characterSize;
+    key.style = style;
+
+    std::map<Key, Entry>::iterator entry = m_cache.find(key);
+
+    if (entry != m_cache.end())
+    {
+        // move to the most recently used end
+        m_order.splice(m_order.end(), m_order, entry->second.position);
+        ++m_cacheHits;
+
+        return entry->second.layout;
+    }
+
+    ++m_cacheMisses;
+
+    entry = m_cache.insert(std::make_pair(key, Entry())).first;
+    computeLayout(string, style, entry->second.layout);
+    entry->second.position = m_order.insert(m_order.end(), key);
+
+    // eviction starts from the least recently used end, so the entry
+    // just added is kept
+    evict();
+
+    return entry->second.layout;
+}
+
+void TextBatchDrawable::computeLayout(const String& string, sf::Uint32 style, Layout& layout) const
+{
+    layout.vertices.clear();
+    layout.bounds = sf::FloatRect();
+
+    if (m_font && !string.empty())
+        layout.bounds = layoutText(*m_font, string.data(), string.size(), m_characterSize, style, &layout.vertices, NULL, NULL);
+}
+
+void TextBatchDrawable::evict()
+{
+    // the most recently used entry always stays
+    while (m_cache.size() > std::max<std::size_t>(m_cacheCapacity, 1))
+    {
+        m_cache.erase(m_order.front());
+        m_order.pop_front();
+    }
+}
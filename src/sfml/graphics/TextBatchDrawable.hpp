@@ -0,0 +1,105 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_TEXTBATCHDRAWABLE_HPP
+#define PYSFML_GRAPHICS_TEXTBATCHDRAWABLE_HPP
+
+#include <SFML/Graphics.hpp>
+#include <list>
+#include <map>
+#include <string>
+#include <vector>
+
+// Lays out a UTF-32 string exactly like sf::Text and returns its local
+// bounds. The glyph quads are appended to vertices, the widest line's
+// advance and the number of lines are stored in advance and lines; any
+// of the three can be NULL.
+sf::FloatRect layoutText(const sf::Font& font, const sf::Uint32* string, std::size_t length, unsigned int characterSize, sf::Uint32 style, std::vector<sf::Vertex>* vertices, float* advance, std::size_t* lines);
+
+// Many labels sharing one font and character size, drawn with a single
+// draw call. Glyph layouts are computed the same way as sf::Text and
+// cached per (string, size, style) with least-recently-used eviction.
+class TextBatchDrawable : public sf::Drawable
+{
+public:
+    TextBatchDrawable();
+
+    void setFont(const sf::Font* font);
+    void setCharacterSize(unsigned int size);
+    unsigned int getCharacterSize() const;
+
+    std::size_t getLabelCount() const;
+    void resize(std::size_t count);
+    void clear();
+
+    void setString(std::size_t index, const sf::Uint32* string, std::size_t length, sf::Uint32 style);
+    void setPosition(std::size_t index, const sf::Vector2f& position);
+    void setColor(std::size_t index, const sf::Color& color);
+    sf::FloatRect getLabelBounds(std::size_t index) const;
+    sf::FloatRect getBounds() const;
+
+    void setCacheCapacity(std::size_t capacity);
+    std::size_t getCacheCapacity() const;
+    std::size_t getCacheSize() const;
+    std::size_t getCacheHits() const;
+    std::size_t getCacheMisses() const;
+
+private:
+    typedef std::basic_string<sf::Uint32> String;
+
+    struct Layout
+    {
+        std::vector<sf::Vertex> vertices;
+        sf::FloatRect           bounds;
+    };
+
+    struct Key
+    {
+        String       string;
+        unsigned int characterSize;
+        sf::Uint32   style;
+
+        bool operator <(const Key& other) const;
+    };
+
+    struct Entry
+    {
+        Layout                   layout;
+        std::list<Key>::iterator position;
+    };
+
+    struct Label
+    {
+        String       string;
+        sf::Uint32   style;
+        Layout       layout;
+        sf::Vector2f position;
+        sf::Color    color;
+    };
+
+    virtual void draw(sf::RenderTarget& target, sf::RenderStates states) const;
+    void update() const;
+    void relayout();
+
+    const Layout& getLayout(const String& string, sf::Uint32 style);
+    void computeLayout(const String& string, sf::Uint32 style, Layout& layout) const;
+    void evict();
+
+    const sf::Font*                 m_font;
+    unsigned int                    m_characterSize;
+    std::vector<Label>              m_labels;
+    std::map<Key, Entry>            m_cache;
+    std::list<Key>                  m_order;
+    std::size_t                     m_cacheCapacity;
+    std::size_t                     m_cacheHits;
+    std::size_t                     m_cacheMisses;
+    mutable std::vector<sf::Vertex> m_vertices;
+    mutable bool                    m_needUpdate;
+};
+
+#endif // PYSFML_GRAPHICS_TEXTBATCHDRAWABLE_HPP
@@ -4,6 +4,9 @@
 # This file is part of PySFML project and is available under the zlib
 # license.
 
+cimport cython
+from cython.view cimport array as cvarray
+from cpython.buffer cimport PyBUF_ND, PyBUF_STRIDES
 from libcpp.vector cimport vector
 from libcpp.string cimport string
 
@@ -24,12 +27,60 @@ cdef extern from "pysfml/graphics/DerivableRenderWindow.hpp":
         void createWindow()
         void resizeWindow()
 
-from libc.stdlib cimport malloc, free
+cdef extern from "pysfml/graphics/SpriteBatchDrawable.hpp":
+    cdef cppclass SpriteBatchDrawable:
+        SpriteBatchDrawable()
+        void setTexture(const sf.Texture*)
+        size_t getSpriteCount() const
+        void resize(size_t)
+        void clear()
+        void setSprite(size_t, const sf.FloatRect&, const sf.Transform&, const sf.Color&)
+        void setRectangles(size_t, const float*) nogil
+        void setMatrices(size_t, const float*) nogil
+        void setColors(size_t, const Uint8*) nogil
+        sf.FloatRect getBounds() const
+
+cdef extern from "pysfml/graphics/TextBatchDrawable.hpp":
+    sf.FloatRect layoutText(const sf.Font&, const Uint32*, size_t, unsigned int, Uint32, vector[sf.Vertex]*, float*, size_t*)
+
+    cdef cppclass TextBatchDrawable:
+        TextBatchDrawable()
+        void setFont(const sf.Font*)
+        void setCharacterSize(unsigned int)
+        unsigned int getCharacterSize() const
+        size_t getLabelCount() const
+        void resize(size_t)
+        void clear()
+        void setString(size_t, const Uint32*, size_t, Uint32)
+        void setPosition(size_t, const sf.Vector2f&)
+        void setColor(size_t, const sf.Color&)
+        sf.FloatRect getLabelBounds(size_t) const
+        sf.FloatRect getBounds() const
+        void setCacheCapacity(size_t)
+        size_t getCacheCapacity() const
+        size_t getCacheSize() const
+        size_t getCacheHits() const
+        size_t getCacheMisses() const
+
+cdef extern from "pysfml/graphics/RectanglePacker.hpp":
+    cdef cppclass RectanglePacker:
+        RectanglePacker(unsigned int, unsigned int, unsigned int)
+        unsigned int getWidth() const
+        unsigned int getHeight() const
+        float getOccupancy() const
+        bint insert(unsigned int, unsigned int, sf.IntRect&) nogil
+        size_t insertMany(size_t, const unsigned int*, int*) nogil
+        void clear()
+
+from libc.stdlib cimport malloc, calloc, free
+from libc.string cimport memcpy
+from libc.math cimport pow, sin, cos, NAN, M_PI
 
 __all__ = ['BlendMode', 'PrimitiveType', 'Color', 'Rect', 'Transform',
-            'Image', 'Texture', 'Glyph', 'Font', 'Shader',
-            'RenderStates', 'Drawable', 'Transformable', 'Sprite',
-            'Text', 'Shape', 'CircleShape', 'ConvexShape',
+            'Image', 'Texture', 'Glyph', 'Font', 'Shader', 'Uniform', 'UniformBlock',
+            'load_images', 'AssetLoader', 'TextureAtlas', 'StreamingTexture',
+            'RenderStates', 'Drawable', 'Transformable', 'TransformableArray', 'Sprite',
+            'SpriteBatch', 'Text', 'TextBatch', 'Shape', 'CircleShape', 'ConvexShape',
             'RectangleShape', 'Vertex', 'VertexArray', 'View',
             'RenderTarget', 'RenderTexture', 'RenderWindow',
             'HandledWindow', 'TransformableDrawable']
@@ -43,6 +94,14 @@ import sys
 from copy import copy, deepcopy
 from enum import IntEnum
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# UTF-32 in the machine's byte order, without the byte order mark
+UTF32_ENCODING = 'UTF-32-LE' if sys.byteorder == 'little' else 'UTF-32-BE'
+
 from pysfml.system cimport NumericObject
 from pysfml.system cimport Vector2, Vector3
 from pysfml.system cimport to_vector2i, to_vector2f
@@ -336,6 +395,66 @@ cdef class Transform:
         cdef sf.FloatRect p = self.p_this.transformRect(to_floatrect(rectangle))
         return Rect((p.left, p.top), (p.width, p.height))
 
+    @cython.boundscheck(False)
+    def transform_points(self, const float[:, ::1] points, float[:, ::1] out=None):
+        if points.shape[1] != 2:
+            raise ValueError("Points must be a N x 2 array of float32")
+
+        cdef size_t count = points.shape[0]
+        cdef const float* m = self.p_this.getMatrix()
+
+        out = float_array(out, count, 2)
+
+        if count:
+            with nogil: transform_points(m, &points[0, 0], &out[0, 0], count)
+
+        return out
+
+    @cython.boundscheck(False)
+    def transform_rectangles(self, const float[:, ::1] rectangles, float[:, ::1] out=None):
+        if rectangles.shape[1] != 4:
+            raise ValueError("Rectangles must be a N x 4 array of float32")
+
+        cdef size_t count = rectangles.shape[0]
+        cdef const float* m = self.p_this.getMatrix()
+        cdef float corners[8]
+        cdef float left, top, right, bottom
+        cdef size_t i, j
+
+        out = float_array(out, count, 4)
+
+        # like transform_rectangle(), the bounding box of the 4 corners
+        with nogil:
+            for i in range(count):
+                left = rectangles[i, 0]
+                top = rectangles[i, 1]
+                right = left + rectangles[i, 2]
+                bottom = top + rectangles[i, 3]
+                corners[0] = left
+                corners[1] = top
+                corners[2] = left
+                corners[3] = bottom
+                corners[4] = right
+                corners[5] = top
+                corners[6] = right
+                corners[7] = bottom
+                transform_points(m, corners, corners, 4)
+
+                left = right = corners[0]
+                top = bottom = corners[1]
+                for j in range(1, 4):
+                    left = min(left, corners[j * 2])
+                    right = max(right, corners[j * 2])
+                    top = min(top, corners[j * 2 + 1])
+                    bottom = max(bottom, corners[j * 2 + 1])
+
+                out[i, 0] = left
+                out[i, 1] = top
+                out[i, 2] = right - left
+                out[i, 3] = bottom - top
+
+        return out
+
     def combine(self, Transform transform):
         self.p_this.combine(transform.p_this[0])
         return self
@@ -462,8 +581,16 @@ BLEND_ADD = wrap_blendmode(<sf.BlendMode*>&sf.BlendAdd)
 BLEND_MULTIPLY = wrap_blendmode(<sf.BlendMode*>&sf.BlendMultiply)
 BLEND_NONE = wrap_blendmode(<sf.BlendMode*>&sf.BlendNone)
 
+# sf::Image pixels exported as a (height, width, 4) array of bytes
+cdef char* PIXEL_FORMAT = "B"
+
+cdef inline Uint32 pack_rgba(const Uint8* pixel) nogil:
+    return (<Uint32>pixel[0] << 24) | (<Uint32>pixel[1] << 16) | (<Uint32>pixel[2] << 8) | pixel[3]
+
 cdef public class Image[type PyImageType, object PyImageObject]:
     cdef sf.Image *p_this
+    cdef Py_ssize_t m_shape[3]
+    cdef Py_ssize_t m_strides[3]
 
     def __init__(self):
         raise UserWarning("Use a specific constructor")
@@ -488,21 +615,35 @@ cdef public class Image[type PyImageType, object PyImageObject]:
         return wrap_image(p)
 
     def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cdef sf.Vector2u size = self.p_this.getSize()
+
+        self.m_shape[0] = size.y
+        self.m_shape[1] = size.x
+        self.m_shape[2] = 4
+        self.m_strides[0] = size.x * 4
+        self.m_strides[1] = 4
+        self.m_strides[2] = 1
+
+        # the pixel array is never reallocated after creation, exporting
+        # it writable is safe for the lifetime of the image
         buffer.buf = <char*>self.p_this.getPixelsPtr()
-        buffer.format = 'c'
+        buffer.format = PIXEL_FORMAT
         buffer.internal = NULL
         buffer.itemsize = 1
-        buffer.len = self.p_this.getSize().x * self.p_this.getSize().y * 4
-        buffer.ndim = 1
+        buffer.len = size.x * size.y * 4
+        buffer.ndim = 3 if flags & PyBUF_ND else 1
         buffer.obj = self
-        buffer.readonly = 1
-        buffer.shape = NULL
-        buffer.strides = NULL
+        buffer.readonly = 0
+        buffer.shape = self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = self.m_strides if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
         buffer.suboffsets = NULL
 
     def __releasebuffer__(self, Py_buffer *buffer):
         pass
 
+    cdef Uint8* _pixels(self):
+        return <Uint8*>self.p_this.getPixelsPtr()
+
     @classmethod
     def create(cls, unsigned int width, unsigned int height, Color color=None):
         cdef sf.Image *p = new sf.Image()
@@ -536,8 +677,13 @@ cdef public class Image[type PyImageType, object PyImageObject]:
     @classmethod
     def from_file(cls, basestring filename):
         cdef sf.Image *p = new sf.Image()
+        cdef string path = filename.encode('UTF-8')
+        cdef bint loaded
+
+        # decoding doesn't touch Python objects nor OpenGL
+        with nogil: loaded = p.loadFromFile(path)
 
-        if p.loadFromFile(filename.encode('UTF-8')):
+        if loaded:
             return wrap_image(p)
 
         del p
@@ -546,8 +692,13 @@ cdef public class Image[type PyImageType, object PyImageObject]:
     @classmethod
     def from_memory(cls, bytes data):
         cdef sf.Image *p = new sf.Image()
+        cdef const char* cdata = <char*>data
+        cdef size_t cdata_len = len(data)
+        cdef bint loaded
 
-        if p.loadFromMemory(<char*>data, len(data)):
+        with nogil: loaded = p.loadFromMemory(cdata, cdata_len)
+
+        if loaded:
             return wrap_image(p)
 
         del p
@@ -590,6 +741,145 @@ cdef public class Image[type PyImageType, object PyImageObject]:
     def flip_vertically(self):
         self.p_this.flipVertically()
 
+    def fill_rect(self, rectangle, Color color not None):
+        cdef sf.Vector2u size = self.p_this.getSize()
+        cdef sf.IntRect rect = to_intrect(rectangle)
+        cdef sf.Color c = color.p_this[0]
+        cdef Uint8* pixels = self._pixels()
+        cdef int left = max(rect.left, 0)
+        cdef int top = max(rect.top, 0)
+        cdef int right = min(rect.left + rect.width, <int>size.x)
+        cdef int bottom = min(rect.top + rect.height, <int>size.y)
+        cdef int x, y
+        cdef Uint8* pixel
+
+        with nogil:
+            for y in range(top, bottom):
+                pixel = pixels + (y * size.x + left) * 4
+                for x in range(left, right):
+                    pixel[0] = c.r
+                    pixel[1] = c.g
+                    pixel[2] = c.b
+                    pixel[3] = c.a
+                    pixel += 4
+
+    def premultiply_alpha(self):
+        cdef Uint8* pixel = self._pixels()
+        cdef size_t count = self.p_this.getSize().x * self.p_this.getSize().y
+        cdef size_t i
+        cdef unsigned int a
+
+        with nogil:
+            for i in range(count):
+                a = pixel[3]
+                pixel[0] = (pixel[0] * a + 127) // 255
+                pixel[1] = (pixel[1] * a + 127) // 255
+                pixel[2] = (pixel[2] * a + 127) // 255
+                pixel += 4
+
+    def unpremultiply_alpha(self):
+        cdef Uint8* pixel = self._pixels()
+        cdef size_t count = self.p_this.getSize().x * self.p_this.getSize().y
+        cdef size_t i
+        cdef unsigned int a
+
+        with nogil:
+            for i in range(count):
+                a = pixel[3]
+                if a == 0:
+                    pixel[0] = pixel[1] = pixel[2] = 0
+                elif a < 255:
+                    pixel[0] = min((pixel[0] * 255 + a // 2) // a, 255)
+                    pixel[1] = min((pixel[1] * 255 + a // 2) // a, 255)
+                    pixel[2] = min((pixel[2] * 255 + a // 2) // a, 255)
+                pixel += 4
+
+    def mask_colors(self, colors, Uint8 alpha=0):
+        cdef list keys = sorted(pack_rgba(<Uint8*>&(<Color?>color).p_this.r) for color in colors)
+        cdef size_t n = len(keys)
+        cdef Uint8* pixel = self._pixels()
+        cdef size_t count = self.p_this.getSize().x * self.p_this.getSize().y
+        cdef Uint32* table
+        cdef size_t i, low, high, middle
+        cdef Uint32 value
+
+        if n == 0:
+            return
+
+        table = <Uint32*>malloc(n * sizeof(Uint32))
+        if table is NULL:
+            raise MemoryError()
+
+        for i in range(n):
+            table[i] = keys[i]
+
+        # like create_mask_from_color() but for many colors in one pass,
+        # each pixel is looked up in the sorted color table
+        with nogil:
+            for i in range(count):
+                value = pack_rgba(pixel)
+                low = 0
+                high = n
+                while low < high:
+                    middle = (low + high) // 2
+                    if table[middle] < value:
+                        low = middle + 1
+                    else:
+                        high = middle
+                if low < n and table[low] == value:
+                    pixel[3] = alpha
+                pixel += 4
+
+        free(table)
+
+    def swizzle(self, order):
+        cdef int index[4]
+        cdef Uint8* pixel = self._pixels()
+        cdef size_t count = self.p_this.getSize().x * self.p_this.getSize().y
+        cdef size_t i
+        cdef Uint8 source[4]
+
+        if isinstance(order, (str, unicode)):
+            order = ["rgba".index(channel) for channel in order.lower()]
+
+        if len(order) != 4 or not all(0 <= channel < 4 for channel in order):
+            raise ValueError("Expected four channels, such as 'bgra' or (2, 1, 0, 3)")
+
+        for i in range(4):
+            index[i] = order[i]
+
+        with nogil:
+            for i in range(count):
+                source[0] = pixel[0]
+                source[1] = pixel[1]
+                source[2] = pixel[2]
+                source[3] = pixel[3]
+                pixel[0] = source[index[0]]
+                pixel[1] = source[index[1]]
+                pixel[2] = source[index[2]]
+                pixel[3] = source[index[3]]
+                pixel += 4
+
+    def apply_gamma(self, float gamma):
+        cdef Uint8 table[256]
+        cdef Uint8* pixel = self._pixels()
+        cdef size_t count = self.p_this.getSize().x * self.p_this.getSize().y
+        cdef size_t i
+
+        if gamma <= 0:
+            raise ValueError("Gamma must be positive")
+
+        with nogil:
+            for i in range(256):
+                table[i] = <Uint8>(pow(i / 255.0, gamma) * 255.0 + 0.5)
+
+            # alpha is left untouched
+            for i in range(count):
+                pixel[0] = table[pixel[0]]
+                pixel[1] = table[pixel[1]]
+                pixel[2] = table[pixel[2]]
+                pixel += 4
+
 
 cdef api Image wrap_image(sf.Image *p):
     cdef Image r = Image.__new__(Image)
@@ -644,14 +934,19 @@ cdef public class Texture[type PyTextureType, object PyTextureObject]:
     @classmethod
     def from_file(cls, basestring filename, area=None):
         cdef sf.Texture *p = new sf.Texture()
+        cdef string path = filename.encode('UTF-8')
+        cdef sf.IntRect rect
+        cdef bint loaded
 
         if not area:
-            if p.loadFromFile(filename.encode('UTF-8')):
-                return wrap_texture(p, True)
+            with nogil: loaded = p.loadFromFile(path)
         else:
             l, t, w, h = area
-            if p.loadFromFile(filename.encode('UTF-8'), sf.IntRect(l, t, w, h)):
-                return wrap_texture(p, True)
+            rect = sf.IntRect(l, t, w, h)
+            with nogil: loaded = p.loadFromFile(path, rect)
+
+        if loaded:
+            return wrap_texture(p, True)
 
         del p
         raise IOError(popLastErrorMessage())
@@ -805,6 +1100,230 @@ cdef api Texture wrap_texture(sf.Texture *p, bint d):
     return r
 
 
+cdef void add_region(vector[sf.IntRect]& regions, sf.IntRect region) nogil:
+    cdef size_t i = 0
+    cdef sf.IntRect other
+    cdef int right, bottom
+
+    # merge with every region it overlaps or touches, the grown region
+    # may now reach others so the scan starts over after each merge
+    while i < regions.size():
+        other = regions[i]
+
+        if (region.left <= other.left + other.width and other.left <= region.left + region.width and
+                region.top <= other.top + other.height and other.top <= region.top + region.height):
+            right = max(region.left + region.width, other.left + other.width)
+            bottom = max(region.top + region.height, other.top + other.height)
+            region.left = min(region.left, other.left)
+            region.top = min(region.top, other.top)
+            region.width = right - region.left
+            region.height = bottom - region.top
+
+            regions.erase(regions.begin() + i)
+            i = 0
+        else:
+            i += 1
+
+    regions.push_back(region)
+
+    # past a few scattered regions a single upload is cheaper
+    if regions.size() > 16:
+        region = regions[0]
+
+        for i in range(1, regions.size()):
+            other = regions[i]
+            right = max(region.left + region.width, other.left + other.width)
+            bottom = max(region.top + region.height, other.top + other.height)
+            region.left = min(region.left, other.left)
+            region.top = min(region.top, other.top)
+            region.width = right - region.left
+            region.height = bottom - region.top
+
+        regions.clear()
+        regions.push_back(region)
+
+cdef class StreamingTexture:
+    cdef Texture            m_front
+    cdef Texture            m_back
+    cdef Uint8*             m_pixels
+    cdef Uint8*             m_scratch
+    cdef unsigned int       m_width
+    cdef unsigned int       m_height
+    cdef vector[sf.IntRect] m_dirty
+    cdef vector[sf.IntRect] m_missing
+    cdef Py_ssize_t         m_shape[3]
+    cdef Py_ssize_t         m_strides[3]
+    cdef size_t             m_uploadedBytes
+
+    def __init__(self, unsigned int width, unsigned int height, bint double_buffered=False):
+        self.m_front = Texture.create(width, height)
+
+        if double_buffered:
+            self.m_back = Texture.create(width, height)
+
+        self.m_width = width
+        self.m_height = height
+        self.m_pixels = <Uint8*>calloc(width * height * 4, 1)
+
+        if self.m_pixels is NULL:
+            raise MemoryError()
+
+        # the textures start with undefined content
+        self.invalidate()
+
+    def __dealloc__(self):
+        free(self.m_pixels)
+        free(self.m_scratch)
+
+    def __repr__(self):
+        return "StreamingTexture(size={0}, double_buffered={1})".format(self.size, self.double_buffered)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        self.m_shape[0] = self.m_height
+        self.m_shape[1] = self.m_width
+        self.m_shape[2] = 4
+        self.m_strides[0] = self.m_width * 4
+        self.m_strides[1] = 4
+        self.m_strides[2] = 1
+
+        buffer.buf = <char*>self.m_pixels
+        buffer.format = PIXEL_FORMAT
+        buffer.internal = NULL
+        buffer.itemsize = 1
+        buffer.len = self.m_width * self.m_height * 4
+        buffer.ndim = 3 if flags & PyBUF_ND else 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = self.m_strides if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+    property texture:
+        def __get__(self):
+            return self.m_front
+
+    property size:
+        def __get__(self):
+            return Vector2(self.m_width, self.m_height)
+
+    property double_buffered:
+        def __get__(self):
+            return self.m_back is not None
+
+    property dirty_regions:
+        def __get__(self):
+            return [wrap_intrect(&self.m_dirty[i]) for i in range(self.m_dirty.size())]
+
+    property uploaded_bytes:
+        def __get__(self):
+            return self.m_uploadedBytes
+
+    def invalidate(self, rectangle=None):
+        cdef sf.IntRect region
+
+        if rectangle is None:
+            region = sf.IntRect(0, 0, self.m_width, self.m_height)
+        else:
+            region = to_intrect(rectangle)
+
+        # clip to the texture
+        if region.left < 0:
+            region.width += region.left
+            region.left = 0
+        if region.top < 0:
+            region.height += region.top
+            region.top = 0
+
+        region.width = min(region.width, <int>self.m_width - region.left)
+        region.height = min(region.height, <int>self.m_height - region.top)
+
+        if region.width > 0 and region.height > 0:
+            add_region(self.m_dirty, region)
+
+    def blit(self, Image source, dest=(0, 0)):
+        cdef sf.Vector2u size = source.p_this.getSize()
+        cdef const Uint8* pixels = source.p_this.getPixelsPtr()
+        cdef int x, y
+        cdef int left, top, width, height, row
+
+        x, y = dest
+        left = max(x, 0)
+        top = max(y, 0)
+        width = min(x + <int>size.x, <int>self.m_width) - left
+        height = min(y + <int>size.y, <int>self.m_height) - top
+
+        if width <= 0 or height <= 0:
+            return
+
+        with nogil:
+            for row in range(height):
+                memcpy(self.m_pixels + ((top + row) * self.m_width + left) * 4,
+                       pixels + ((top - y + row) * size.x + (left - x)) * 4,
+                       width * 4)
+
+        add_region(self.m_dirty, sf.IntRect(left, top, width, height))
+
+    cdef int _upload(self, Texture texture, vector[sf.IntRect]& regions) except -1:
+        cdef sf.IntRect region
+        cdef const Uint8* pixels
+        cdef size_t i
+        cdef int row
+
+        for i in range(regions.size()):
+            region = regions[i]
+
+            if region.width != <int>self.m_width and self.m_scratch is NULL:
+                self.m_scratch = <Uint8*>malloc(self.m_width * self.m_height * 4)
+
+                if self.m_scratch is NULL:
+                    raise MemoryError()
+
+            with nogil:
+                if region.width == <int>self.m_width:
+                    # full rows are contiguous in the buffer
+                    pixels = self.m_pixels + region.top * self.m_width * 4
+                else:
+                    for row in range(region.height):
+                        memcpy(self.m_scratch + row * region.width * 4,
+                               self.m_pixels + ((region.top + row) * self.m_width + region.left) * 4,
+                               region.width * 4)
+
+                    pixels = self.m_scratch
+
+                texture.p_this.update(pixels, region.width, region.height, region.left, region.top)
+
+            self.m_uploadedBytes += region.width * region.height * 4
+
+        return 0
+
+    def flush(self):
+        cdef size_t count = self.m_dirty.size()
+        cdef size_t i
+        cdef Texture texture
+
+        if self.m_back is None:
+            self._upload(self.m_front, self.m_dirty)
+        else:
+            # the back texture missed the regions uploaded to the front
+            # one during the previous flush; it's updated while the front
+            # texture may still be in use by pending draws, then they swap
+            for i in range(count):
+                add_region(self.m_missing, self.m_dirty[i])
+
+            self._upload(self.m_back, self.m_missing)
+
+            self.m_missing = self.m_dirty
+            texture = self.m_front
+            self.m_front = self.m_back
+            self.m_back = texture
+
+        self.m_dirty.clear()
+        return count
+
+
 cdef class Glyph:
     cdef sf.Glyph *p_this
 
@@ -860,8 +1379,12 @@ cdef class Font:
     @classmethod
     def from_file(cls, basestring filename):
         cdef sf.Font *p = new sf.Font()
+        cdef string path = filename.encode('UTF-8')
+        cdef bint loaded
+
+        with nogil: loaded = p.loadFromFile(path)
 
-        if p.loadFromFile(filename.encode('UTF-8')):
+        if loaded:
             return wrap_font(p)
 
         del p
@@ -882,6 +1405,65 @@ cdef class Font:
         p[0] = self.p_this.getGlyph(code_point, character_size, bold)
         return wrap_glyph(p)
 
+    def preload(self, charset, sizes, bint bold=False):
+        cdef bytes data
+        cdef const Uint32* codes
+        cdef size_t count, i, j
+        cdef vector[unsigned int] character_sizes
+
+        if not isinstance(charset, unicode):
+            charset = u"".join(u"%c" % c if isinstance(c, int) else c for c in charset)
+
+        if isinstance(sizes, int):
+            sizes = [sizes]
+
+        for size in sizes:
+            character_sizes.push_back(size)
+
+        data = charset.encode(UTF32_ENCODING)
+        codes = <const Uint32*><char*>data
+        count = len(data) // 4
+
+        # rasterizing the glyphs now grows the glyph pages up front
+        # instead of during the first frame that shows them; this updates
+        # the font's textures, so the GIL is kept to serialize it with
+        # drawing
+        for j in range(character_sizes.size()):
+            for i in range(count):
+                self.p_this.getGlyph(codes[i], character_sizes[j], bold)
+
+    def measure(self, strings, unsigned int character_size, Uint32 style=sf.text.Regular):
+        cdef bytes data
+        cdef const Uint32* codes
+        cdef size_t count
+        cdef float advance
+        cdef size_t lines
+        cdef sf.FloatRect bounds
+        cdef int line_spacing = self.p_this.getLineSpacing(character_size)
+        cdef list results = []
+
+        single = type(strings) in string_type
+
+        if single:
+            strings = [strings]
+
+        # (advance, height, bounds) per string, the bounds being the
+        # local_bounds a Text would have; missing glyphs get rasterized
+        # like in preload(), so the GIL is kept
+        for string in strings:
+            if isinstance(string, bytes):
+                string = string.decode('UTF-8')
+
+            data = (<unicode?>string).encode(UTF32_ENCODING)
+            codes = <const Uint32*><char*>data
+            count = len(data) // 4
+
+            bounds = layoutText(self.p_this[0], codes, count, character_size, style, NULL, &advance, &lines)
+
+            results.append((advance, lines * line_spacing, wrap_floatrect(&bounds)))
+
+        return results[0] if single else results
+
     def get_kerning(self, Uint32 first, Uint32 second, unsigned int character_size):
         return self.p_this.getKerning(first, second, character_size)
 
@@ -906,9 +1488,299 @@ cdef Font wrap_font(sf.Font *p, bint d=True):
     r.delete_this = d
     return r
 
+def load_images(filenames, workers=None):
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Image.from_file() releases the GIL while decoding
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(Image.from_file, filenames))
+
+
+class AssetLoader(object):
+    def __init__(self, workers=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.executor = ThreadPoolExecutor(workers)
+        self._uploads = queue.Queue()
+        self._outstanding = 0
+
+    def __repr__(self):
+        return "AssetLoader(outstanding={0})".format(self._outstanding)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def load_image(self, basestring filename):
+        return self.executor.submit(Image.from_file, filename)
+
+    def load_font(self, basestring filename):
+        return self.executor.submit(Font.from_file, filename)
+
+    def load_texture(self, basestring filename, area=None, bint smooth=False, bint repeated=False):
+        from concurrent.futures import Future
+
+        texture = Future()
+        image = self.executor.submit(Image.from_file, filename)
+        image.add_done_callback(lambda image: self._uploads.put((image, texture, area, smooth, repeated)))
+
+        self._outstanding += 1
+        return texture
+
+    @property
+    def outstanding(self):
+        return self._outstanding
+
+    def process(self, limit=None, bint block=False):
+        # the decoded images are uploaded here, call it from the thread
+        # owning the OpenGL context (usually once per frame)
+        count = 0
+
+        while limit is None or count < limit:
+            try:
+                image, texture, area, smooth, repeated = self._uploads.get(block and count == 0)
+            except queue.Empty:
+                break
+
+            self._outstanding -= 1
+            count += 1
+
+            if not texture.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = Texture.from_image(image.result(), area)
+                result.smooth = smooth
+                result.repeated = repeated
+            except Exception as error:
+                texture.set_exception(error)
+            else:
+                texture.set_result(result)
+
+        return count
+
+    def wait(self):
+        while self._outstanding:
+            self.process(block=True)
+
+    def close(self, bint wait=True):
+        self.executor.shutdown(wait)
+
+        if wait:
+            self.wait()
+
+
+cdef class TextureAtlas:
+    cdef vector[RectanglePacker*] m_packers
+    cdef list m_images
+    cdef list m_textures
+    cdef set m_dirty
+    cdef dict m_regions
+    cdef unsigned int m_pageSize
+    cdef unsigned int m_padding
+    cdef bint m_smooth
+
+    def __init__(self, unsigned int page_size=0, unsigned int padding=1, bint smooth=False):
+        cdef unsigned int maximum = sf.texture.getMaximumSize()
+
+        if page_size == 0:
+            page_size = min(maximum, 4096)
+
+        if page_size > maximum:
+            raise ValueError("Page size exceeds the maximum texture size ({0})".format(maximum))
+
+        self.m_images = []
+        self.m_textures = []
+        self.m_dirty = set()
+        self.m_regions = {}
+        self.m_pageSize = page_size
+        self.m_padding = padding
+        self.m_smooth = smooth
+
+    def __dealloc__(self):
+        for packer in self.m_packers:
+            del packer
+
+    def __repr__(self):
+        return "TextureAtlas(regions={0}, pages={1})".format(len(self), self.page_count)
+
+    def __len__(self):
+        return len(self.m_regions)
+
+    def __contains__(self, name):
+        return name in self.m_regions
+
+    def __iter__(self):
+        return iter(self.m_regions)
+
+    def __getitem__(self, name):
+        page, left, top, width, height = self.m_regions[name]
+        return Rect((left, top), (width, height))
+
+    def page(self, name):
+        return self.m_regions[name][0]
+
+    def texture(self, name):
+        self.update()
+        return self.m_textures[self.m_regions[name][0]]
+
+    def get(self, name):
+        return self.texture(name), self[name]
+
+    property page_count:
+        def __get__(self):
+            return self.m_packers.size()
+
+    property page_size:
+        def __get__(self):
+            return self.m_pageSize
+
+    property textures:
+        def __get__(self):
+            self.update()
+            return list(self.m_textures)
+
+    property occupancy:
+        def __get__(self):
+            return [packer.getOccupancy() for packer in self.m_packers]
+
+    def add(self, name, image):
+        self.add_many([(name, image)])
+        return self[name]
+
+    def add_many(self, items):
+        cdef size_t count, i, page, placed, left
+        cdef unsigned int* sizes
+        cdef int* rectangles
+        cdef RectanglePacker* packer
+        cdef Image source
+        cdef sf.Vector2u size
+        cdef list pending
+
+        if isinstance(items, dict):
+            items = items.items()
+
+        names, images = [], []
+        for name, image in items:
+            names.append(name)
+            images.append(image)
+
+        # the packer can't free a region, a replaced one would be lost
+        duplicates = [name for name in names if name in self.m_regions]
+        if len(set(names)) != len(names):
+            duplicates += [name for name in set(names) if names.count(name) > 1]
+
+        if duplicates:
+            raise ValueError("Regions already in the atlas: {0}".format(", ".join(str(name) for name in duplicates)))
+
+        # files are decoded in parallel
+        filenames = [index for index, image in enumerate(images) if not isinstance(image, Image)]
+        for index, image in zip(filenames, load_images([images[index] for index in filenames])):
+            images[index] = image
+
+        count = len(images)
+        if count == 0:
+            return
+
+        for image in images:
+            size = (<Image>image).p_this.getSize()
+            if size.x + self.m_padding > self.m_pageSize or size.y + self.m_padding > self.m_pageSize:
+                raise ValueError("Image of size {0}x{1} doesn't fit in a page".format(size.x, size.y))
+
+        sizes = <unsigned int*>malloc(count * 2 * sizeof(unsigned int))
+        rectangles = <int*>malloc(count * 4 * sizeof(int))
+
+        if sizes is NULL or rectangles is NULL:
+            free(sizes)
+            free(rectangles)
+            raise MemoryError()
+
+        try:
+            pending = list(range(count))
+            page = 0
+
+            # fill the existing pages first so insertion stays incremental,
+            # then open new pages for what is left
+            while pending:
+                if page == self.m_packers.size():
+                    self._add_page()
+
+                packer = self.m_packers[page]
+                left = len(pending)
+
+                for i in range(left):
+                    size = (<Image>images[pending[i]]).p_this.getSize()
+                    sizes[i * 2] = size.x
+                    sizes[i * 2 + 1] = size.y
+
+                with nogil:
+                    placed = packer.insertMany(left, sizes, rectangles)
+
+                remaining = []
+
+                for i in range(left):
+                    index = pending[i]
+
+                    if rectangles[i * 4 + 2] == 0 and sizes[i * 2] != 0:
+                        remaining.append(index)
+                        continue
+
+                    source = images[index]
+                    (<Image>self.m_images[page]).p_this.copy(source.p_this[0], rectangles[i * 4], rectangles[i * 4 + 1])
+                    self.m_regions[names[index]] = (page, rectangles[i * 4], rectangles[i * 4 + 1], rectangles[i * 4 + 2], rectangles[i * 4 + 3])
+
+                if placed:
+                    self.m_dirty.add(page)
+
+                pending = remaining
+                page += 1
+        finally:
+            free(sizes)
+            free(rectangles)
+
+    cdef _add_page(self):
+        self.m_packers.push_back(new RectanglePacker(self.m_pageSize, self.m_pageSize, self.m_padding))
+        self.m_images.append(Image.create(self.m_pageSize, self.m_pageSize, Color(0, 0, 0, 0)))
+        self.m_textures.append(None)
+
+    def update(self):
+        # upload the pages that received new images since the last call
+        for page in sorted(self.m_dirty):
+            if self.m_textures[page] is None:
+                texture = Texture.from_image(self.m_images[page])
+                texture.smooth = self.m_smooth
+                self.m_textures[page] = texture
+            else:
+                self.m_textures[page].update_from_image(self.m_images[page])
+
+        self.m_dirty.clear()
+
+    def clear(self):
+        for packer in self.m_packers:
+            del packer
+
+        self.m_packers.clear()
+        self.m_images = []
+        self.m_textures = []
+        self.m_dirty.clear()
+        self.m_regions.clear()
+
+
+cdef bytes encode_uniform_name(name):
+    # byte strings are passed as is, text is encoded
+    if isinstance(name, bytes):
+        return name
+    elif isinstance(name, unicode):
+        return (<unicode>name).encode('UTF-8')
+
+    raise TypeError("Uniform name must be a string")
+
 cdef class Shader:
     cdef sf.Shader *p_this
     cdef bint              delete_this
+    cdef dict              m_uniforms
 
     def __init__(self):
         raise UserWarning("Use a specific constructor")
@@ -1083,6 +1955,20 @@ cdef class Shader:
 
         self.p_this.setParameter(encoded_name, sf.shader.CurrentTexture)
 
+    def uniform(self, name):
+        if self.m_uniforms is None:
+            self.m_uniforms = {}
+
+        cdef Uniform uniform = self.m_uniforms.get(name)
+
+        if uniform is None:
+            uniform = Uniform.__new__(Uniform)
+            uniform.m_shader = self
+            uniform.m_name = encode_uniform_name(name)
+            self.m_uniforms[name] = uniform
+
+        return uniform
+
     @staticmethod
     def bind(Shader shader=None):
         if not shader:
@@ -1102,6 +1988,155 @@ cdef Shader wrap_shader(sf.Shader *p, bint d=True):
     return r
 
 
+cdef class Uniform:
+    cdef Shader  m_shader
+    cdef string  m_name
+    cdef Texture m_texture
+
+    def __init__(self):
+        raise UserWarning("Use Shader.uniform() to get a uniform")
+
+    def __repr__(self):
+        return "Uniform(name={0})".format(self.name)
+
+    property name:
+        def __get__(self):
+            return self.m_name.decode('UTF-8')
+
+    property shader:
+        def __get__(self):
+            return self.m_shader
+
+    def set_float(self, float x):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), x)
+
+    def set_vec2(self, float x, float y):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), x, y)
+
+    def set_vec3(self, float x, float y, float z):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), x, y, z)
+
+    def set_vec4(self, float x, float y, float z, float w):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), x, y, z, w)
+
+    def set_color(self, Color color not None):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), color.p_this[0])
+
+    def set_transform(self, Transform transform not None):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), transform.p_this[0])
+
+    def set_texture(self, Texture texture not None):
+        # the shader only keeps a pointer to the texture
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), texture.p_this[0])
+        self.m_texture = texture
+
+    def set_current_texture(self):
+        self.m_shader.p_this.setParameter(self.m_name.c_str(), sf.shader.CurrentTexture)
+
+
+cdef class UniformBlock:
+    cdef Shader         m_shader
+    cdef vector[string] m_names
+    cdef vector[size_t] m_sizes
+    cdef dict           m_offsets
+    cdef float[::1]     m_values
+
+    def __init__(self, Shader shader not None):
+        self.m_shader = shader
+        self.m_offsets = {}
+        self.m_values = cvarray(shape=(1,), itemsize=sizeof(float), format="f")[:0]
+
+    def __repr__(self):
+        return "UniformBlock(uniforms={0}, size={1})".format(len(self), self.size)
+
+    def __len__(self):
+        return self.m_names.size()
+
+    def __contains__(self, name):
+        return name in self.m_offsets
+
+    def __getitem__(self, name):
+        # the offset of the uniform in values
+        return self.m_offsets[name][0]
+
+    property shader:
+        def __get__(self):
+            return self.m_shader
+
+    property size:
+        def __get__(self):
+            return self.m_values.shape[0]
+
+    property values:
+        def __get__(self):
+            # a view of the current storage, which add() replaces; take
+            # it again after adding uniforms
+            return self.m_values
+
+    def add(self, name, size_t size=1):
+        # 6 floats are an affine transform, laid out as in
+        # SpriteBatch.set_matrices; the values are copied to a larger
+        # array, views of the previous values are not updated anymore
+        cdef bytes encoded_name = encode_uniform_name(name)
+
+        if size not in (1, 2, 3, 4, 6):
+            raise ValueError("Size must be 1, 2, 3, 4 or 6")
+
+        if name in self.m_offsets:
+            raise ValueError("Uniform {0} is already in the block".format(name))
+
+        cdef size_t offset = self.m_values.shape[0]
+        cdef float[::1] values = cvarray(shape=(offset + size,), itemsize=sizeof(float), format="f")
+
+        values[:offset] = self.m_values
+        values[offset:] = 0
+
+        self.m_names.push_back(encoded_name)
+        self.m_sizes.push_back(size)
+        self.m_offsets[name] = (offset, size)
+        self.m_values = values
+
+        return offset
+
+    def set(self, name, *values):
+        cdef size_t i, offset, size
+        offset, size = self.m_offsets[name]
+
+        if len(values) != size:
+            raise ValueError("Uniform {0} takes {1} values".format(name, size))
+
+        for i in range(size):
+            self.m_values[offset + i] = values[i]
+
+    @cython.boundscheck(False)
+    def apply(self, const float[::1] values=None):
+        if values is None:
+            values = self.m_values
+
+        if values.shape[0] != self.m_values.shape[0]:
+            raise ValueError("Values must be a 1-D array of {0} float32".format(self.m_values.shape[0]))
+
+        cdef sf.Shader *p = self.m_shader.p_this
+        cdef size_t i, offset = 0
+        cdef const float* v
+
+        for i in range(self.m_names.size()):
+            v = &values[offset]
+
+            if self.m_sizes[i] == 1:
+                p.setParameter(self.m_names[i].c_str(), v[0])
+            elif self.m_sizes[i] == 2:
+                p.setParameter(self.m_names[i].c_str(), v[0], v[1])
+            elif self.m_sizes[i] == 3:
+                p.setParameter(self.m_names[i].c_str(), v[0], v[1], v[2])
+            elif self.m_sizes[i] == 4:
+                p.setParameter(self.m_names[i].c_str(), v[0], v[1], v[2], v[3])
+            else:
+                p.setParameter(self.m_names[i].c_str(), sf.Transform(v[0], v[1], v[2], v[3], v[4], v[5], 0, 0, 1))
+
+            offset += self.m_sizes[i]
+
+
 cdef public class RenderStates[type PyRenderStatesType, object PyRenderStatesObject]:
     DEFAULT = wrap_renderstates(<sf.RenderStates*>&sf.renderstates.Default, False)
 
@@ -1265,6 +2300,258 @@ cdef Transformable wrap_transformable(sf.Transformable *p):
     r.p_this = p
     return r
 
+cdef float[:, ::1] resize_array(float[:, ::1] array, Py_ssize_t count, float fill):
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t columns = array.shape[1]
+    cdef Py_ssize_t kept = min(count, array.shape[0])
+    cdef float[:, ::1] resized = cvarray(shape=(max(count, 1), columns), itemsize=sizeof(float), format="f")
+
+    resized[:kept, :] = array[:kept, :]
+
+    for i in range(kept, count):
+        for j in range(columns):
+            resized[i, j] = fill
+
+    return resized[:count]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef size_t compute_matrices(float[:, ::1] positions, float[:, ::1] origins, float[:, ::1] rotations, float[:, ::1] scales, float[:, ::1] previous, float[:, ::1] matrices) nogil:
+    cdef size_t i, updated = 0
+    cdef float angle, cosine, sine, sxc, syc, sxs, sys
+
+    for i in range(matrices.shape[0]):
+        if (positions[i, 0] == previous[i, 0] and positions[i, 1] == previous[i, 1] and
+            origins[i, 0] == previous[i, 2] and origins[i, 1] == previous[i, 3] and
+            rotations[i, 0] == previous[i, 4] and
+            scales[i, 0] == previous[i, 5] and scales[i, 1] == previous[i, 6]):
+            continue
+
+        # same as sf::Transformable::getTransform(), rows of the matrix
+        # laid out as (a00, a01, a02, a10, a11, a12)
+        angle = -rotations[i, 0] * M_PI / 180.0
+        cosine = cos(angle)
+        sine = sin(angle)
+        sxc = scales[i, 0] * cosine
+        syc = scales[i, 1] * cosine
+        sxs = scales[i, 0] * sine
+        sys = scales[i, 1] * sine
+
+        matrices[i, 0] = sxc
+        matrices[i, 1] = sys
+        matrices[i, 2] = -origins[i, 0] * sxc - origins[i, 1] * sys + positions[i, 0]
+        matrices[i, 3] = -sxs
+        matrices[i, 4] = syc
+        matrices[i, 5] = origins[i, 0] * sxs - origins[i, 1] * syc + positions[i, 1]
+
+        previous[i, 0] = positions[i, 0]
+        previous[i, 1] = positions[i, 1]
+        previous[i, 2] = origins[i, 0]
+        previous[i, 3] = origins[i, 1]
+        previous[i, 4] = rotations[i, 0]
+        previous[i, 5] = scales[i, 0]
+        previous[i, 6] = scales[i, 1]
+
+        updated += 1
+
+    return updated
+
+cdef class TransformableArray:
+    cdef float[:, ::1] m_positions
+    cdef float[:, ::1] m_origins
+    cdef float[:, ::1] m_rotations
+    cdef float[:, ::1] m_scales
+    cdef float[:, ::1] m_previous
+    cdef float[:, ::1] m_matrices
+
+    def __init__(self, size_t count=0):
+        self.m_positions = float_array(None, 0, 2)
+        self.m_origins = float_array(None, 0, 2)
+        self.m_rotations = float_array(None, 0, 1)
+        self.m_scales = float_array(None, 0, 2)
+        self.m_previous = float_array(None, 0, 7)
+        self.m_matrices = float_array(None, 0, 6)
+
+        self.resize(count)
+
+    def __repr__(self):
+        return "TransformableArray(length={0})".format(len(self))
+
+    def __len__(self):
+        return self.m_matrices.shape[0]
+
+    def resize(self, size_t count):
+        # existing entries are kept, new ones start as identity transforms;
+        # arrays obtained before resizing keep pointing to the old storage
+        self.m_positions = resize_array(self.m_positions, count, 0)
+        self.m_origins = resize_array(self.m_origins, count, 0)
+        self.m_rotations = resize_array(self.m_rotations, count, 0)
+        self.m_scales = resize_array(self.m_scales, count, 1)
+        self.m_previous = resize_array(self.m_previous, count, NAN)
+        self.m_matrices = resize_array(self.m_matrices, count, 0)
+
+    property positions:
+        def __get__(self):
+            return self.m_positions
+
+    property origins:
+        def __get__(self):
+            return self.m_origins
+
+    property rotations:
+        def __get__(self):
+            return self.m_rotations[:, 0]
+
+    property scales:
+        def __get__(self):
+            return self.m_scales
+
+    property matrices:
+        def __get__(self):
+            self.update()
+            return self.m_matrices
+
+    def update(self):
+        # entries are dirty when they differ from the values their matrix
+        # was last computed from, so arrays can be written to directly
+        cdef size_t updated
+
+        with nogil:
+            updated = compute_matrices(self.m_positions, self.m_origins, self.m_rotations, self.m_scales, self.m_previous, self.m_matrices)
+
+        return updated
+
+    def invalidate(self):
+        self.m_previous[:, :] = NAN
+
+    def set(self, size_t index, position=None, rotation=None, ratio=None, origin=None):
+        cdef sf.Vector2f v
+
+        if index >= len(self):
+            raise IndexError
+
+        if position is not None:
+            v = to_vector2f(position)
+            self.m_positions[index, 0] = v.x
+            self.m_positions[index, 1] = v.y
+
+        if rotation is not None:
+            self.m_rotations[index, 0] = rotation
+
+        if ratio is not None:
+            v = to_vector2f(ratio)
+            self.m_scales[index, 0] = v.x
+            self.m_scales[index, 1] = v.y
+
+        if origin is not None:
+            v = to_vector2f(origin)
+            self.m_origins[index, 0] = v.x
+            self.m_origins[index, 1] = v.y
+
+    def get_transform(self, size_t index):
+        if index >= len(self):
+            raise IndexError
+
+        self.update()
+
+        cdef float[:, ::1] m = self.m_matrices
+        return wrap_transform(new sf.Transform(
+            m[index, 0], m[index, 1], m[index, 2],
+            m[index, 3], m[index, 4], m[index, 5],
+            0, 0, 1))
+
+    @cython.boundscheck(False)
+    def get_bounds(self, const float[:, ::1] rectangles, float[:, ::1] out=None):
+        # the global bounds of each entry for culling, given the local
+        # rectangle of every entry or a single one shared by all
+        if rectangles.shape[1] != 4 or rectangles.shape[0] not in (1, len(self)):
+            raise ValueError("Rectangles must be a 1 x 4 or N x 4 array of float32")
+
+        self.update()
+
+        cdef size_t i, j, r
+        cdef size_t count = len(self)
+        cdef size_t step = rectangles.shape[0] > 1
+        cdef float x, y, left, top, right, bottom
+        cdef float corners[8]
+        cdef float[:, ::1] m = self.m_matrices
+
+        out = float_array(out, count, 4)
+
+        with nogil:
+            for i in range(count):
+                r = i * step
+                corners[0] = rectangles[r, 0]
+                corners[1] = rectangles[r, 1]
+                corners[2] = rectangles[r, 0] + rectangles[r, 2]
+                corners[3] = rectangles[r, 1]
+                corners[4] = rectangles[r, 0]
+                corners[5] = rectangles[r, 1] + rectangles[r, 3]
+                corners[6] = corners[2]
+                corners[7] = corners[5]
+
+                for j in range(4):
+                    x = m[i, 0] * corners[j * 2] + m[i, 1] * corners[j * 2 + 1] + m[i, 2]
+                    y = m[i, 3] * corners[j * 2] + m[i, 4] * corners[j * 2 + 1] + m[i, 5]
+
+                    if j == 0 or x < left: left = x
+                    if j == 0 or y < top: top = y
+                    if j == 0 or x > right: right = x
+                    if j == 0 or y > bottom: bottom = y
+
+                out[i, 0] = left
+                out[i, 1] = top
+                out[i, 2] = right - left
+                out[i, 3] = bottom - top
+
+        return out
+
+cdef float[:, ::1] float_array(float[:, ::1] out, Py_ssize_t count, Py_ssize_t columns):
+    # the output of the array methods, allocated when not provided
+    if out is None:
+        out = cvarray(shape=(max(count, 1), columns), itemsize=sizeof(float), format="f")
+        return out[:count]
+
+    if out.shape[0] != count or out.shape[1] != columns:
+        raise ValueError("Output must be a {0} x {1} array of float32".format(count, columns))
+
+    return out
+
+cdef void transform_points(const float* m, const float* points, float* out, size_t count) nogil:
+    cdef size_t i
+    cdef float x, y
+
+    # m is the 4x4 column-major matrix of an sf::Transform
+    for i in range(count):
+        x = points[i * 2]
+        y = points[i * 2 + 1]
+        out[i * 2] = m[0] * x + m[4] * y + m[12]
+        out[i * 2 + 1] = m[1] * x + m[5] * y + m[13]
+
+cdef void map_pixels_to_coords(sf.IntRect viewport, const float* m, const float* pixels, float* out, size_t count) nogil:
+    cdef size_t i
+    cdef float x, y
+
+    # same as sf::RenderTarget::mapPixelToCoords(), m being the view's
+    # inverse transform
+    for i in range(count):
+        x = -1.0 + 2.0 * (pixels[i * 2] - viewport.left) / viewport.width
+        y = 1.0 - 2.0 * (pixels[i * 2 + 1] - viewport.top) / viewport.height
+        out[i * 2] = m[0] * x + m[4] * y + m[12]
+        out[i * 2 + 1] = m[1] * x + m[5] * y + m[13]
+
+cdef void map_coords_to_pixels(sf.IntRect viewport, const float* m, const float* points, float* out, size_t count) nogil:
+    cdef size_t i
+    cdef float x, y
+
+    # same as sf::RenderTarget::mapCoordsToPixel(), m being the view's
+    # transform, without rounding to integers
+    for i in range(count):
+        x = m[0] * points[i * 2] + m[4] * points[i * 2 + 1] + m[12]
+        y = m[1] * points[i * 2] + m[5] * points[i * 2 + 1] + m[13]
+        out[i * 2] = (x + 1.0) / 2.0 * viewport.width + viewport.left
+        out[i * 2 + 1] = (-y + 1.0) / 2.0 * viewport.height + viewport.top
+
 cdef public class TransformableDrawable(Drawable)[type PyTransformableDrawableType, object PyTransformableDrawableObject]:
     cdef sf.Transformable *p_transformable
 
@@ -1391,6 +2678,148 @@ cdef public class Sprite(TransformableDrawable)[type PySpriteType, object PySpri
             return wrap_floatrect(&p)
 
 
+cdef class SpriteBatch(Drawable):
+    cdef SpriteBatchDrawable *p_this
+    cdef Texture              m_texture
+
+    def __init__(self, Texture texture, unsigned int sprite_count=0):
+        if self.p_this is NULL:
+            self.p_this = new SpriteBatchDrawable()
+            self.p_drawable = <sf.Drawable*>self.p_this
+
+            self.texture = texture
+            self.p_this.resize(sprite_count)
+
+    def __dealloc__(self):
+        self.p_drawable = NULL
+
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "SpriteBatch(texture={0}, length={1}, bounds={2})".format(id(self.texture), len(self), self.bounds)
+
+    def __len__(self):
+        return self.p_this.getSpriteCount()
+
+    property texture:
+        def __get__(self):
+            return self.m_texture
+
+        def __set__(self, Texture texture):
+            if texture:
+                self.p_this.setTexture(texture.p_this)
+            else:
+                self.p_this.setTexture(NULL)
+
+            self.m_texture = texture
+
+    def resize(self, unsigned int sprite_count):
+        self.p_this.resize(sprite_count)
+
+    def clear(self):
+        self.p_this.clear()
+
+    def set_sprite(self, size_t index, rectangle=None, Transform transform=None, Color color=None):
+        if index >= self.p_this.getSpriteCount():
+            raise IndexError
+
+        if rectangle is None:
+            if self.m_texture is None:
+                raise ValueError("A rectangle is required when the batch has no texture")
+
+            rectangle = (0, 0, self.m_texture.width, self.m_texture.height)
+
+        if transform is None:
+            transform = Transform.IDENTITY
+
+        if color is None:
+            color = Color.WHITE
+
+        self.p_this.setSprite(index, to_floatrect(rectangle), transform.p_this[0], color.p_this[0])
+
+    def append(self, rectangle=None, Transform transform=None, Color color=None):
+        cdef size_t index = self.p_this.getSpriteCount()
+
+        self.p_this.resize(index + 1)
+        self.set_sprite(index, rectangle, transform, color)
+
+    cdef void _set_from_sprite(self, size_t index, Sprite sprite) except *:
+        cdef sf.IntRect rectangle = sprite.p_this.getTextureRect()
+
+        if sprite.m_texture is None or sprite.m_texture.p_this != self.m_texture.p_this:
+            raise ValueError("All sprites of a batch must share its texture")
+
+        self.p_this.setSprite(index,
+            sf.FloatRect(rectangle.left, rectangle.top, rectangle.width, rectangle.height),
+            sprite.p_transformable.getTransform(), sprite.p_this.getColor())
+
+    def add_sprite(self, Sprite sprite):
+        cdef size_t index = self.p_this.getSpriteCount()
+
+        self.p_this.resize(index + 1)
+
+        try:
+            self._set_from_sprite(index, sprite)
+        except:
+            self.p_this.resize(index)
+            raise
+
+    def set_from_sprites(self, sprites):
+        cdef size_t index
+        sprites = list(sprites)
+
+        self.p_this.resize(len(sprites))
+
+        for index, sprite in enumerate(sprites):
+            self._set_from_sprite(index, sprite)
+
+    @cython.boundscheck(False)
+    def set_rectangles(self, const float[:, ::1] rectangles):
+        if rectangles.shape[1] != 4:
+            raise ValueError("Rectangles must be a N x 4 array of float32")
+
+        cdef size_t count = rectangles.shape[0]
+
+        # only resize() and the rectangles define the number of sprites,
+        # the matrices and colors must match it
+        self.p_this.resize(count)
+
+        if count:
+            with nogil: self.p_this.setRectangles(count, &rectangles[0, 0])
+
+    @cython.boundscheck(False)
+    def set_matrices(self, const float[:, ::1] matrices):
+        if matrices.shape[1] != 6:
+            raise ValueError("Matrices must be a N x 6 array of float32")
+
+        cdef size_t count = matrices.shape[0]
+
+        if count != self.p_this.getSpriteCount():
+            raise ValueError("Matrices must be a {0} x 6 array, one row per sprite".format(self.p_this.getSpriteCount()))
+
+        if count:
+            with nogil: self.p_this.setMatrices(count, &matrices[0, 0])
+
+    @cython.boundscheck(False)
+    def set_colors(self, const Uint8[:, ::1] colors):
+        if colors.shape[1] != 4:
+            raise ValueError("Colors must be a N x 4 array of uint8")
+
+        cdef size_t count = colors.shape[0]
+
+        if count != self.p_this.getSpriteCount():
+            raise ValueError("Colors must be a {0} x 4 array, one row per sprite".format(self.p_this.getSpriteCount()))
+
+        if count:
+            with nogil: self.p_this.setColors(count, &colors[0, 0])
+
+    property bounds:
+        def __get__(self):
+            cdef sf.FloatRect p = self.p_this.getBounds()
+            return wrap_floatrect(&p)
+
+
 class Style(IntEnum):
     REGULAR    = sf.text.Regular
     BOLD       = sf.text.Bold
@@ -1478,6 +2907,112 @@ cdef class Text(TransformableDrawable):
         return Vector2(p.x, p.y)
 
 
+cdef class TextBatch(Drawable):
+    cdef TextBatchDrawable *p_this
+    cdef Font               m_font
+
+    def __init__(self, Font font not None, unsigned int character_size=30, size_t cache_capacity=1024):
+        if self.p_this is NULL:
+            self.p_this = new TextBatchDrawable()
+            self.p_drawable = <sf.Drawable*>self.p_this
+
+            self.p_this.setCacheCapacity(cache_capacity)
+            self.p_this.setCharacterSize(character_size)
+            self.font = font
+
+    def __dealloc__(self):
+        self.p_drawable = NULL
+
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "TextBatch(font={0}, character_size={1}, length={2})".format(id(self.m_font), self.character_size, len(self))
+
+    def __len__(self):
+        return self.p_this.getLabelCount()
+
+    cdef size_t _check(self, size_t index) except? -1:
+        if index >= self.p_this.getLabelCount():
+            raise IndexError("Label index out of range")
+
+        return index
+
+    def add(self, unicode string, position=(0, 0), Color color=None, Uint32 style=sf.text.Regular):
+        cdef size_t index = self.p_this.getLabelCount()
+
+        self.p_this.resize(index + 1)
+        self.set_string(index, string, style)
+        self.p_this.setPosition(index, to_vector2f(position))
+
+        if color is not None:
+            self.p_this.setColor(index, color.p_this[0])
+
+        return index
+
+    def set_string(self, size_t index, unicode string, Uint32 style=sf.text.Regular):
+        cdef bytes data = string.encode(UTF32_ENCODING)
+
+        # unchanged strings are detected natively, and already laid out
+        # strings are taken from the layout cache
+        self.p_this.setString(self._check(index), <const Uint32*><char*>data, len(data) // 4, style)
+
+    def set_position(self, size_t index, position):
+        self.p_this.setPosition(self._check(index), to_vector2f(position))
+
+    def set_color(self, size_t index, Color color not None):
+        self.p_this.setColor(self._check(index), color.p_this[0])
+
+    def get_bounds(self, size_t index):
+        cdef sf.FloatRect p = self.p_this.getLabelBounds(self._check(index))
+        return wrap_floatrect(&p)
+
+    def resize(self, size_t count):
+        self.p_this.resize(count)
+
+    def clear(self):
+        self.p_this.clear()
+
+    property font:
+        def __get__(self):
+            return self.m_font
+
+        def __set__(self, Font font not None):
+            self.p_this.setFont(font.p_this)
+            self.m_font = font
+
+    property character_size:
+        def __get__(self):
+            return self.p_this.getCharacterSize()
+
+        def __set__(self, unsigned int size):
+            self.p_this.setCharacterSize(size)
+
+    property bounds:
+        def __get__(self):
+            cdef sf.FloatRect p = self.p_this.getBounds()
+            return wrap_floatrect(&p)
+
+    property cache_capacity:
+        def __get__(self):
+            return self.p_this.getCacheCapacity()
+
+        def __set__(self, size_t capacity):
+            self.p_this.setCacheCapacity(capacity)
+
+    property cache_size:
+        def __get__(self):
+            return self.p_this.getCacheSize()
+
+    property cache_hits:
+        def __get__(self):
+            return self.p_this.getCacheHits()
+
+    property cache_misses:
+        def __get__(self):
+            return self.p_this.getCacheMisses()
+
+
 cdef public class Shape(TransformableDrawable)[type PyShapeType, object PyShapeObject]:
     cdef sf.Shape *p_shape
     cdef Texture   m_texture
@@ -1711,8 +3246,14 @@ cdef Vertex wrap_vertex(sf.Vertex* p, bint d=True):
     return r
 
 
+# sf::Vertex exported as a structured item (position, color, tex_coords)
+cdef char* VERTEX_FORMAT = "T{(2)f:position:(4)B:color:(2)f:tex_coords:}"
+
 cdef class VertexArray(Drawable):
     cdef sf.VertexArray *p_this
+    cdef Py_ssize_t      m_exports
+    cdef Py_ssize_t      m_shape[1]
+    cdef Py_ssize_t      m_strides[1]
 
     def __init__(self, sf.primitivetype.PrimitiveType type = sf.primitivetype.Points, unsigned int vertex_count=0):
         if self.p_this is NULL:
@@ -1740,15 +3281,131 @@ cdef class VertexArray(Drawable):
     def __setitem__(self, unsigned int index, Vertex key):
         self.p_this[0][index] = key.p_this[0]
 
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cdef Py_ssize_t count = self.p_this.getVertexCount()
+
+        self.m_shape[0] = count
+        self.m_strides[0] = sizeof(sf.Vertex)
+
+        buffer.buf = <char*>self._vertices()
+        buffer.format = VERTEX_FORMAT
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(sf.Vertex)
+        buffer.len = count * sizeof(sf.Vertex)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = self.m_strides if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+        self.m_exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.m_exports -= 1
+
+    cdef sf.Vertex* _vertices(self):
+        if self.p_this.getVertexCount() == 0:
+            return NULL
+
+        return &self.p_this[0][0]
+
+    cdef int _resize(self, unsigned int vertex_count) except -1:
+        if vertex_count == self.p_this.getVertexCount():
+            return 0
+
+        # resizing the underlying vector would leave exported buffers dangling
+        if self.m_exports > 0:
+            raise BufferError("Existing exports of data: vertex array cannot be resized")
+
+        self.p_this.resize(vertex_count)
+        return 0
+
     def clear(self):
-        self.p_this.clear()
+        self._resize(0)
 
     def resize(self, unsigned int vertex_count):
-        self.p_this.resize(vertex_count)
+        self._resize(vertex_count)
 
     def append(self, Vertex vertex):
+        if self.m_exports > 0:
+            raise BufferError("Existing exports of data: vertex array cannot be resized")
+
         self.p_this.append(vertex.p_this[0])
 
+    @classmethod
+    def from_arrays(cls, positions, colors=None, tex_coords=None, sf.primitivetype.PrimitiveType type = sf.primitivetype.Points):
+        cdef VertexArray r = cls(type)
+
+        r.set_positions(positions)
+
+        if colors is not None:
+            r.set_colors(colors)
+
+        if tex_coords is not None:
+            r.set_tex_coords(tex_coords)
+
+        return r
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def set_positions(self, const float[:, ::1] positions):
+        if positions.shape[1] != 2:
+            raise ValueError("Positions must be a N x 2 array of float32")
+
+        cdef Py_ssize_t i, count = positions.shape[0]
+        self._resize(count)
+        cdef sf.Vertex *vertices = self._vertices()
+
+        with nogil:
+            for i in range(count):
+                vertices[i].position.x = positions[i, 0]
+                vertices[i].position.y = positions[i, 1]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def set_colors(self, const Uint8[:, ::1] colors):
+        if colors.shape[1] != 4:
+            raise ValueError("Colors must be a N x 4 array of uint8")
+
+        cdef Py_ssize_t i, count = colors.shape[0]
+
+        # only set_positions() defines the number of vertices
+        if <size_t>count != self.p_this.getVertexCount():
+            raise ValueError("Colors must be a {0} x 4 array, one row per vertex".format(self.p_this.getVertexCount()))
+
+        cdef sf.Vertex *vertices = self._vertices()
+
+        with nogil:
+            for i in range(count):
+                vertices[i].color.r = colors[i, 0]
+                vertices[i].color.g = colors[i, 1]
+                vertices[i].color.b = colors[i, 2]
+                vertices[i].color.a = colors[i, 3]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def set_tex_coords(self, const float[:, ::1] tex_coords):
+        if tex_coords.shape[1] != 2:
+            raise ValueError("Texture coordinates must be a N x 2 array of float32")
+
+        cdef Py_ssize_t i, count = tex_coords.shape[0]
+
+        # only set_positions() defines the number of vertices
+        if <size_t>count != self.p_this.getVertexCount():
+            raise ValueError("Texture coordinates must be a {0} x 2 array, one row per vertex".format(self.p_this.getVertexCount()))
+
+        cdef sf.Vertex *vertices = self._vertices()
+
+        with nogil:
+            for i in range(count):
+                vertices[i].texCoords.x = tex_coords[i, 0]
+                vertices[i].texCoords.y = tex_coords[i, 1]
+
+    property vertices:
+        def __get__(self):
+            return memoryview(self)
+
     property primitive_type:
         def __get__(self):
             return self.p_this.getPrimitiveType()
@@ -1918,6 +3575,40 @@ cdef public class RenderTarget[type PyRenderTargetType, object PyRenderTargetObj
 
         return Vector2(ret.x, ret.y)
 
+    @cython.boundscheck(False)
+    def map_pixels_to_coords(self, const float[:, ::1] points, View view=None, float[:, ::1] out=None):
+        if points.shape[1] != 2:
+            raise ValueError("Points must be a N x 2 array of float32")
+
+        cdef size_t count = points.shape[0]
+        cdef const sf.View* v = view.p_this if view else &self.p_rendertarget.getView()
+        cdef sf.IntRect viewport = self.p_rendertarget.getViewport(v[0])
+        cdef const float* m = v.getInverseTransform().getMatrix()
+
+        out = float_array(out, count, 2)
+
+        if count:
+            with nogil: map_pixels_to_coords(viewport, m, &points[0, 0], &out[0, 0], count)
+
+        return out
+
+    @cython.boundscheck(False)
+    def map_coords_to_pixels(self, const float[:, ::1] points, View view=None, float[:, ::1] out=None):
+        if points.shape[1] != 2:
+            raise ValueError("Points must be a N x 2 array of float32")
+
+        cdef size_t count = points.shape[0]
+        cdef const sf.View* v = view.p_this if view else &self.p_rendertarget.getView()
+        cdef sf.IntRect viewport = self.p_rendertarget.getViewport(v[0])
+        cdef const float* m = v.getTransform().getMatrix()
+
+        out = float_array(out, count, 2)
+
+        if count:
+            with nogil: map_coords_to_pixels(viewport, m, &points[0, 0], &out[0, 0], count)
+
+        return out
+
     def draw(self, Drawable drawable, RenderStates states=None):
         if not states:
             self.p_rendertarget.draw(drawable.p_drawable[0])
@@ -2016,6 +3707,40 @@ cdef class RenderWindow(Window):
 
         return Vector2(ret.x, ret.y)
 
+    @cython.boundscheck(False)
+    def map_pixels_to_coords(self, const float[:, ::1] points, View view=None, float[:, ::1] out=None):
+        if points.shape[1] != 2:
+            raise ValueError("Points must be a N x 2 array of float32")
+
+        cdef size_t count = points.shape[0]
+        cdef const sf.View* v = view.p_this if view else &self.p_this.getView()
+        cdef sf.IntRect viewport = self.p_this.getViewport(v[0])
+        cdef const float* m = v.getInverseTransform().getMatrix()
+
+        out = float_array(out, count, 2)
+
+        if count:
+            with nogil: map_pixels_to_coords(viewport, m, &points[0, 0], &out[0, 0], count)
+
+        return out
+
+    @cython.boundscheck(False)
+    def map_coords_to_pixels(self, const float[:, ::1] points, View view=None, float[:, ::1] out=None):
+        if points.shape[1] != 2:
+            raise ValueError("Points must be a N x 2 array of float32")
+
+        cdef size_t count = points.shape[0]
+        cdef const sf.View* v = view.p_this if view else &self.p_this.getView()
+        cdef sf.IntRect viewport = self.p_this.getViewport(v[0])
+        cdef const float* m = v.getTransform().getMatrix()
+
+        out = float_array(out, count, 2)
+
+        if count:
+            with nogil: map_coords_to_pixels(viewport, m, &points[0, 0], &out[0, 0], count)
+
+        return out
+
     def draw(self, Drawable drawable, RenderStates states=None):
         if not states:
             self.p_this.draw(drawable.p_drawable[0])
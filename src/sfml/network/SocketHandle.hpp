@@ -0,0 +1,30 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_NETWORK_SOCKETHANDLE_HPP
+#define PYSFML_NETWORK_SOCKETHANDLE_HPP
+
+#include <SFML/Network.hpp>
+
+// sf::Socket::getHandle() is protected; naming it through a derived class
+// gives a pointer to member that can be called on any socket.
+class SocketHandleAccess : public sf::Socket
+{
+public:
+    static sf::SocketHandle get(const sf::Socket& socket)
+    {
+        return (socket.*&SocketHandleAccess::getHandle)();
+    }
+};
+
+inline long long getSocketHandle(const sf::Socket& socket)
+{
+    return static_cast<long long>(SocketHandleAccess::get(socket));
+}
+
+#endif // PYSFML_NETWORK_SOCKETHANDLE_HPP
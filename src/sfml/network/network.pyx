@@ -11,7 +11,11 @@ from cython.operator cimport dereference as deref
 from cython.operator cimport preincrement as inc
 
 from libc.stdlib cimport *
+from libc.string cimport memcpy
 from libcpp.string cimport string
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release
+from cpython.buffer cimport PyBUF_SIMPLE, PyBUF_FORMAT, PyBUF_ND
+from cpython.buffer cimport PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS
 from libcpp.vector cimport vector
 
 cimport sfml as sf
@@ -19,6 +23,12 @@ from sfml cimport Int8, Int16, Int32, Int64
 from sfml cimport Uint8, Uint16, Uint32, Uint64
 from pysfml.system cimport Time
 
+import select
+import threading
+
+cdef extern from "pysfml/network/SocketHandle.hpp":
+    long long getSocketHandle(const sf.Socket&)
+
 cdef class IpAddress:
     cdef sf.IpAddress *p_this
 
@@ -101,6 +111,298 @@ cdef wrap_ipaddress(sf.IpAddress* p):
     r.p_this = p
     return r
 
+def to_ipaddress(address):
+    # an IpAddress, or a string such as "127.0.0.1" or "sfml-dev.org"
+    if isinstance(address, IpAddress):
+        return address
+
+    return IpAddress.from_string(address)
+
+cdef inline void pack_be(unsigned char* out, Uint64 value, int size) nogil:
+    cdef int i
+
+    for i in range(size):
+        out[i] = (value >> (8 * (size - 1 - i))) & 0xff
+
+cdef inline Uint64 unpack_be(const unsigned char* data, int size) nogil:
+    cdef Uint64 value = 0
+    cdef int i
+
+    for i in range(size):
+        value = (value << 8) | data[i]
+
+    return value
+
+cdef char* BYTE_FORMAT = "B"
+
+cdef class Packet:
+    cdef sf.Packet *p_this
+    cdef size_t     m_position
+    cdef int        m_exports
+    cdef Py_ssize_t m_shape[1]
+
+    def __init__(self, data=None):
+        self.p_this = new sf.Packet()
+        self.m_position = 0
+
+        if data is not None:
+            self.append(data)
+
+    def __dealloc__(self):
+        del self.p_this
+
+    def __repr__(self):
+        return "Packet(size={0}, position={1})".format(len(self), self.m_position)
+
+    def __len__(self):
+        return self.p_this.getDataSize()
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        self.m_shape[0] = self.p_this.getDataSize()
+
+        buffer.buf = <char*>self.p_this.getData()
+        buffer.format = BYTE_FORMAT if flags & PyBUF_FORMAT else NULL
+        buffer.internal = NULL
+        buffer.itemsize = 1
+        buffer.len = self.m_shape[0]
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = NULL
+        buffer.suboffsets = NULL
+
+        self.m_exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.m_exports -= 1
+
+    cdef int _check_resize(self) except -1:
+        if self.m_exports:
+            raise BufferError("Packet can't be resized while it is exported")
+
+        return 0
+
+    cdef const unsigned char* _take(self, size_t size) except NULL:
+        cdef const unsigned char* data = <const unsigned char*>self.p_this.getData()
+
+        if self.m_position + size > self.p_this.getDataSize():
+            raise ValueError("Packet doesn't contain enough data")
+
+        data += self.m_position
+        self.m_position += size
+        return data
+
+    def append(self, data):
+        cdef Py_buffer view
+
+        self._check_resize()
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+        try:
+            self.p_this.append(view.buf, view.len)
+        finally:
+            PyBuffer_Release(&view)
+
+    def clear(self):
+        self._check_resize()
+        self.p_this.clear()
+        self.m_position = 0
+
+    def write(self, format, *values):
+        cdef bytes encoded_format = format.encode('ascii') if isinstance(format, unicode) else format
+        cdef const char* code = encoded_format
+        cdef string data
+        cdef unsigned char number[8]
+        cdef size_t repeat, i, index = 0
+        cdef bint counted
+        cdef Uint32 length
+        cdef Int8 i8
+        cdef Uint8 u8
+        cdef Int16 i16
+        cdef Uint16 u16
+        cdef Int32 i32
+        cdef Uint32 u32
+        cdef Int64 i64
+        cdef Uint64 u64
+        cdef float f
+        cdef double d
+
+        self._check_resize()
+
+        while code[0]:
+            repeat = 0
+            counted = False
+            while b'0' <= code[0] <= b'9':
+                repeat = repeat * 10 + (code[0] - b'0')
+                counted = True
+                code += 1
+
+            if not code[0]:
+                raise ValueError("Packet format ends with a repeat count")
+
+            # as with struct, an explicit count of 0 means no item
+            if not counted:
+                repeat = 1
+
+            for i in range(repeat):
+                if index >= len(values):
+                    raise ValueError("Not enough values for the packet format")
+
+                value = values[index]
+                index += 1
+
+                # assigning to the sized integers raises OverflowError for
+                # values out of their range, like struct.pack does
+                if code[0] == b'?':
+                    number[0] = <bint>value
+                    data.append(<char*>number, 1)
+                elif code[0] == b'b':
+                    i8 = value
+                    number[0] = <Uint8>i8
+                    data.append(<char*>number, 1)
+                elif code[0] == b'B':
+                    u8 = value
+                    number[0] = u8
+                    data.append(<char*>number, 1)
+                elif code[0] == b'h':
+                    i16 = value
+                    pack_be(number, <Uint64><Int64>i16, 2)
+                    data.append(<char*>number, 2)
+                elif code[0] == b'H':
+                    u16 = value
+                    pack_be(number, u16, 2)
+                    data.append(<char*>number, 2)
+                elif code[0] == b'i':
+                    i32 = value
+                    pack_be(number, <Uint64><Int64>i32, 4)
+                    data.append(<char*>number, 4)
+                elif code[0] == b'I':
+                    u32 = value
+                    pack_be(number, u32, 4)
+                    data.append(<char*>number, 4)
+                elif code[0] == b'q':
+                    i64 = value
+                    pack_be(number, <Uint64>i64, 8)
+                    data.append(<char*>number, 8)
+                elif code[0] == b'Q':
+                    u64 = value
+                    pack_be(number, u64, 8)
+                    data.append(<char*>number, 8)
+                elif code[0] == b'f':
+                    f = value
+                    data.append(<char*>&f, sizeof(float))
+                elif code[0] == b'd':
+                    d = value
+                    data.append(<char*>&d, sizeof(double))
+                elif code[0] == b's' or code[0] == b'y':
+                    if code[0] == b's' and isinstance(value, unicode):
+                        value = value.encode('UTF-8')
+
+                    length = len(value)
+                    pack_be(number, length, 4)
+                    data.append(<char*>number, 4)
+                    data.append(<char*>value, length)
+                else:
+                    raise ValueError("Unknown packet format code '{0}'".format(chr(code[0])))
+
+            code += 1
+
+        if index != len(values):
+            raise ValueError("Too many values for the packet format")
+
+        self.p_this.append(data.data(), data.size())
+
+    def read(self, format):
+        cdef bytes encoded_format = format.encode('ascii') if isinstance(format, unicode) else format
+        cdef const char* code = encoded_format
+        cdef const unsigned char* data
+        cdef size_t repeat, i
+        cdef bint counted
+        cdef size_t position = self.m_position
+        cdef Uint32 length
+        cdef float f
+        cdef double d
+        cdef list values = []
+
+        try:
+            while code[0]:
+                repeat = 0
+                counted = False
+                while b'0' <= code[0] <= b'9':
+                    repeat = repeat * 10 + (code[0] - b'0')
+                    counted = True
+                    code += 1
+
+                if not code[0]:
+                    raise ValueError("Packet format ends with a repeat count")
+
+                if not counted:
+                    repeat = 1
+
+                for i in range(repeat):
+                    if code[0] == b'?':
+                        values.append(self._take(1)[0] != 0)
+                    elif code[0] == b'b':
+                        values.append(<Int8>self._take(1)[0])
+                    elif code[0] == b'B':
+                        values.append(self._take(1)[0])
+                    elif code[0] == b'h':
+                        values.append(<Int16>unpack_be(self._take(2), 2))
+                    elif code[0] == b'H':
+                        values.append(<Uint16>unpack_be(self._take(2), 2))
+                    elif code[0] == b'i':
+                        values.append(<Int32>unpack_be(self._take(4), 4))
+                    elif code[0] == b'I':
+                        values.append(<Uint32>unpack_be(self._take(4), 4))
+                    elif code[0] == b'q':
+                        values.append(<Int64>unpack_be(self._take(8), 8))
+                    elif code[0] == b'Q':
+                        values.append(unpack_be(self._take(8), 8))
+                    elif code[0] == b'f':
+                        memcpy(&f, self._take(sizeof(float)), sizeof(float))
+                        values.append(f)
+                    elif code[0] == b'd':
+                        memcpy(&d, self._take(sizeof(double)), sizeof(double))
+                        values.append(d)
+                    elif code[0] == b's' or code[0] == b'y':
+                        length = unpack_be(self._take(4), 4)
+                        data = self._take(length)
+                        value = (<char*>data)[:length]
+                        values.append(value.decode('UTF-8') if code[0] == b's' else value)
+                    else:
+                        raise ValueError("Unknown packet format code '{0}'".format(chr(code[0])))
+
+                code += 1
+        except:
+            self.m_position = position
+            raise
+
+        return tuple(values)
+
+    property data:
+        def __get__(self):
+            return (<char*>self.p_this.getData())[:self.p_this.getDataSize()]
+
+    property position:
+        def __get__(self):
+            return self.m_position
+
+        def __set__(self, size_t position):
+            if position > self.p_this.getDataSize():
+                raise ValueError("Position is past the end of the packet")
+
+            self.m_position = position
+
+    property remaining:
+        def __get__(self):
+            return self.p_this.getDataSize() - self.m_position
+
+    property end_of_packet:
+        def __get__(self):
+            return self.m_position >= self.p_this.getDataSize()
+
+
 cdef class Socket:
     DONE = sf.socket.Done
     NOT_READY = sf.socket.NotReady
@@ -122,9 +424,17 @@ cdef class Socket:
         def __set__(self, bint blocking):
             self.p_socket.setBlocking(blocking)
 
+    property native_handle:
+        def __get__(self):
+            return getSocketHandle(self.p_socket[0])
+
+    def fileno(self):
+        return getSocketHandle(self.p_socket[0])
+
 
 class SocketException(Exception): pass
 class SocketNotReady(SocketException): pass
+class SocketPartial(SocketNotReady): pass
 class SocketDisconnected(SocketException): pass
 class SocketError(SocketException): pass
 
@@ -242,14 +552,61 @@ cdef class TcpSocket(Socket):
             elif status is sf.socket.Error:
                 raise SocketError()
 
+    def send_partial(self, data):
+        cdef Py_buffer view
+        cdef size_t sent = 0
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+        with nogil:
+            status = self.p_this.send(view.buf, view.len, sent)
+
+        PyBuffer_Release(&view)
+
+        if status is sf.socket.Disconnected:
+            raise SocketDisconnected()
+        elif status is sf.socket.Error:
+            raise SocketError()
+
+        return sent
+
     def receive(self, size_t size):
         cdef char* data = <char*>malloc(size * sizeof(char))
         cdef size_t received = 0
         cdef sf.socket.Status status
 
+        if size and not data:
+            raise MemoryError
+
         with nogil:
             status = self.p_this.receive(data, size, received)
 
+        try:
+            if status is not sf.socket.Done:
+                if status is sf.socket.NotReady:
+                    raise SocketNotReady()
+                elif status is sf.socket.Disconnected:
+                    raise SocketDisconnected()
+                elif status is sf.socket.Error:
+                    raise SocketError()
+
+            return <bytes>(data)[:received]
+        finally:
+            free(data)
+
+    def receive_into(self, buffer):
+        cdef Py_buffer view
+        cdef size_t received = 0
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS)
+
+        with nogil:
+            status = self.p_this.receive(view.buf, view.len, received)
+
+        PyBuffer_Release(&view)
+
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
                 raise SocketNotReady()
@@ -258,7 +615,48 @@ cdef class TcpSocket(Socket):
             elif status is sf.socket.Error:
                 raise SocketError()
 
-        return <bytes>(data)[:received]
+        return received
+
+    def send_packet(self, Packet packet not None):
+        cdef sf.socket.Status status
+
+        with nogil:
+            status = self.p_this.send(packet.p_this[0])
+
+        if status is not sf.socket.Done:
+            if status is sf.socket.NotReady:
+                raise SocketNotReady()
+            elif status is sf.socket.Partial:
+                raise SocketPartial()
+            elif status is sf.socket.Disconnected:
+                raise SocketDisconnected()
+            elif status is sf.socket.Error:
+                raise SocketError()
+
+    def receive_packet(self, Packet packet=None):
+        cdef sf.socket.Status status
+
+        if packet is None:
+            packet = Packet()
+
+        packet._check_resize()
+
+        with nogil:
+            status = self.p_this.receive(packet.p_this[0])
+
+        packet.m_position = 0
+
+        if status is not sf.socket.Done:
+            if status is sf.socket.NotReady:
+                raise SocketNotReady()
+            elif status is sf.socket.Partial:
+                raise SocketPartial()
+            elif status is sf.socket.Disconnected:
+                raise SocketDisconnected()
+            elif status is sf.socket.Error:
+                raise SocketError()
+
+        return packet
 
 
 cdef class UdpSocket(Socket):
@@ -295,7 +693,12 @@ cdef class UdpSocket(Socket):
         self.p_this.unbind()
 
     def send(self, bytes data, IpAddress remote_address, unsigned short remote_port):
-        cdef sf.socket.Status status = self.p_this.send(<char*>data, len(data), remote_address.p_this[0], remote_port)
+        cdef sf.socket.Status status
+        cdef char* cdata = <char*>data
+        cdef size_t cdata_len = len(data)
+
+        with nogil:
+            status = self.p_this.send(cdata, cdata_len, remote_address.p_this[0], remote_port)
 
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
@@ -310,7 +713,40 @@ cdef class UdpSocket(Socket):
         cdef size_t received = 0
         cdef IpAddress remote_address = IpAddress()
         cdef unsigned short port = 0
-        cdef sf.socket.Status status = self.p_this.receive(data, size, received, remote_address.p_this[0], port)
+        cdef sf.socket.Status status
+
+        if size and not data:
+            raise MemoryError
+
+        with nogil:
+            status = self.p_this.receive(data, size, received, remote_address.p_this[0], port)
+
+        try:
+            if status is not sf.socket.Done:
+                if status is sf.socket.NotReady:
+                    raise SocketNotReady()
+                elif status is sf.socket.Disconnected:
+                    raise SocketDisconnected()
+                elif status is sf.socket.Error:
+                    raise SocketError()
+
+            return (<bytes>(data)[:received], remote_address, port)
+        finally:
+            free(data)
+
+    def receive_into(self, buffer):
+        cdef Py_buffer view
+        cdef size_t received = 0
+        cdef IpAddress remote_address = IpAddress()
+        cdef unsigned short port = 0
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS)
+
+        with nogil:
+            status = self.p_this.receive(view.buf, view.len, received, remote_address.p_this[0], port)
+
+        PyBuffer_Release(&view)
 
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
@@ -320,14 +756,62 @@ cdef class UdpSocket(Socket):
             elif status is sf.socket.Error:
                 raise SocketError()
 
-        return (<bytes>(data)[:received], remote_address, port)
+        return (received, remote_address, port)
+
+    def send_packet(self, Packet packet not None, IpAddress remote_address, unsigned short remote_port):
+        cdef sf.socket.Status status
+
+        with nogil:
+            status = self.p_this.send(packet.p_this[0], remote_address.p_this[0], remote_port)
+
+        if status is not sf.socket.Done:
+            if status is sf.socket.NotReady:
+                raise SocketNotReady()
+            elif status is sf.socket.Partial:
+                raise SocketPartial()
+            elif status is sf.socket.Disconnected:
+                raise SocketDisconnected()
+            elif status is sf.socket.Error:
+                raise SocketError()
+
+    def receive_packet(self, Packet packet=None):
+        cdef IpAddress remote_address = IpAddress()
+        cdef unsigned short port = 0
+        cdef sf.socket.Status status
+
+        if packet is None:
+            packet = Packet()
+
+        packet._check_resize()
+
+        with nogil:
+            status = self.p_this.receive(packet.p_this[0], remote_address.p_this[0], port)
+
+        packet.m_position = 0
+
+        if status is not sf.socket.Done:
+            if status is sf.socket.NotReady:
+                raise SocketNotReady()
+            elif status is sf.socket.Partial:
+                raise SocketPartial()
+            elif status is sf.socket.Disconnected:
+                raise SocketDisconnected()
+            elif status is sf.socket.Error:
+                raise SocketError()
+
+        return (packet, remote_address, port)
 
 
 cdef class SocketSelector:
     cdef sf.SocketSelector *p_this
+    cdef list               m_sockets
+    cdef dict               m_indices
+    cdef vector[sf.Socket*] m_handles
 
     def __init__(self):
         self.p_this = new sf.SocketSelector()
+        self.m_sockets = []
+        self.m_indices = {}
 
     def __dealloc__(self):
         del self.p_this
@@ -335,14 +819,43 @@ cdef class SocketSelector:
     def __repr__(self):
         return "SocketSelector()"
 
+    def __len__(self):
+        return len(self.m_sockets)
+
     def add(self, Socket socket):
+        if socket in self.m_indices:
+            return
+
         self.p_this.add(socket.p_socket[0])
+        self.m_indices[socket] = len(self.m_sockets)
+        self.m_sockets.append(socket)
+        self.m_handles.push_back(socket.p_socket)
 
     def remove(self, Socket socket):
+        cdef size_t index
+
         self.p_this.remove(socket.p_socket[0])
 
+        if socket not in self.m_indices:
+            return
+
+        index = self.m_indices.pop(socket)
+
+        # move the last socket into the freed slot
+        last = self.m_sockets.pop()
+
+        if last is not socket:
+            self.m_sockets[index] = last
+            self.m_handles[index] = self.m_handles.back()
+            self.m_indices[last] = index
+
+        self.m_handles.pop_back()
+
     def clear(self):
         self.p_this.clear()
+        self.m_sockets = []
+        self.m_indices = {}
+        self.m_handles.clear()
 
     def wait(self, Time timeout=None):
         cdef bint ret
@@ -356,9 +869,130 @@ cdef class SocketSelector:
 
         return ret
 
+    def wait_ready(self, Time timeout=None):
+        cdef vector[size_t] ready
+        cdef bint ret
+        cdef size_t i
+
+        with nogil:
+            if timeout is None:
+                ret = self.p_this.wait()
+            else:
+                ret = self.p_this.wait(timeout.p_this[0])
+
+            if ret:
+                for i in range(self.m_handles.size()):
+                    if self.p_this.isReady(self.m_handles[i][0]):
+                        ready.push_back(i)
+
+        return [self.m_sockets[ready[i]] for i in range(ready.size())]
+
     def is_ready(self, Socket socket):
         return self.p_this.isReady(socket.p_socket[0])
 
+    property sockets:
+        def __get__(self):
+            return list(self.m_sockets)
+
+
+cdef class EpollSocketSelector:
+    cdef object m_epoll
+    cdef dict   m_sockets
+    cdef dict   m_handles
+    cdef set    m_ready
+
+    def __init__(self):
+        if not hasattr(select, 'epoll'):
+            raise NotImplementedError("epoll is only available on Linux")
+
+        self.m_epoll = select.epoll()
+        self.m_sockets = {}
+        self.m_handles = {}
+        self.m_ready = set()
+
+    def __repr__(self):
+        return "EpollSocketSelector()"
+
+    def __len__(self):
+        return len(self.m_sockets)
+
+    cdef _discard(self, handle):
+        socket = self.m_sockets.pop(handle)
+        del self.m_handles[socket]
+        self.m_ready.discard(socket)
+
+        try:
+            self.m_epoll.unregister(handle)
+        except (IOError, OSError, ValueError):
+            # closing the socket already removed it from the epoll set
+            pass
+
+    cdef bint _is_stale(self, handle):
+        # a socket that disconnected no longer owns its handle, which the
+        # system may since have given to another socket
+        cdef Socket socket = self.m_sockets[handle]
+        return getSocketHandle(socket.p_socket[0]) != handle
+
+    def add(self, Socket socket):
+        cdef long long handle = getSocketHandle(socket.p_socket[0])
+
+        if handle < 0:
+            raise SocketError()
+
+        previous = self.m_handles.get(socket)
+
+        if previous == handle:
+            return
+
+        if previous is not None:
+            self._discard(previous)
+
+        if handle in self.m_sockets:
+            self._discard(handle)
+
+        self.m_epoll.register(handle, select.EPOLLIN)
+        self.m_sockets[handle] = socket
+        self.m_handles[socket] = handle
+
+    def remove(self, Socket socket):
+        handle = self.m_handles.get(socket)
+
+        if handle is not None:
+            self._discard(handle)
+
+    def clear(self):
+        for handle in list(self.m_sockets):
+            self._discard(handle)
+
+        self.m_ready = set()
+
+    def wait(self, Time timeout=None):
+        return bool(self.wait_ready(timeout))
+
+    def wait_ready(self, Time timeout=None):
+        cdef list ready = []
+
+        events = self.m_epoll.poll(-1 if timeout is None else timeout.seconds)
+
+        for handle, mask in events:
+            if handle not in self.m_sockets:
+                continue
+
+            if self._is_stale(handle):
+                self._discard(handle)
+            else:
+                ready.append(self.m_sockets[handle])
+
+        self.m_ready = set(ready)
+        return ready
+
+    def is_ready(self, Socket socket):
+        return socket in self.m_ready
+
+    property sockets:
+        def __get__(self):
+            return list(self.m_sockets.values())
+
 
 cdef class FtpResponse:
     RESTART_MARKER_REPLY = sf.ftp.response.RestartMarkerReply
@@ -666,10 +1300,25 @@ cdef class HttpRequest:
     HEAD = sf.http.request.Head
 
     cdef sf.http.Request *p_this
+    cdef bytes m_uri
+    cdef sf.http.request.Method m_method
+    cdef bytes m_body
+    cdef dict m_fields
+    cdef unsigned int m_majorVersion
+    cdef unsigned int m_minorVersion
 
     def __init__(self, bytes uri=b"/", sf.http.request.Method method=sf.http.request.Get, bytes body=b""):
         self.p_this = new sf.http.Request(string(uri), method, string(body))
 
+        # sf::Http::Request has no getters; the streaming mode needs the
+        # request back to send it over its own socket
+        self.m_uri = uri
+        self.m_method = method
+        self.m_body = body
+        self.m_fields = {}
+        self.m_majorVersion = 1
+        self.m_minorVersion = 0
+
     def __dealloc__(self):
         del self.p_this
 
@@ -681,24 +1330,61 @@ cdef class HttpRequest:
             cdef bytes field = v[0]
             cdef bytes value = v[1]
             self.p_this.setField(string(field), string(value))
+            self.m_fields[field.lower()] = value
 
     property method:
         def __set__(self, sf.http.request.Method method):
             self.p_this.setMethod(method)
+            self.m_method = method
 
     property uri:
         def __set__(self, bytes uri):
             self.p_this.setUri(string(uri))
+            self.m_uri = uri
 
     property http_version:
         def __set__(self, tuple value):
             cdef unsigned int major = value[0]
             cdef unsigned int minor = value[1]
             self.p_this.setHttpVersion(major, minor)
+            self.m_majorVersion = major
+            self.m_minorVersion = minor
 
     property body:
         def __set__(self, bytes body):
             self.p_this.setBody(string(body))
+            self.m_body = body
+
+    cdef bytes _prepare(self, bytes host, bint decompress):
+        # same defaults as sf::Http::sendRequest()
+        cdef dict fields = dict(self.m_fields)
+        fields.setdefault(b"from", b"user@sfml-dev.org")
+        fields.setdefault(b"user-agent", b"libsfml-network/2.x")
+        fields.setdefault(b"host", host)
+        fields.setdefault(b"content-length", str(len(self.m_body)).encode('ascii'))
+
+        if self.m_method == sf.http.request.Post:
+            fields.setdefault(b"content-type", b"application/x-www-form-urlencoded")
+
+        if self.m_majorVersion * 10 + self.m_minorVersion >= 11:
+            fields.setdefault(b"connection", b"close")
+
+        if decompress:
+            fields.setdefault(b"accept-encoding", b"gzip, deflate")
+
+        if self.m_method == sf.http.request.Post:
+            method = b"POST"
+        elif self.m_method == sf.http.request.Head:
+            method = b"HEAD"
+        else:
+            method = b"GET"
+
+        lines = [b" ".join([method, self.m_uri or b"/", "HTTP/{0}.{1}".format(self.m_majorVersion, self.m_minorVersion).encode('ascii')])]
+        lines.extend(name + b": " + value for name, value in fields.items())
+        lines.append(b"")
+        lines.append(self.m_body)
+
+        return b"\r\n".join(lines)
 
 
 cdef class HttpResponse:
@@ -754,18 +1440,336 @@ cdef class HttpResponse:
 
     property body:
         def __get__(self):
-            return self.p_this.getBody().c_str()
+            return self.p_this.getBody()
 
 cdef wrap_httpresponse(sf.http.Response *p):
     cdef HttpResponse r = HttpResponse.__new__(HttpResponse)
     r.p_this = p
     return r
 
+cdef class HttpResponseStream:
+    cdef TcpSocket m_socket
+    cdef bytearray m_buffer
+    cdef bytearray m_chunk
+    cdef dict m_fields
+    cdef int m_status
+    cdef unsigned int m_majorVersion
+    cdef unsigned int m_minorVersion
+    cdef Py_ssize_t m_remaining
+    cdef bint m_chunked
+    cdef bint m_chunkStarted
+    cdef bint m_eof
+    cdef object m_decompressor
+    cdef bytes m_tail
+    cdef bint m_flushed
+
+    def __init__(self):
+        raise NotImplementedError("Not meant to be instantiated!")
+
+    def __repr__(self):
+        return "HttpResponseStream(status={0})".format(self.m_status)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            data = self._read(len(self.m_chunk))
+
+            if not data:
+                break
+
+            yield data
+
+    def get_field(self, bytes field):
+        return self.m_fields.get(field.lower(), b"")
+
+    property status:
+        def __get__(self):
+            return self.m_status
+
+    property major_http_version:
+        def __get__(self):
+            return self.m_majorVersion
+
+    property minor_http_version:
+        def __get__(self):
+            return self.m_minorVersion
+
+    property closed:
+        def __get__(self):
+            return self.m_socket is None
+
+    def read(self, Py_ssize_t size=-1):
+        # the whole body is still read and decompressed in bounded pieces
+        if size < 0:
+            return b"".join(self)
+
+        return self._read(size)
+
+    def readinto(self, buffer):
+        cdef Py_buffer view
+        cdef bytes data
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS)
+
+        try:
+            data = self._read(view.len)
+            memcpy(view.buf, <char*>data, len(data))
+        finally:
+            PyBuffer_Release(&view)
+
+        return len(data)
+
+    def save(self, file):
+        cdef Py_ssize_t written = 0
+
+        if hasattr(file, 'write'):
+            for data in self:
+                file.write(data)
+                written += len(data)
+        else:
+            with open(file, 'wb') as f:
+                written = self.save(f)
+
+        return written
+
+    def close(self):
+        if self.m_socket is not None:
+            self.m_socket.disconnect()
+            self.m_socket = None
+
+        self.m_eof = True
+        del self.m_buffer[:]
+
+    cdef bint _fill(self) except -1:
+        cdef size_t received
+
+        if self.m_socket is None:
+            return False
+
+        try:
+            received = self.m_socket.receive_into(self.m_chunk)
+        except SocketDisconnected:
+            self.m_socket.disconnect()
+            self.m_socket = None
+            return False
+
+        self.m_buffer += memoryview(self.m_chunk)[:received]
+        return True
+
+    cdef bytes _read_line(self):
+        cdef Py_ssize_t index
+
+        while True:
+            index = self.m_buffer.find(b"\n")
+
+            if index >= 0:
+                line = bytes(self.m_buffer[:index]).rstrip(b"\r")
+                del self.m_buffer[:index + 1]
+                return line
+
+            if len(self.m_buffer) > len(self.m_chunk) or not self._fill():
+                return None
+
+    cdef _read_header(self, bint head):
+        cdef bytes line = self._read_line()
+
+        # status line: HTTP/x.y code reason
+        try:
+            version, code = line.split()[:2]
+            if not version.upper().startswith(b"HTTP/"):
+                raise ValueError()
+            self.m_majorVersion, self.m_minorVersion = [int(n) for n in version[5:].split(b".")]
+            self.m_status = int(code)
+        except (AttributeError, ValueError):
+            self.m_status = sf.http.response.InvalidResponse
+            self.close()
+            return
+
+        while True:
+            line = self._read_line()
+
+            if line is None:
+                self.m_status = sf.http.response.InvalidResponse
+                self.close()
+                return
+
+            if not line:
+                break
+
+            name, _, value = line.partition(b":")
+            self.m_fields[name.strip().lower()] = value.strip()
+
+        if head or self.m_status < 200 or self.m_status in (204, 304):
+            self.m_remaining = 0
+        elif b"chunked" in self.get_field(b"transfer-encoding").lower():
+            self.m_chunked = True
+            self.m_remaining = 0
+        elif self.get_field(b"content-length"):
+            length = self.get_field(b"content-length")
+
+            try:
+                self.m_remaining = int(length)
+                if self.m_remaining < 0:
+                    raise ValueError()
+            except (OverflowError, ValueError):
+                self.m_status = sf.http.response.InvalidResponse
+                self.close()
+                raise IOError("Invalid Content-Length in the response: {0!r}".format(length))
+        else:
+            # the body ends when the server closes the connection
+            self.m_remaining = -1
+
+        self.m_eof = self.m_remaining == 0 and not self.m_chunked
+
+    cdef _next_chunk(self):
+        cdef bytes line
+
+        if self.m_chunkStarted:
+            # the CRLF closing the previous chunk's data
+            self._read_line()
+
+        self.m_chunkStarted = True
+
+        line = self._read_line()
+
+        if line is None:
+            raise IOError("Connection closed in the middle of a chunked response")
+
+        self.m_remaining = int(line.split(b";")[0].strip(), 16)
+
+        if self.m_remaining == 0:
+            # skip the trailer fields
+            while self._read_line():
+                pass
+
+            self.m_eof = True
+
+    cdef bytes _read_raw(self, Py_ssize_t size):
+        cdef Py_ssize_t n
+        cdef bytes data
+
+        if self.m_chunked and self.m_remaining == 0 and not self.m_eof:
+            self._next_chunk()
+
+        if self.m_eof:
+            return b""
+
+        if not self.m_buffer and not self._fill():
+            self.m_eof = True
+
+            if self.m_remaining > 0 or self.m_chunked:
+                raise IOError("Connection closed before the end of the response body")
+
+            return b""
+
+        n = min(size, len(self.m_buffer))
+
+        if self.m_remaining >= 0:
+            n = min(n, self.m_remaining)
+            self.m_remaining -= n
+
+        data = bytes(self.m_buffer[:n])
+        del self.m_buffer[:n]
+
+        if self.m_remaining == 0 and not self.m_chunked:
+            self.m_eof = True
+
+        return data
+
+    cdef bytes _read(self, Py_ssize_t size):
+        cdef bytes data
+
+        # zlib takes a max_length of 0 as unlimited
+        if size <= 0:
+            return b""
+
+        if self.m_decompressor is None:
+            return self._read_raw(size)
+
+        while True:
+            if self.m_tail:
+                data = self.m_tail
+            else:
+                data = self._read_raw(len(self.m_chunk))
+
+            if not data:
+                if self.m_flushed:
+                    return b""
+
+                # all the input was consumed under the limit, what is
+                # left is at most the zlib window
+                self.m_flushed = True
+                return self.m_decompressor.flush()
+
+            # limiting the output keeps memory bounded, even for highly
+            # compressed bodies
+            data = self.m_decompressor.decompress(data, size)
+            self.m_tail = self.m_decompressor.unconsumed_tail
+
+            if data:
+                return data
+
+
+cdef tuple split_http_host(bytes host, unsigned short port):
+    # the same host parsing as sf::Http::setHost()
+    if host.lower().startswith(b"http://"):
+        host = host[7:]
+    elif host.lower().startswith(b"https://"):
+        host = host[8:]
+        port = port or 443
+
+    if host.endswith(b"/"):
+        host = host[:-1]
+
+    return host, port or 80
+
+
+cdef HttpResponseStream open_http_stream(bytes host, unsigned short port, HttpRequest request, Time timeout, bint decompress, size_t chunk_size):
+    cdef HttpResponseStream r = HttpResponseStream.__new__(HttpResponseStream)
+    cdef sf.IpAddress address = sf.IpAddress(string(host))
+    cdef sf.socket.Status status
+
+    r.m_socket = TcpSocket()
+    r.m_buffer = bytearray()
+    r.m_chunk = bytearray(chunk_size)
+    r.m_fields = {}
+
+    if not timeout:
+        with nogil: status = r.m_socket.p_this.connect(address, port)
+    else:
+        with nogil: status = r.m_socket.p_this.connect(address, port, timeout.p_this[0])
+
+    if status is not sf.socket.Done:
+        r.m_status = sf.http.response.ConnectionFailed
+        r.m_socket = None
+        r.m_eof = True
+        return r
+
+    r.m_socket.send(request._prepare(host, decompress))
+    r._read_header(request.m_method == sf.http.request.Head)
+
+    if decompress and r.get_field(b"content-encoding").lower() in (b"gzip", b"x-gzip", b"deflate"):
+        import zlib
+
+        # accept both the gzip and zlib wrappers
+        r.m_decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+
+    return r
+
+
 cdef class Http:
     cdef sf.Http *p_this
+    cdef bytes m_host
+    cdef unsigned short m_port
 
     def __init__(self, bytes host, unsigned short port=0):
         self.p_this = new sf.Http(string(host), port)
+        self.m_host, self.m_port = split_http_host(host, port)
 
     def __dealloc__(self):
         del self.p_this
@@ -773,8 +1777,13 @@ cdef class Http:
     def __repr__(self):
         return "Http()"
 
-    def send_request(self, HttpRequest request, Time timeout=None):
-        cdef sf.http.Response* p = new sf.http.Response()
+    def send_request(self, HttpRequest request, Time timeout=None, bint stream=False, bint decompress=False, size_t chunk_size=65536):
+        cdef sf.http.Response* p
+
+        if stream:
+            return open_http_stream(self.m_host, self.m_port, request, timeout, decompress, chunk_size)
+
+        p = new sf.http.Response()
 
         if not timeout:
             with nogil: p[0] = self.p_this.sendRequest(request.p_this[0])
@@ -782,3 +1791,58 @@ cdef class Http:
             with nogil: p[0] = self.p_this.sendRequest(request.p_this[0], timeout.p_this[0])
 
         return wrap_httpresponse(p)
+
+
+class HttpPool(object):
+    def __init__(self, max_workers=8, Time timeout=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.executor = ThreadPoolExecutor(max_workers)
+        self.timeout = timeout
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "HttpPool(hosts={0})".format(len(self._connections))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _acquire(self, host, port):
+        with self._lock:
+            connections = self._connections.get((host, port))
+
+            if connections:
+                return connections.pop()
+
+        return Http(host, port)
+
+    def _release(self, host, port, http):
+        with self._lock:
+            self._connections.setdefault((host, port), []).append(http)
+
+    def _send(self, host, port, request):
+        http = self._acquire(host, port)
+
+        try:
+            return http.send_request(request, self.timeout)
+        finally:
+            self._release(host, port, http)
+
+    def submit(self, bytes host, HttpRequest request, unsigned short port=0):
+        return self.executor.submit(self._send, host, port, request)
+
+    def get(self, bytes host, bytes uri, unsigned short port=0):
+        return self.submit(host, HttpRequest(uri), port)
+
+    def map(self, bytes host, requests, unsigned short port=0):
+        return [self.submit(host, request, port) for request in requests]
+
+    def close(self, wait=True):
+        self.executor.shutdown(wait)
+
+        with self._lock:
+            self._connections.clear()
@@ -8,9 +8,36 @@
 
 #include <pysfml/system/error.hpp>
 #include <SFML/System.hpp>
-#include <sstream>
+#include <streambuf>
+#include <string>
 
-static std::stringbuf buffer;
+namespace
+{
+    // Errors are collected per thread, so loads running without the GIL
+    // on several threads neither share a buffer nor read each other's
+    // messages.
+    thread_local std::string threadErrors;
+
+    class ErrorBuffer : public std::streambuf
+    {
+    protected:
+        virtual int_type overflow(int_type character)
+        {
+            if (!traits_type::eq_int_type(character, traits_type::eof()))
+                threadErrors += traits_type::to_char_type(character);
+
+            return traits_type::not_eof(character);
+        }
+
+        virtual std::streamsize xsputn(const char* characters, std::streamsize count)
+        {
+            threadErrors.append(characters, static_cast<std::size_t>(count));
+            return count;
+        }
+    };
+
+    ErrorBuffer buffer;
+}
 
 // Insert our own buffer to retrieve and forward errors to Python
 // exceptions. This function allows to restore the Python buffer in case people
@@ -20,17 +47,18 @@ void restorePythonErrorBuffer()
     sf::err().rdbuf(&buffer);
 }
 
-// Return the last error (if any) then clear the buffer to welcome the next one.
+// Return the last error of the calling thread (if any) then clear its
+// buffer to welcome the next one.
 PyObject* getLastErrorMessage()
 {
     // Get the error message then clean the buffer
 #if PY_MAJOR_VERSION >= 3
-    PyObject* error = PyBytes_FromString(buffer.str().c_str());
+    PyObject* error = PyBytes_FromStringAndSize(threadErrors.data(), threadErrors.size());
 #else
-    PyObject* error = PyString_FromString(buffer.str().c_str());
+    PyObject* error = PyString_FromStringAndSize(threadErrors.data(), threadErrors.size());
 #endif
 
-    buffer.str("");
+    threadErrors.clear();
 
     return error;
 }
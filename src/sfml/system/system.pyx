@@ -32,8 +32,10 @@ cdef extern from "pysfml/system/hacks.hpp":
     void Time_idiv_int(sf.Time&, Int64)
     void Time_idiv_float(sf.Time&, float)
 
+import numbers
+
 __all__ = ['Time', 'sleep', 'Clock', 'seconds', 'milliseconds', 'microseconds',
-            'Vector2', 'Vector3']
+            'Vector2', 'Vector3', 'Vector2f', 'Vector2i', 'Vector3f']
 
 # expose a function to restore the error handler
 cdef api void restoreErrorHandler():
@@ -88,6 +90,13 @@ cdef api object wrap_string(const sf.String* p):
 
     return bytes_string.decode('UTF-32')
 
+cdef bint is_vector2(object other):
+    # what the 2D vectors compare with, anything else is left to Python
+    if isinstance(other, (Vector2, Vector2f, Vector2i)):
+        return True
+
+    return isinstance(other, (tuple, list)) and len(other) == 2
+
 cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
     cdef sf.Vector2[NumericObject] *p_this
 
@@ -110,6 +119,9 @@ cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
     def __richcmp__(Vector2 self, other_, op):
         cdef Vector2 other
 
+        if op not in (2, 3) or not is_vector2(other_):
+            return NotImplemented
+
         if isinstance(other_, Vector2):
             other = <Vector2>other_
         else:
@@ -118,10 +130,8 @@ cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
 
         if op == 2:
             return self.p_this[0] == other.p_this[0]
-        elif op == 3:
-            return self.p_this[0] != other.p_this[0]
         else:
-            raise NotImplemented
+            return self.p_this[0] != other.p_this[0]
 
     def __iter__(self):
         return iter((self.x, self.y))
@@ -148,9 +158,17 @@ cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
 
         return wrap_vector2(p)
 
-    def __mul__(Vector2 self, other):
-        cdef sf.Vector2[NumericObject] *p = new sf.Vector2[NumericObject]()
-        p[0] = self.p_this[0] * NumericObject(other)
+    def __mul__(x, y):
+        cdef sf.Vector2[NumericObject] *p
+
+        if not isinstance(x, Vector2):
+            x, y = y, x
+
+        if not isinstance(y, numbers.Number):
+            return NotImplemented
+
+        p = new sf.Vector2[NumericObject]()
+        p[0] = (<Vector2>x).p_this[0] * NumericObject(y)
 
         return wrap_vector2(p)
 
@@ -178,6 +196,9 @@ cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
         return self
 
     def __imul__(self, other):
+        if not isinstance(other, numbers.Number):
+            return NotImplemented
+
         self.p_this[0] *= NumericObject(other)
 
         return self
@@ -237,6 +258,13 @@ cdef api object wrap_vector2f(sf.Vector2f p):
     return r
 
 cdef api sf.Vector2i to_vector2i(vector):
+    if isinstance(vector, Vector2i):
+        return (<Vector2i>vector).m_this
+    elif isinstance(vector, Vector2f):
+        return sf.Vector2i(<int>(<Vector2f>vector).m_this.x, <int>(<Vector2f>vector).m_this.y)
+    elif isinstance(vector, Vector2):
+        return sf.Vector2i((<Vector2>vector).p_this.x.get(), (<Vector2>vector).p_this.y.get())
+
     x, y = vector
     return sf.Vector2i(x, y)
 
@@ -245,9 +273,213 @@ cdef api sf.Vector2u to_vector2u(vector):
     return sf.Vector2u(x, y)
 
 cdef api sf.Vector2f to_vector2f(vector):
+    if isinstance(vector, Vector2f):
+        return (<Vector2f>vector).m_this
+    elif isinstance(vector, Vector2i):
+        return sf.Vector2f((<Vector2i>vector).m_this.x, (<Vector2i>vector).m_this.y)
+    elif isinstance(vector, Vector2):
+        return sf.Vector2f((<Vector2>vector).p_this.x.get(), (<Vector2>vector).p_this.y.get())
+
     x, y = vector
     return sf.Vector2f(x, y)
 
+cdef public class Vector2f[type PyVector2fType, object PyVector2fObject]:
+    cdef sf.Vector2f m_this
+
+    def __init__(self, float x=0, float y=0):
+        self.m_this.x = x
+        self.m_this.y = y
+
+    def __repr__(self):
+        return "Vector2f(x={0}, y={1})".format(self.x, self.y)
+
+    def __str__(self):
+        return "({0}, {1})".format(self.x, self.y)
+
+    def __richcmp__(Vector2f self, other, op):
+        if op not in (2, 3) or not is_vector2(other):
+            return NotImplemented
+
+        if op == 2:
+            return self.m_this == to_vector2f(other)
+        else:
+            return self.m_this != to_vector2f(other)
+
+    def __iter__(self):
+        return iter((self.m_this.x, self.m_this.y))
+
+    def __add__(x, y):
+        return make_vector2f(to_vector2f(x) + to_vector2f(y))
+
+    def __sub__(x, y):
+        return make_vector2f(to_vector2f(x) - to_vector2f(y))
+
+    def __mul__(x, y):
+        if not isinstance(x, Vector2f):
+            x, y = y, x
+
+        if not isinstance(y, numbers.Real):
+            return NotImplemented
+
+        return make_vector2f((<Vector2f>x).m_this * <float>y)
+
+    def __truediv__(Vector2f self, float other):
+        return make_vector2f(sf.Vector2f(self.m_this.x / other, self.m_this.y / other))
+
+    def __iadd__(Vector2f self, other):
+        self.m_this = self.m_this + to_vector2f(other)
+        return self
+
+    def __isub__(Vector2f self, other):
+        self.m_this = self.m_this - to_vector2f(other)
+        return self
+
+    def __imul__(Vector2f self, other):
+        if not isinstance(other, numbers.Real):
+            return NotImplemented
+
+        self.m_this = self.m_this * <float>other
+        return self
+
+    def __itruediv__(Vector2f self, float other):
+        self.m_this.x /= other
+        self.m_this.y /= other
+        return self
+
+    def __neg__(self):
+        return make_vector2f(-self.m_this)
+
+    def __copy__(self):
+        return make_vector2f(self.m_this)
+
+    property x:
+        def __get__(self):
+            return self.m_this.x
+
+        def __set__(self, float x):
+            self.m_this.x = x
+
+    property y:
+        def __get__(self):
+            return self.m_this.y
+
+        def __set__(self, float y):
+            self.m_this.y = y
+
+cdef api Vector2f make_vector2f(sf.Vector2f v):
+    cdef Vector2f r = Vector2f.__new__(Vector2f)
+    r.m_this = v
+    return r
+
+cdef public class Vector2i[type PyVector2iType, object PyVector2iObject]:
+    cdef sf.Vector2i m_this
+
+    def __init__(self, int x=0, int y=0):
+        self.m_this.x = x
+        self.m_this.y = y
+
+    def __repr__(self):
+        return "Vector2i(x={0}, y={1})".format(self.x, self.y)
+
+    def __str__(self):
+        return "({0}, {1})".format(self.x, self.y)
+
+    def __richcmp__(Vector2i self, other, op):
+        if op not in (2, 3) or not is_vector2(other):
+            return NotImplemented
+
+        # compared as floats unless both sides are integers, so that
+        # (1, 2) differs from (1.5, 2)
+        if isinstance(other, Vector2i) or all(isinstance(value, numbers.Integral) for value in other):
+            equal = self.m_this == to_vector2i(other)
+        else:
+            equal = to_vector2f(self) == to_vector2f(other)
+
+        return equal if op == 2 else not equal
+
+    def __iter__(self):
+        return iter((self.m_this.x, self.m_this.y))
+
+    def __add__(x, y):
+        if isinstance(x, Vector2f) or isinstance(y, Vector2f):
+            return make_vector2f(to_vector2f(x) + to_vector2f(y))
+
+        return make_vector2i(to_vector2i(x) + to_vector2i(y))
+
+    def __sub__(x, y):
+        if isinstance(x, Vector2f) or isinstance(y, Vector2f):
+            return make_vector2f(to_vector2f(x) - to_vector2f(y))
+
+        return make_vector2i(to_vector2i(x) - to_vector2i(y))
+
+    def __mul__(x, y):
+        if not isinstance(x, Vector2i):
+            x, y = y, x
+
+        # any integer keeps the vector integral, any other real number
+        # (including NumPy's float32) makes it a Vector2f
+        if isinstance(y, numbers.Integral):
+            return make_vector2i((<Vector2i>x).m_this * <int>y)
+        elif isinstance(y, numbers.Real):
+            return make_vector2f(to_vector2f(x) * <float>y)
+
+        return NotImplemented
+
+    # true division of integers gives floats, as with the generic Vector2
+    def __truediv__(Vector2i self, float other):
+        return make_vector2f(sf.Vector2f(self.m_this.x / other, self.m_this.y / other))
+
+    def __iadd__(Vector2i self, other):
+        if isinstance(other, Vector2f):
+            return make_vector2f(to_vector2f(self) + (<Vector2f>other).m_this)
+
+        self.m_this = self.m_this + to_vector2i(other)
+        return self
+
+    def __isub__(Vector2i self, other):
+        if isinstance(other, Vector2f):
+            return make_vector2f(to_vector2f(self) - (<Vector2f>other).m_this)
+
+        self.m_this = self.m_this - to_vector2i(other)
+        return self
+
+    def __imul__(Vector2i self, other):
+        if isinstance(other, numbers.Integral):
+            self.m_this = self.m_this * <int>other
+            return self
+        elif isinstance(other, numbers.Real):
+            return make_vector2f(to_vector2f(self) * <float>other)
+
+        return NotImplemented
+
+    def __itruediv__(Vector2i self, float other):
+        return make_vector2f(sf.Vector2f(self.m_this.x / other, self.m_this.y / other))
+
+    def __neg__(self):
+        return make_vector2i(-self.m_this)
+
+    def __copy__(self):
+        return make_vector2i(self.m_this)
+
+    property x:
+        def __get__(self):
+            return self.m_this.x
+
+        def __set__(self, int x):
+            self.m_this.x = x
+
+    property y:
+        def __get__(self):
+            return self.m_this.y
+
+        def __set__(self, int y):
+            self.m_this.y = y
+
+cdef api Vector2i make_vector2i(sf.Vector2i v):
+    cdef Vector2i r = Vector2i.__new__(Vector2i)
+    r.m_this = v
+    return r
+
 cdef public class Vector3[type PyVector3Type, object PyVector3Object]:
     cdef sf.Vector3[NumericObject] *p_this
 
@@ -339,6 +571,9 @@ cdef public class Vector3[type PyVector3Type, object PyVector3Object]:
         return self
 
     def __imul__(self, other):
+        if not isinstance(other, numbers.Number):
+            return NotImplemented
+
         self.p_this[0] *= NumericObject(other)
 
         return self
@@ -406,9 +641,118 @@ cdef api sf.Vector3i to_vector3i(vector):
     return sf.Vector3i(x, y, z)
 
 cdef api sf.Vector3f to_vector3f(vector):
+    if isinstance(vector, Vector3f):
+        return (<Vector3f>vector).m_this
+    elif isinstance(vector, Vector3):
+        return sf.Vector3f((<Vector3>vector).p_this.x.get(), (<Vector3>vector).p_this.y.get(), (<Vector3>vector).p_this.z.get())
+
     x, y, z = vector
     return sf.Vector3f(x, y, z)
 
+cdef bint is_vector3(object other):
+    # what the 3D vectors compare with, anything else is left to Python
+    if isinstance(other, (Vector3, Vector3f)):
+        return True
+
+    return isinstance(other, (tuple, list)) and len(other) == 3
+
+cdef public class Vector3f[type PyVector3fType, object PyVector3fObject]:
+    cdef sf.Vector3f m_this
+
+    def __init__(self, float x=0, float y=0, float z=0):
+        self.m_this.x = x
+        self.m_this.y = y
+        self.m_this.z = z
+
+    def __repr__(self):
+        return "Vector3f(x={0}, y={1}, z={2})".format(self.x, self.y, self.z)
+
+    def __str__(self):
+        return "({0}, {1}, {2})".format(self.x, self.y, self.z)
+
+    def __richcmp__(Vector3f self, other, op):
+        if op not in (2, 3) or not is_vector3(other):
+            return NotImplemented
+
+        if op == 2:
+            return self.m_this == to_vector3f(other)
+        else:
+            return self.m_this != to_vector3f(other)
+
+    def __iter__(self):
+        return iter((self.m_this.x, self.m_this.y, self.m_this.z))
+
+    def __add__(x, y):
+        return make_vector3f(to_vector3f(x) + to_vector3f(y))
+
+    def __sub__(x, y):
+        return make_vector3f(to_vector3f(x) - to_vector3f(y))
+
+    def __mul__(x, y):
+        if not isinstance(x, Vector3f):
+            x, y = y, x
+
+        if not isinstance(y, numbers.Real):
+            return NotImplemented
+
+        return make_vector3f((<Vector3f>x).m_this * <float>y)
+
+    def __truediv__(Vector3f self, float other):
+        return make_vector3f(sf.Vector3f(self.m_this.x / other, self.m_this.y / other, self.m_this.z / other))
+
+    def __iadd__(Vector3f self, other):
+        self.m_this = self.m_this + to_vector3f(other)
+        return self
+
+    def __isub__(Vector3f self, other):
+        self.m_this = self.m_this - to_vector3f(other)
+        return self
+
+    def __imul__(Vector3f self, other):
+        if not isinstance(other, numbers.Real):
+            return NotImplemented
+
+        self.m_this = self.m_this * <float>other
+        return self
+
+    def __itruediv__(Vector3f self, float other):
+        self.m_this.x /= other
+        self.m_this.y /= other
+        self.m_this.z /= other
+        return self
+
+    def __neg__(self):
+        return make_vector3f(-self.m_this)
+
+    def __copy__(self):
+        return make_vector3f(self.m_this)
+
+    property x:
+        def __get__(self):
+            return self.m_this.x
+
+        def __set__(self, float x):
+            self.m_this.x = x
+
+    property y:
+        def __get__(self):
+            return self.m_this.y
+
+        def __set__(self, float y):
+            self.m_this.y = y
+
+    property z:
+        def __get__(self):
+            return self.m_this.z
+
+        def __set__(self, float z):
+            self.m_this.z = z
+
+cdef api Vector3f make_vector3f(sf.Vector3f v):
+    cdef Vector3f r = Vector3f.__new__(Vector3f)
+    r.m_this = v
+    return r
+
 cdef public class Time[type PyTimeType, object PyTimeObject]:
     ZERO = wrap_time(<sf.Time*>&sf.time.Zero)
 
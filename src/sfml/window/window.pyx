@@ -35,7 +35,7 @@ __all__ = ['Style', 'VideoMode', 'ContextSettings', 'SizeEvent',
             'KeyEvent', 'TextEvent', 'MouseMoveEvent', 'MouseButtonEvent',
             'MouseWheelEvent', 'MouseWheelScrollEvent', 'JoystickMoveEvent',
             'JoystickButtonEvent', 'JoystickConnectEvent', 'TouchEvent',
-            'SensorEvent', 'Event', 'Window', 'Keyboard', 'Joystick',
+            'SensorEvent', 'Event', 'EventBuffer', 'Window', 'Keyboard', 'Joystick',
             'Mouse', 'Touch', 'Sensor', 'Context']
 
 if PY_VERSION_HEX >= 0x03000000:
@@ -53,6 +53,7 @@ class Style(IntEnum):
 cdef class SizeEvent:
     cdef sf.SizeEvent* p_this
     cdef bint          p_owned
+    cdef object        m_owner
 
     def __init__(self):
         self.p_this = new sf.SizeEvent()
@@ -83,6 +84,7 @@ cdef class SizeEvent:
 cdef class KeyEvent:
     cdef sf.KeyEvent* p_this
     cdef bint         p_owned
+    cdef object       m_owner
 
     def __init__(self):
         self.p_this = new sf.KeyEvent()
@@ -135,6 +137,7 @@ cdef class KeyEvent:
 cdef class TextEvent:
     cdef sf.TextEvent* p_this
     cdef bint          p_owned
+    cdef object        m_owner
 
     def __init__(self):
         self.p_this = new sf.TextEvent()
@@ -158,6 +161,7 @@ cdef class TextEvent:
 cdef class MouseMoveEvent:
     cdef sf.MouseMoveEvent* p_this
     cdef bint               p_owned
+    cdef object             m_owner
 
     def __init__(self):
         self.p_this = new sf.MouseMoveEvent()
@@ -188,6 +192,7 @@ cdef class MouseMoveEvent:
 cdef class MouseButtonEvent:
     cdef sf.MouseButtonEvent* p_this
     cdef bint                 p_owned
+    cdef object               m_owner
 
     def __init__(self):
         self.p_this = new sf.MouseButtonEvent()
@@ -226,6 +231,7 @@ cdef class MouseButtonEvent:
 cdef class MouseWheelEvent:
     cdef sf.MouseWheelEvent* p_this
     cdef bint                p_owned
+    cdef object              m_owner
 
     def __init__(self):
         self.p_this = new sf.MouseWheelEvent()
@@ -264,6 +270,7 @@ cdef class MouseWheelEvent:
 cdef class MouseWheelScrollEvent:
     cdef sf.MouseWheelScrollEvent* p_this
     cdef bint                      p_owned
+    cdef object                    m_owner
 
     def __init__(self):
         self.p_this = new sf.MouseWheelScrollEvent()
@@ -309,6 +316,7 @@ cdef class MouseWheelScrollEvent:
 cdef class JoystickMoveEvent:
     cdef sf.JoystickMoveEvent* p_this
     cdef bint                  p_owned
+    cdef object                m_owner
 
     def __init__(self):
         self.p_this = new sf.JoystickMoveEvent()
@@ -347,6 +355,7 @@ cdef class JoystickMoveEvent:
 cdef class JoystickButtonEvent:
     cdef sf.JoystickButtonEvent* p_this
     cdef bint                    p_owned
+    cdef object                  m_owner
 
     def __init__(self):
         self.p_this = new sf.JoystickButtonEvent()
@@ -378,6 +387,7 @@ cdef class JoystickButtonEvent:
 cdef class JoystickConnectEvent:
     cdef sf.JoystickConnectEvent* p_this
     cdef bint                     p_owned
+    cdef object                   m_owner
 
     def __init__(self):
         self.p_this = new sf.JoystickConnectEvent()
@@ -401,6 +411,7 @@ cdef class JoystickConnectEvent:
 cdef class TouchEvent:
     cdef sf.TouchEvent* p_this
     cdef bint           p_owned
+    cdef object         m_owner
 
     def __init__(self):
         self.p_this = new sf.TouchEvent()
@@ -439,6 +450,7 @@ cdef class TouchEvent:
 cdef class SensorEvent:
     cdef sf.SensorEvent* p_this
     cdef bint            p_owned
+    cdef object          m_owner
 
     def __init__(self):
         self.p_this = new sf.SensorEvent()
@@ -533,7 +545,8 @@ class EventType(IntEnum):
 
 cdef public class Event[type PyEventType, object PyEventObject]:
     cdef sf.Event *p_this
-    cdef object data
+    cdef bint delete_this
+    cdef object m_owner
 
     CLOSED = EventType.CLOSED
     RESIZED = EventType.RESIZED
@@ -562,16 +575,23 @@ cdef public class Event[type PyEventType, object PyEventObject]:
 
     def __init__(self, type=EventType.CLOSED):
         self.p_this = new sf.Event()
+        self.delete_this = True
         self.type = type
 
     def __dealloc__(self):
-        del self.p_this
+        if self.delete_this:
+            del self.p_this
 
     def __repr__(self):
         return "Event(type={0}, data={1})".format(self.type, self.items())
 
     def __contains__(self, item):
-        return self.data.__contains__(item)
+        data = self._data()
+
+        if not data:
+            return False
+
+        return data.__contains__(item)
 
     def __richcmp__(self, other, int op):
         if op == 2:
@@ -582,16 +602,20 @@ cdef public class Event[type PyEventType, object PyEventObject]:
             return NotImplemented
 
     def __getitem__(self, name):
-        if not self.data:
+        data = self._data()
+
+        if not data:
             raise KeyError("Event has no data")
 
-        return self.data[name]
+        return data[name]
 
     def __setitem__(self, name, value):
-        if not self.data:
+        data = self._data()
+
+        if not data:
             raise KeyError("Event has no data")
 
-        self.data[name] = value
+        data[name] = value
 
     property type:
         def __get__(self):
@@ -600,92 +624,243 @@ cdef public class Event[type PyEventType, object PyEventObject]:
         def __set__(self, sf.event.EventType type):
             self.p_this.type = type
 
-            if type == self.RESIZED:
-                event = SizeEvent.__new__(SizeEvent)
-                (<SizeEvent>event).p_this = &self.p_this.size
-                (<SizeEvent>event).p_owned = False
-                self.data = EventData(event,  ['width', 'height'])
-            elif type == self.KEY_PRESSED or type == self.KEY_RELEASED:
-                event = KeyEvent.__new__(KeyEvent)
-                (<KeyEvent>event).p_this = &self.p_this.key
-                self.data = EventData(event,  ['code', 'alt', 'control', 'shift', 'system'])
-            elif type == self.TEXT_ENTERED:
-                event = TextEvent.__new__(TextEvent)
-                (<TextEvent>event).p_this = &self.p_this.text
-                self.data = EventData(event,  ['unicode'])
-            elif type == self.MOUSE_MOVED:
-                event = MouseMoveEvent.__new__(MouseMoveEvent)
-                (<MouseMoveEvent>event).p_this = &self.p_this.mouseMove
-                self.data = EventData(event,  ['x', 'y'])
-            elif type == self.MOUSE_BUTTON_PRESSED or type == self.MOUSE_BUTTON_RELEASED:
-                event = MouseButtonEvent.__new__(MouseButtonEvent)
-                (<MouseButtonEvent>event).p_this = &self.p_this.mouseButton
-                self.data = EventData(event,  ['button', 'x', 'y'])
-            elif type == self.MOUSE_WHEEL_MOVED:
-                event = MouseWheelEvent.__new__(MouseWheelEvent)
-                (<MouseWheelEvent>event).p_this = &self.p_this.mouseWheel
-                self.data = EventData(event,  ['delta', 'x', 'y'])
-            elif type == self.MOUSE_WHEEL_SCROLLED:
-                event = MouseWheelScrollEvent.__new__(MouseWheelScrollEvent)
-                (<MouseWheelScrollEvent>event).p_this = &self.p_this.mouseWheelScroll
-                self.data = EventData(event,  ['wheel', 'delta', 'x', 'y'])
-            elif type == self.JOYSTICK_MOVED:
-                event = JoystickMoveEvent.__new__(JoystickMoveEvent)
-                (<JoystickMoveEvent>event).p_this = &self.p_this.joystickMove
-                self.data = EventData(event,  ['joystick_id', 'axis', 'position'])
-            elif type == self.JOYSTICK_BUTTON_PRESSED or type == self.JOYSTICK_BUTTON_RELEASED:
-                event = JoystickButtonEvent.__new__(JoystickButtonEvent)
-                (<JoystickButtonEvent>event).p_this = &self.p_this.joystickButton
-                self.data = EventData(event,  ['joystick_id', 'button'])
-            elif type == self.JOYSTICK_CONNECTED or type == self.JOYSTICK_DISCONNECTED:
-                event = JoystickConnectEvent.__new__(JoystickConnectEvent)
-                (<JoystickConnectEvent>event).p_this = &self.p_this.joystickConnect
-                self.data = EventData(event,  ['joystick_id'])
-            elif type == self.TOUCH_BEGAN or type == self.TOUCH_MOVED or type == self.TOUCH_ENDED:
-                event = TouchEvent.__new__(TouchEvent)
-                (<TouchEvent>event).p_this = &self.p_this.touch
-                self.data = EventData(event,  ['finger', 'x', 'y'])
-            elif type == self.SENSOR_CHANGED:
-                event = SensorEvent.__new__(SensorEvent)
-                (<SensorEvent>event).p_this = &self.p_this.sensor
-                self.data = EventData(event,  ['type', 'x', 'y', 'z'])
-            else:
-                self.data = None
+    property size:
+        def __get__(self):
+            cdef SizeEvent event
+
+            # not cached, the sub-event keeps its owner alive and a cached
+            # one would make a reference cycle of every polled event
+            event = SizeEvent.__new__(SizeEvent)
+            event.p_this = &self.p_this.size
+            event.m_owner = self
+            return event
+
+    property key:
+        def __get__(self):
+            cdef KeyEvent event
+
+            event = KeyEvent.__new__(KeyEvent)
+            event.p_this = &self.p_this.key
+            event.m_owner = self
+            return event
+
+    property text:
+        def __get__(self):
+            cdef TextEvent event
+
+            event = TextEvent.__new__(TextEvent)
+            event.p_this = &self.p_this.text
+            event.m_owner = self
+            return event
+
+    property mouse_move:
+        def __get__(self):
+            cdef MouseMoveEvent event
+
+            event = MouseMoveEvent.__new__(MouseMoveEvent)
+            event.p_this = &self.p_this.mouseMove
+            event.m_owner = self
+            return event
+
+    property mouse_button:
+        def __get__(self):
+            cdef MouseButtonEvent event
+
+            event = MouseButtonEvent.__new__(MouseButtonEvent)
+            event.p_this = &self.p_this.mouseButton
+            event.m_owner = self
+            return event
+
+    property mouse_wheel:
+        def __get__(self):
+            cdef MouseWheelEvent event
+
+            event = MouseWheelEvent.__new__(MouseWheelEvent)
+            event.p_this = &self.p_this.mouseWheel
+            event.m_owner = self
+            return event
+
+    property mouse_wheel_scroll:
+        def __get__(self):
+            cdef MouseWheelScrollEvent event
+
+            event = MouseWheelScrollEvent.__new__(MouseWheelScrollEvent)
+            event.p_this = &self.p_this.mouseWheelScroll
+            event.m_owner = self
+            return event
+
+    property joystick_move:
+        def __get__(self):
+            cdef JoystickMoveEvent event
+
+            event = JoystickMoveEvent.__new__(JoystickMoveEvent)
+            event.p_this = &self.p_this.joystickMove
+            event.m_owner = self
+            return event
+
+    property joystick_button:
+        def __get__(self):
+            cdef JoystickButtonEvent event
+
+            event = JoystickButtonEvent.__new__(JoystickButtonEvent)
+            event.p_this = &self.p_this.joystickButton
+            event.m_owner = self
+            return event
+
+    property joystick_connect:
+        def __get__(self):
+            cdef JoystickConnectEvent event
+
+            event = JoystickConnectEvent.__new__(JoystickConnectEvent)
+            event.p_this = &self.p_this.joystickConnect
+            event.m_owner = self
+            return event
+
+    property touch:
+        def __get__(self):
+            cdef TouchEvent event
+
+            event = TouchEvent.__new__(TouchEvent)
+            event.p_this = &self.p_this.touch
+            event.m_owner = self
+            return event
+
+    property sensor:
+        def __get__(self):
+            cdef SensorEvent event
+
+            event = SensorEvent.__new__(SensorEvent)
+            event.p_this = &self.p_this.sensor
+            event.m_owner = self
+            return event
+
+    cdef object _data(self):
+        cdef sf.event.EventType type
+
+        type = self.p_this.type
+
+        if type == sf.event.Resized:
+            return EventData(self.size, ['width', 'height'])
+        elif type == sf.event.KeyPressed or type == sf.event.KeyReleased:
+            return EventData(self.key, ['code', 'alt', 'control', 'shift', 'system'])
+        elif type == sf.event.TextEntered:
+            return EventData(self.text, ['unicode'])
+        elif type == sf.event.MouseMoved:
+            return EventData(self.mouse_move, ['x', 'y'])
+        elif type == sf.event.MouseButtonPressed or type == sf.event.MouseButtonReleased:
+            return EventData(self.mouse_button, ['button', 'x', 'y'])
+        elif type == sf.event.MouseWheelMoved:
+            return EventData(self.mouse_wheel, ['delta', 'x', 'y'])
+        elif type == sf.event.MouseWheelScrolled:
+            return EventData(self.mouse_wheel_scroll, ['wheel', 'delta', 'x', 'y'])
+        elif type == sf.event.JoystickMoved:
+            return EventData(self.joystick_move, ['joystick_id', 'axis', 'position'])
+        elif type == sf.event.JoystickButtonPressed or type == sf.event.JoystickButtonReleased:
+            return EventData(self.joystick_button, ['joystick_id', 'button'])
+        elif type == sf.event.JoystickConnected or type == sf.event.JoystickDisconnected:
+            return EventData(self.joystick_connect, ['joystick_id'])
+        elif type == sf.event.TouchBegan or type == sf.event.TouchMoved or type == sf.event.TouchEnded:
+            return EventData(self.touch, ['finger', 'x', 'y'])
+        elif type == sf.event.SensorChanged:
+            return EventData(self.sensor, ['type', 'x', 'y', 'z'])
+        else:
+            return None
 
     def get(self, key, default=None):
-        if not self.data:
+        data = self._data()
+
+        if not data:
             return None
 
-        return self.data.get(key, default)
+        return data.get(key, default)
 
     def items(self):
-        if not self.data:
+        data = self._data()
+
+        if not data:
             return []
 
-        return self.data.items()
+        return data.items()
 
     def keys(self):
-        if not self.data:
+        data = self._data()
+
+        if not data:
             return []
 
-        return self.data.keys()
+        return data.keys()
 
     def values(self):
-        if not self.data:
+        data = self._data()
+
+        if not data:
             return []
 
-        return self.data.values()
+        return data.values()
 
 cdef api Event wrap_event(sf.Event *p):
     cdef Event event = Event.__new__(Event)
 
     event.p_this = p
-    event.data = None
-
-    event.type = p.type
+    event.delete_this = True
 
     return event
 
+cdef class EventBuffer:
+    cdef sf.Event *p_this
+    cdef size_t    m_capacity
+    cdef size_t    m_size
+
+    def __cinit__(self, size_t capacity=64):
+        self.p_this = <sf.Event*>malloc(capacity * sizeof(sf.Event))
+
+        if capacity and not self.p_this:
+            raise MemoryError
+
+        self.m_capacity = capacity
+        self.m_size = 0
+
+    def __dealloc__(self):
+        free(self.p_this)
+
+    def __repr__(self):
+        return "EventBuffer(size={0}, capacity={1})".format(self.m_size, self.m_capacity)
+
+    def __len__(self):
+        return self.m_size
+
+    def __getitem__(self, Py_ssize_t index):
+        cdef Event event
+
+        if index < 0:
+            index += <Py_ssize_t>self.m_size
+
+        if index < 0 or index >= <Py_ssize_t>self.m_size:
+            raise IndexError("event index out of range")
+
+        event = Event.__new__(Event)
+        event.p_this = &self.p_this[index]
+        event.delete_this = False
+        event.m_owner = self
+
+        return event
+
+    def __iter__(self):
+        cdef size_t i
+
+        for i in range(self.m_size):
+            yield self[i]
+
+    property capacity:
+        def __get__(self):
+            return self.m_capacity
+
+    property types:
+        def __get__(self):
+            cdef size_t i
+
+            return [self.p_this[i].type for i in range(self.m_size)]
+
 cdef public class VideoMode[type PyVideoModeType, object PyVideoModeObject]:
     cdef sf.VideoMode *p_this
     cdef bint delete_this
@@ -882,14 +1057,19 @@ cdef public class Window[type PyWindowType, object PyWindowObject]:
             return Window.events_generator(self)
 
     def events_generator(window):
-        cdef sf.Event  event
-        cdef sf.Event* p
+        cdef EventBuffer buffer = EventBuffer(16)
+
+        # events are polled straight into a shared buffer; a full buffer is
+        # replaced rather than reused so the events already yielded stay valid
+        while True:
+            if buffer.m_size == buffer.m_capacity:
+                buffer = EventBuffer(buffer.m_capacity)
 
-        while window.p_window.pollEvent(event):
-            p = new sf.Event()
-            p[0] = event
-            yield wrap_event(p)
+            if not window.p_window.pollEvent(buffer.p_this[buffer.m_size]):
+                return
 
+            buffer.m_size += 1
+            yield buffer[buffer.m_size - 1]
 
     def poll_event(self):
         cdef sf.Event *p = new sf.Event()
@@ -897,12 +1077,36 @@ cdef public class Window[type PyWindowType, object PyWindowObject]:
         if self.p_window.pollEvent(p[0]):
             return wrap_event(p)
 
+        del p
+
     def wait_event(self):
         cdef sf.Event *p = new sf.Event()
 
         if self.p_window.waitEvent(p[0]):
             return wrap_event(p)
 
+        del p
+
+    def poll_event_into(self, Event event not None):
+        if not self.p_window.pollEvent(event.p_this[0]):
+            return False
+
+        return True
+
+    def poll_events(self, size_t max_n=64, EventBuffer buffer=None):
+        cdef size_t i = 0
+
+        if buffer is None:
+            buffer = EventBuffer(max_n)
+        elif max_n > buffer.m_capacity:
+            max_n = buffer.m_capacity
+
+        while i < max_n and self.p_window.pollEvent(buffer.p_this[i]):
+            i += 1
+
+        buffer.m_size = i
+        return buffer
+
     property position:
         def __get__(self):
             return wrap_vector2i(self.p_window.getPosition())